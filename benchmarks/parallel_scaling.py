@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+import time
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.append(SOURCE_PATH)
+
+import numpy as np  # noqa: E402
+
+from engine import NumpyEngine, ParallelEngine, StepEngine  # noqa: E402
+from rule import Rule, Ruleset, RulesetFactory  # noqa: E402
+
+
+def measure(engine: StepEngine, generation: np.ndarray, ruleset: Ruleset, generations: int) -> float:
+    current: np.ndarray = engine.next_generation(generation, ruleset)
+    start: float = time.perf_counter()
+    for _ in range(generations):
+        current = engine.next_generation(current, ruleset)
+    return generations / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None):
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Parallel engine scaling benchmark')
+    parser.add_argument('-s', '--size', type=int, default=10_000, help='Board side length. Default: 10000.')
+    parser.add_argument('-g', '--generations', type=int, default=5, help='Generations timed per run. Default: 5.')
+    parser.add_argument('-w', '--max-workers', type=int, default=os.cpu_count(),
+                        help='Largest worker count to measure. Default: number of CPUs.')
+    args = parser.parse_args(argv)
+
+    ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+    generation: np.ndarray = (np.random.default_rng(0).random((args.size, args.size)) < 0.2).astype(np.uint8)
+
+    baseline: float = measure(NumpyEngine(), generation, ruleset, args.generations)
+    print(f'board {args.size}x{args.size}, {args.generations} generations per run')
+    print(f'{"engine":>12} {"gen/s":>10} {"speedup":>8}')
+    print(f'{"numpy":>12} {baseline:>10.2f} {1.0:>8.2f}')
+
+    for workers in range(1, args.max_workers + 1):
+        parallel_engine: ParallelEngine = ParallelEngine(workers)
+        generations_per_second: float = measure(parallel_engine, generation, ruleset, args.generations)
+        parallel_engine.close()
+        print(f'{f"parallel x{workers}":>12} {generations_per_second:>10.2f} '
+              f'{generations_per_second / baseline:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+PROJECT_PATH = os.path.dirname(SOURCE_PATH)
+sys.path.append(SOURCE_PATH)
+
+import numpy as np  # noqa: E402
+
+from board import Board  # noqa: E402
+from engine import Engine  # noqa: E402
+from gol import BoardFactory, BoardType  # noqa: E402
+from persistence import PatternCodec, PatternCodecFactory, PatternFormat  # noqa: E402
+from rule import Rule, Ruleset, RulesetFactory  # noqa: E402
+
+SEEDS: tuple[str, ...] = ('random', 'glider', 'decaying_angel')
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    metric: str
+    value: float
+    higher_is_better: bool
+
+
+class Seeds:
+    __patterns: dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def create(seed: str, size: int) -> np.ndarray:
+        if seed == 'random':
+            return (np.random.default_rng(0).random((size, size)) < 0.2).astype(np.uint8)
+
+        if seed not in Seeds.__patterns:
+            codec: PatternCodec = PatternCodecFactory.get_codec(PatternFormat.PYLIFE)
+            Seeds.__patterns[seed] = codec.load(os.path.join(PROJECT_PATH, 'saved', f'{seed}.pylife'))[0]
+        pattern: np.ndarray = Seeds.__patterns[seed][:size, :size]
+        generation: np.ndarray = np.zeros((size, size), dtype=np.uint8)
+        offset_x: int = (size - pattern.shape[0]) // 2
+        offset_y: int = (size - pattern.shape[1]) // 2
+        generation[offset_x:offset_x + pattern.shape[0], offset_y:offset_y + pattern.shape[1]] = pattern
+        return generation
+
+
+class Benchmarks:
+    def __init__(self, sizes: list[int], min_seconds: float, max_generations: int):
+        self.sizes: list[int] = sizes
+        self.min_seconds: float = min_seconds
+        self.max_generations: int = max_generations
+        self.results: list[BenchmarkResult] = []
+
+    def run_engines(self):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        variants: list[tuple[str, BoardType, Engine]] = [
+            ('loop', BoardType.DENSE, Engine.LOOP), ('numpy', BoardType.DENSE, Engine.NUMPY),
+            ('tiled', BoardType.DENSE, Engine.TILED), ('parallel', BoardType.DENSE, Engine.PARALLEL),
+            ('jit', BoardType.DENSE, Engine.JIT), ('packed', BoardType.PACKED, Engine.NUMPY),
+            ('sparse', BoardType.SPARSE, Engine.NUMPY),
+        ]
+        for size in self.sizes:
+            for seed in SEEDS:
+                for variant, board_type, engine in variants:
+                    if (variant == 'loop' and size > 100) or (variant == 'sparse' and seed == 'random' and size > 1000):
+                        continue
+                    board: Board = BoardFactory.create_board(board_type, size, size, ruleset, engine)
+                    board.set_current_generation(Seeds.create(seed, size))
+                    self.__measure_stepping(f'engine/{variant}/{size}/{seed}', board)
+                    if hasattr(getattr(board, 'engine', None), 'close'):
+                        board.engine.close()
+
+    def run_rules(self):
+        size: int = min(self.sizes[-1], 1000)
+        for rule in Rule:
+            if rule is Rule.CUSTOM:
+                continue
+            board: Board = Board(size, size, RulesetFactory.get_ruleset(rule))
+            board.set_current_generation(Seeds.create('random', size))
+            self.__measure_stepping(f'rule/{rule.name.lower()}/{size}/random', board)
+
+    def run_rendering(self, window: int = 1000):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        import pygame
+        from ui import PygameRenderer, RendererSettings, RenderMode
+
+        pygame.init()
+        screen: pygame.Surface = pygame.display.set_mode((window, window))
+        for size in [size for size in self.sizes if size <= window]:
+            cell_size: int = window // size
+            generation: np.ndarray = Seeds.create('random', size)
+            for render_mode in RenderMode:
+                settings: RendererSettings = RendererSettings(window, window, size, size, cell_size, cell_size,
+                                                              render_mode)
+                renderer: PygameRenderer = PygameRenderer(screen, settings, [])
+                seconds: float = self.__time(lambda: renderer.draw(generation), 60)
+                self.results.append(BenchmarkResult(f'render/{render_mode.name.lower()}/{size}', 'seconds_per_frame',
+                                                    seconds, False))
+        pygame.quit()
+
+    def run_persistence(self):
+        for size in self.sizes:
+            generation: np.ndarray = Seeds.create('random', size)
+            for pattern_format in PatternFormat:
+                if pattern_format is PatternFormat.RLE and size > 1000:
+                    continue
+                codec: PatternCodec = PatternCodecFactory.get_codec(pattern_format)
+                with tempfile.TemporaryDirectory() as directory:
+                    file_name: str = os.path.join(directory, f'pattern{pattern_format.value}')
+                    save_seconds: float = self.__time(lambda: codec.save(file_name, generation, 'B3/S23', 'pattern'), 1)
+                    load_seconds: float = self.__time(lambda: codec.load(file_name), 1)
+                name: str = f'persistence/{pattern_format.name.lower()}/{size}'
+                self.results.append(BenchmarkResult(name, 'save_cells_per_second', size * size / save_seconds, True))
+                self.results.append(BenchmarkResult(name, 'load_cells_per_second', size * size / load_seconds, True))
+
+    def __measure_stepping(self, name: str, board: Board):
+        board.next_generation()
+        seconds: float = self.__time(board.next_generation, self.max_generations)
+        tracemalloc.start()
+        board.next_generation()
+        peak_memory: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        cells: int = board.n_cells_x * board.n_cells_y
+        self.results.append(BenchmarkResult(name, 'generations_per_second', 1 / seconds, True))
+        self.results.append(BenchmarkResult(name, 'cells_per_second', cells / seconds, True))
+        self.results.append(BenchmarkResult(name, 'peak_memory_bytes', peak_memory, False))
+        print(f'{name:<45} {1 / seconds:>12.2f} gen/s {cells / seconds:>12.3e} cells/s {peak_memory:>12} B', flush=True)
+
+    def __time(self, action: Callable[[], object], max_repeats: int) -> float:
+        repeats: int = 0
+        start: float = time.perf_counter()
+        while repeats < max(1, max_repeats):
+            action()
+            repeats += 1
+            if time.perf_counter() - start >= self.min_seconds:
+                break
+        return (time.perf_counter() - start) / repeats
+
+
+class BaselineComparison:
+    @staticmethod
+    def compare(results: list[BenchmarkResult], baseline: list[BenchmarkResult], threshold: float) -> list[str]:
+        baseline_values: dict[tuple[str, str], BenchmarkResult] = {(result.name, result.metric): result
+                                                                   for result in baseline}
+        regressions: list[str] = []
+        for result in results:
+            reference: BenchmarkResult | None = baseline_values.get((result.name, result.metric))
+            if reference is None or reference.value == 0:
+                continue
+            change: float = (result.value - reference.value) / reference.value
+            if (-change if result.higher_is_better else change) > threshold:
+                regressions.append(f'{result.name} {result.metric}: {reference.value:.4g} -> {result.value:.4g} '
+                                   f'({change:+.1%})')
+        return regressions
+
+
+def load_results(file_name: str) -> list[BenchmarkResult]:
+    with open(file_name) as reader:
+        return [BenchmarkResult(**result) for result in json.load(reader)['results']]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Game Of Life benchmark suite')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100, 1000, 10_000],
+                        help='Board side lengths. Default: 100 1000 10000.')
+    parser.add_argument('-g', '--generations', type=int, default=50,
+                        help='Largest number of generations timed per case. Default: 50.')
+    parser.add_argument('-t', '--min-seconds', type=float, default=1.0,
+                        help='Stop timing a case once it ran this long. Default: 1.0.')
+    parser.add_argument('-c', '--cases', nargs='+', default=['engines', 'rules', 'rendering', 'persistence'],
+                        choices=['engines', 'rules', 'rendering', 'persistence'], help='Benchmark groups to run.')
+    parser.add_argument('-o', '--output', type=str, help='File the results are written to as JSON.')
+    parser.add_argument('-b', '--baseline', type=str, help='Results file to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative slowdown reported as a regression. Default: 0.2.')
+    args = parser.parse_args(argv)
+
+    benchmarks: Benchmarks = Benchmarks(sorted(args.sizes), args.min_seconds, args.generations)
+    for case in args.cases:
+        getattr(benchmarks, f'run_{case}')()
+
+    if args.output is not None:
+        with open(args.output, 'w') as writer:
+            json.dump({'metadata': {'python': platform.python_version(), 'numpy': np.__version__,
+                                    'machine': platform.machine(), 'cpus': os.cpu_count(), 'timestamp': int(time.time())},
+                       'results': [asdict(result) for result in benchmarks.results]}, writer, indent=2)
+
+    if args.baseline is not None:
+        regressions: list[str] = BaselineComparison.compare(benchmarks.results, load_results(args.baseline),
+                                                            args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,120 +1,264 @@
 import logging
+import os
 import time
-import tkinter
-import tkinter.filedialog
-from io import StringIO
+from typing import Iterator
 
 import numpy as np
 
 from cell import CellState
-from rule import Ruleset
+from engine import Engine, EngineFactory, StepEngine
+from instrumentation import Phase, Profiler
+from persistence import PatternCodec, PatternCodecFactory
+from regions import RegionStatistics
+from rule import Ruleset, RulesetFactory
+from topology import Topology
+
+_REGION_CHUNK_CELLS: int = 1 << 22
 
 
 class Board:
-    def __init__(self, n_cells_x: int, n_cells_y: int, ruleset: Ruleset):
+    def __init__(self, n_cells_x: int, n_cells_y: int, ruleset: Ruleset, engine: StepEngine | None = None,
+                 topology: Topology = Topology.TORUS):
         self.n_cells_x: int = n_cells_x
         self.n_cells_y: int = n_cells_y
-        self.current_generation: np.ndarray = np.zeros((n_cells_x, n_cells_y))
+        self.current_generation: np.ndarray = np.zeros((n_cells_x, n_cells_y), dtype=np.uint8)
+        self.__next_generation: np.ndarray = np.zeros_like(self.current_generation)
         self.ruleset = ruleset
+        self.engine: StepEngine = engine if engine is not None else EngineFactory.get_engine(Engine.NUMPY)
+        self.engine.topology = topology
+        self.topology: Topology = topology
+        self.origin_x: int = 0
+        self.origin_y: int = 0
+        self.profiler: Profiler | None = None
+        self.statistics: RegionStatistics | None = None
 
     def next_generation(self):
-        next_generation: np.ndarray = np.copy(self.current_generation)
-
-        for y in range(self.n_cells_y):
-            for x in range(self.n_cells_x):
-                n_neighbors: int = int(
-                    (
-                            self.current_generation[(x - 1) % self.n_cells_x, (y - 1) % self.n_cells_y]
-                            + self.current_generation[(x) % self.n_cells_x, (y - 1) % self.n_cells_y]
-                            + self.current_generation[(x + 1) % self.n_cells_x, (y - 1) % self.n_cells_y]
-                            + self.current_generation[(x - 1) % self.n_cells_x, (y) % self.n_cells_y]
-                            + self.current_generation[(x + 1) % self.n_cells_x, (y) % self.n_cells_y]
-                            + self.current_generation[(x - 1) % self.n_cells_x, (y + 1) % self.n_cells_y]
-                            + self.current_generation[(x) % self.n_cells_x, (y + 1) % self.n_cells_y]
-                            + self.current_generation[(x + 1) % self.n_cells_x, (y + 1) % self.n_cells_y]
-                    )
-                )
-
-                next_generation[x, y] = self.ruleset.apply(CellState(self.current_generation[x, y]), n_neighbors)
-
-        self.current_generation = next_generation
+        if self.topology is Topology.INFINITE:
+            self.__grow()
+        previous_generation: np.ndarray = self.current_generation
+        if self.profiler is None:
+            self.current_generation = self.__step(previous_generation)
+            self.__next_generation = previous_generation
+            self.__update_statistics(previous_generation)
+            return
+
+        start: float = time.perf_counter()
+        next_generation: np.ndarray = self.__step(previous_generation)
+        swap_start: float = time.perf_counter()
+        self.current_generation, self.__next_generation = next_generation, previous_generation
+        self.profiler.record(Phase.STEP, swap_start - start)
+        self.profiler.record(Phase.SWAP, time.perf_counter() - swap_start)
+        self.__update_statistics(previous_generation)
+        if self.statistics is not None:
+            self.profiler.end_generation(self.statistics.get_population(), self.statistics.births,
+                                         self.statistics.deaths)
+        else:
+            self.profiler.end_generation(*Profiler.count_changes(previous_generation, self.current_generation))
 
     def get_current_generation(self):
         return self.current_generation
 
+    def iter_generations(self, n_generations: int, every: int = 1,
+                         packed: bool = False) -> Iterator[tuple[int, np.ndarray]]:
+        if every < 1:
+            raise ValueError("Frame interval must be at least 1.")
+        for generation in range(n_generations + 1):
+            if generation > 0:
+                self.next_generation()
+            if generation % every == 0:
+                frame: np.ndarray = self.get_current_generation()
+                if packed:
+                    frame = np.packbits(frame != CellState.DEAD, axis=1)
+                frame = frame.view()
+                frame.flags.writeable = False
+                yield generation, frame
+
+    def get_packed_generation(self) -> np.ndarray:
+        return np.packbits(self.current_generation != CellState.DEAD)
+
+    def get_state(self) -> np.ndarray:
+        return self.current_generation
+
+    def get_cells(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        return self.current_generation[np.ix_(xs, ys)]
+
+    def get_region(self, x: int, y: int, width: int, height: int, step: int = 1) -> np.ndarray:
+        if x < 0 or y < 0 or x + step * (width - 1) >= self.n_cells_x or y + step * (height - 1) >= self.n_cells_y:
+            raise ValueError(f"Region {width}x{height} at ({x}, {y}) with step {step} exceeds the board.")
+
+        x_stop: int = min(x + step * width, self.n_cells_x)
+        y_stop: int = min(y + step * height, self.n_cells_y)
+        region: np.ndarray = np.empty((width, height), dtype=np.uint8)
+        chunk_rows: int = max(1, _REGION_CHUNK_CELLS // (step * (y_stop - y)))
+        for start in range(0, width, chunk_rows):
+            stop: int = min(start + chunk_rows, width)
+            region[start:stop] = self.get_pooled_cells(x + step * start, min(x + step * stop, x_stop), y, y_stop, step)
+        return region
+
+    def get_pooled_cells(self, x_start: int, x_stop: int, y_start: int, y_stop: int, step: int) -> np.ndarray:
+        return Board.pool(Board.pool(self.current_generation[x_start:x_stop, y_start:y_stop], step, 0), step, 1)
+
+    @staticmethod
+    def pool(cells: np.ndarray, step: int, axis: int, reduction: np.ufunc = np.maximum) -> np.ndarray:
+        if step == 1:
+            return cells
+        if axis == 1:
+            return reduction.reduceat(cells, np.arange(0, cells.shape[1], step), axis=1)
+        n_rows: int = cells.shape[0] // step * step
+        pooled: np.ndarray = reduction.reduce(cells[:n_rows].reshape(-1, step, cells.shape[1]), axis=1)
+        if n_rows == cells.shape[0]:
+            return pooled
+        return np.concatenate([pooled, reduction.reduce(cells[n_rows:], axis=0, keepdims=True)])
+
+    def get_population(self) -> int:
+        if self.statistics is not None:
+            return self.statistics.get_population()
+        return int(np.count_nonzero(self.current_generation))
+
     def change_cell_state(self, x: int, y: int):
-        self.current_generation[x, y] = not self.current_generation[x, y]
+        cell_state: CellState = CellState(not self.current_generation[x, y])
+        if self.statistics is not None:
+            self.statistics.set_cell_state(x, y, cell_state)
+        self.current_generation[x, y] = cell_state
+        self.engine.reset()
 
     def set_cell_state(self, x: int, y: int, cell_state: CellState):
+        if self.statistics is not None:
+            self.statistics.set_cell_state(x, y, cell_state)
         self.current_generation[x, y] = cell_state
+        self.engine.reset()
+
+    def set_cell_states(self, cells: np.ndarray, cell_state: CellState):
+        self.current_generation[cells[:, 0], cells[:, 1]] = cell_state
+        self.__reset_statistics()
+        self.engine.reset()
 
     def randomize(self):
-        self.current_generation = np.random.choice([CellState.DEAD, CellState.ALIVE],
-                                                   size=(self.n_cells_x, self.n_cells_y), p=[0.8, 0.2])
+        np.less(np.random.randint(0, 5, size=(self.n_cells_x, self.n_cells_y), dtype=np.uint8), 1,
+                out=self.current_generation)
+        self.__reset_statistics()
+        self.engine.reset()
 
     def clear(self):
-        self.current_generation = np.zeros((self.n_cells_x, self.n_cells_y))
+        self.current_generation.fill(CellState.DEAD)
+        self.__reset_statistics()
+        self.engine.reset()
 
     def update_ruleset(self, ruleset: Ruleset):
         self.ruleset = ruleset
+        lost_states: np.ndarray = self.current_generation >= ruleset.get_n_states()
+        if lost_states.any():
+            self.current_generation[lost_states] = CellState.DEAD
+            self.__reset_statistics()
+        self.engine.reset()
+
+    def update_engine(self, engine: StepEngine):
+        self.engine = engine
+        self.engine.profiler = self.profiler
+        self.engine.topology = self.topology
+        self.engine.reset()
+
+    def set_profiler(self, profiler: Profiler | None):
+        self.profiler = profiler
+        self.engine.profiler = profiler
+
+    def set_statistics(self, statistics: RegionStatistics | None):
+        self.statistics = statistics
+        self.__reset_statistics()
+
+    def set_topology(self, topology: Topology):
+        self.topology = topology
+        self.engine.topology = topology
+        self.engine.reset()
 
     def set_current_generation(self, new_generation: np.ndarray):
-        self.current_generation = new_generation
+        if new_generation.shape != self.current_generation.shape:
+            self.n_cells_x, self.n_cells_y = new_generation.shape
+            self.current_generation = np.empty(new_generation.shape, dtype=np.uint8)
+            self.__next_generation = np.empty_like(self.current_generation)
+        n_states: int = self.ruleset.get_n_states()
+        if n_states > 2:
+            np.copyto(self.current_generation, np.where(new_generation < n_states, new_generation, CellState.DEAD),
+                      casting='unsafe')
+        else:
+            np.not_equal(new_generation, CellState.DEAD, out=self.current_generation)
+        self.__reset_statistics()
+        self.engine.reset()
+
+    def __step(self, current_generation: np.ndarray) -> np.ndarray:
+        if self.ruleset.is_outer_totalistic():
+            return self.engine.next_generation(current_generation, self.ruleset, self.__next_generation)
+        return self.ruleset.next_generation(current_generation, self.topology, self.__next_generation)
+
+    def __update_statistics(self, previous_generation: np.ndarray):
+        if self.statistics is not None:
+            changed_tiles: tuple[np.ndarray, int] | None = (self.engine.get_changed_tiles()
+                                                            if self.ruleset.is_outer_totalistic() else None)
+            self.statistics.update(previous_generation, self.current_generation, changed_tiles)
+
+    def __reset_statistics(self):
+        if self.statistics is not None:
+            self.statistics.reset(self.current_generation)
+
+    def __grow(self):
+        generation: np.ndarray = self.current_generation
+        margin: int = self.ruleset.get_range()
+        grow_x: bool = bool(generation[:margin].any() or generation[-margin:].any())
+        grow_y: bool = bool(generation[:, :margin].any() or generation[:, -margin:].any())
+        if not grow_x and not grow_y:
+            return
+
+        offset_x: int = max(margin, self.n_cells_x // 2) if grow_x else 0
+        offset_y: int = max(margin, self.n_cells_y // 2) if grow_y else 0
+        grown: np.ndarray = np.zeros((self.n_cells_x + 2 * offset_x, self.n_cells_y + 2 * offset_y), dtype=np.uint8)
+        grown[offset_x:offset_x + self.n_cells_x, offset_y:offset_y + self.n_cells_y] = generation
+        self.origin_x -= offset_x
+        self.origin_y -= offset_y
+        self.set_current_generation(grown)
 
 
 class BoardPersistence:
 
     @staticmethod
-    def load(board: Board) -> str:
-        top = tkinter.Tk()
-        top.withdraw()
-        file_name = tkinter.filedialog.askopenfilename(parent=top)
-        top.destroy()
-
-        if file_name == ():
-            raise ValueError("No file selected")
+    def load(board: Board, file_name: str | None = None) -> str:
+        if file_name is None:
+            file_name = BoardPersistence.__ask_for_file_name()
 
+        codec: PatternCodec = PatternCodecFactory.get_codec_for_file(file_name)
         try:
-            reader = open(f'{file_name}', 'r')
+            new_generation, rulestring, name = codec.load(file_name)
         except IOError:
             raise IOError(f'Could not open file {file_name}.')
         else:
-            with reader:
-                name: str = reader.readline().replace("#Name:", "").strip()
-                rulestring: str = reader.readline().replace("#Rulestring:", "").strip()
-                board_as_string: list[str] = reader.readlines()
-
-                array_content: list[list[int]] = [[1 if char == '*' else 0 for char in line] for line in
-                                                  board_as_string]
-
-                new_generation: np.ndarray = np.fliplr(np.rot90(np.array(array_content), 3))
-                board.set_current_generation(new_generation)
-                logging.info(f'Loaded {name} with rulestring: {rulestring}')
-                return rulestring
+            board.update_ruleset(RulesetFactory.get_custom_ruleset(rulestring))
+            board.set_current_generation(new_generation)
+            logging.info(f'Loaded {name} with rulestring: {rulestring}')
+            return rulestring
 
     @staticmethod
-    def save(board: Board):
-        content: StringIO = StringIO()
+    def save(board: Board, file_name: str | None = None):
         current_timestamp: int = int(time.time())
-        filename: str = f'{current_timestamp}.pylife'
-        rulestring = board.ruleset.get_rulestring()
-        content.write(f"#Name:{current_timestamp}\n")
-        content.write(f"#Rulestring:{rulestring}\n")
-
-        current_generation: np.ndarray = np.fliplr(
-            np.rot90(board.get_current_generation(), 3))
-
-        for x in current_generation:
-            for y in x:
-                content.write(f'{'*' if y == 1 else '.'}')
-            content.write('\n')
+        filename: str = file_name if file_name is not None else f'saved/{current_timestamp}.pylife'
+        name: str = os.path.splitext(os.path.basename(filename))[0]
 
         try:
-            writer = open(f'saved/{filename}', 'w')
-        except IOError as err:
+            codec: PatternCodec = PatternCodecFactory.get_codec_for_file(filename)
+            codec.save(filename, board.get_current_generation(), board.ruleset.get_rulestring(), name)
+        except (IOError, ValueError) as err:
             logging.error(f"Could not save {filename}. Cause: {err}.")
-            return
         else:
-            with writer:
-                writer.write(content.getvalue())
-                logging.info(f"Pattern successfully saved to {filename}.")
+            logging.info(f"Pattern successfully saved to {filename}.")
+
+    @staticmethod
+    def __ask_for_file_name() -> str:
+        import tkinter
+        import tkinter.filedialog
+
+        top = tkinter.Tk()
+        top.withdraw()
+        file_name = tkinter.filedialog.askopenfilename(parent=top)
+        top.destroy()
+
+        if file_name == ():
+            raise ValueError("No file selected")
+        return file_name
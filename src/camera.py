@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+
+from board import Board
+
+
+class Camera:
+    def __init__(self, n_cells_x: int, n_cells_y: int, view_width: int, view_height: int, max_zoom: float = 64.0):
+        self.view_width: int = view_width
+        self.view_height: int = view_height
+        self.max_zoom: float = max_zoom
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.zoom: float = self.get_min_zoom()
+        self.x: float = 0.0
+        self.y: float = 0.0
+
+    def resize_board(self, n_cells_x: int, n_cells_y: int):
+        self.n_cells_x = n_cells_x
+        self.n_cells_y = n_cells_y
+        self.zoom = self.get_min_zoom()
+        self.x, self.y = 0.0, 0.0
+
+    def get_min_zoom(self) -> float:
+        return min(self.view_width / self.n_cells_x, self.view_height / self.n_cells_y, self.max_zoom)
+
+    def pan(self, dx: float, dy: float):
+        self.x -= dx / self.zoom
+        self.y -= dy / self.zoom
+        self.__clamp()
+
+    def zoom_at(self, factor: float, pixel_x: float, pixel_y: float):
+        cell_x: float = self.x + pixel_x / self.zoom
+        cell_y: float = self.y + pixel_y / self.zoom
+        self.zoom = min(max(self.zoom * factor, self.get_min_zoom()), self.max_zoom)
+        self.x = cell_x - pixel_x / self.zoom
+        self.y = cell_y - pixel_y / self.zoom
+        self.__clamp()
+
+    def screen_to_cell(self, pixel_x: float, pixel_y: float) -> tuple[int, int] | None:
+        x: int = math.floor(self.x + pixel_x / self.zoom)
+        y: int = math.floor(self.y + pixel_y / self.zoom)
+        if 0 <= x < self.n_cells_x and 0 <= y < self.n_cells_y:
+            return x, y
+        return None
+
+    def get_step(self) -> int:
+        return max(1, math.floor(1 / self.zoom))
+
+    def get_region_bounds(self) -> tuple[int, int, int, int, int]:
+        step: int = self.get_step()
+        x: int = math.floor(self.x)
+        y: int = math.floor(self.y)
+        width: int = min(math.ceil(self.view_width / self.zoom) + 1, self.n_cells_x - x)
+        height: int = min(math.ceil(self.view_height / self.zoom) + 1, self.n_cells_y - y)
+        return x, y, -(-width // step), -(-height // step), step
+
+    def get_region(self, board: Board) -> np.ndarray:
+        if (board.n_cells_x, board.n_cells_y) != (self.n_cells_x, self.n_cells_y):
+            self.resize_board(board.n_cells_x, board.n_cells_y)
+        x, y, width, height, step = self.get_region_bounds()
+        return board.get_region(x, y, width, height, step)
+
+    def get_region_offset(self) -> tuple[float, float]:
+        x, y, _, _, _ = self.get_region_bounds()
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+
+    def __clamp(self):
+        self.x = min(max(self.x, 0.0), max(0.0, self.n_cells_x - self.view_width / self.zoom))
+        self.y = min(max(self.y, 0.0), max(0.0, self.n_cells_y - self.view_height / self.zoom))
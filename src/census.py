@@ -0,0 +1,224 @@
+import hashlib
+import os
+from collections import Counter
+from typing import Iterator
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+from persistence import PatternCodecFactory, PatternFormat
+from rule import Rule, Ruleset, RulesetFactory
+from topology import Topology
+
+DEFAULT_PATTERN_DIRECTORY: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'saved')
+
+_CONWAYS_LIFE_PATTERNS: dict[str, str] = {
+    'block': '**\n**',
+    'beehive': '.**.\n*..*\n.**.',
+    'loaf': '.**.\n*..*\n.*.*\n..*.',
+    'boat': '**.\n*.*\n.*.',
+    'ship': '**.\n*.*\n.**',
+    'tub': '.*.\n*.*\n.*.',
+    'pond': '.**.\n*..*\n*..*\n.**.',
+    'long boat': '.*..\n*.*.\n.*.*\n..**',
+    'barge': '.*..\n*.*.\n.*.*\n..*.',
+    'snake': '**.*\n*.**',
+    'aircraft carrier': '**..\n*..*\n..**',
+    'blinker': '***',
+    'toad': '.***\n***.',
+    'beacon': '**..\n**..\n..**\n..**',
+    'traffic light': '..***..\n.......\n*.....*\n*.....*\n*.....*\n.......\n..***..',
+    'glider': '.*.\n..*\n***',
+    'lightweight spaceship': '.*..*\n*....\n*...*\n****.',
+    'middleweight spaceship': '...*..\n.*...*\n*.....\n*....*\n*****.',
+    'heavyweight spaceship': '...**..\n.*....*\n*......\n*.....*\n******.',
+}
+
+
+class ComponentLabeller:
+    @staticmethod
+    def label(alive: np.ndarray, topology: Topology = Topology.TORUS, reach: int = 2) -> np.ndarray:
+        labels: np.ndarray = np.where(alive, np.arange(1, alive.size + 1, dtype=np.int64).reshape(alive.shape), 0)
+        flat_alive: np.ndarray = alive.reshape(-1)
+        pad_width: list[tuple[int, int]] = [(0, 0)] * (alive.ndim - 2) + [(1, 1), (1, 1)]
+        mode: str = 'wrap' if topology is Topology.TORUS else 'constant'
+        while True:
+            grown: np.ndarray = labels
+            for _ in range(reach):
+                padded: np.ndarray = np.pad(grown, pad_width, mode=mode)
+                rows: np.ndarray = np.maximum(np.maximum(padded[..., :-2, :], padded[..., 1:-1, :]),
+                                              padded[..., 2:, :])
+                grown = np.maximum(np.maximum(rows[..., :-2], rows[..., 1:-1]), rows[..., 2:])
+            grown *= alive
+            flat: np.ndarray = grown.reshape(-1)
+            flat[flat_alive] = flat[flat[flat_alive] - 1]
+            if np.array_equal(grown, labels):
+                return labels
+            labels = grown
+
+    @staticmethod
+    def get_components(alive: np.ndarray, topology: Topology = Topology.TORUS,
+                       reach: int = 2) -> Iterator[tuple[tuple[int, ...], np.ndarray]]:
+        labels: np.ndarray = ComponentLabeller.label(alive, topology, reach).reshape(-1)
+        cells: np.ndarray = np.flatnonzero(labels)
+        if len(cells) == 0:
+            return
+        order: np.ndarray = np.argsort(labels[cells], kind='stable')
+        cells = cells[order]
+        cell_labels: np.ndarray = labels[cells]
+        starts: np.ndarray = np.flatnonzero(np.concatenate(([True], cell_labels[1:] != cell_labels[:-1])))
+        stops: np.ndarray = np.append(starts[1:], len(cells))
+        coordinates: tuple[np.ndarray, ...] = np.unravel_index(cells, alive.shape)
+        n_cells_x, n_cells_y = alive.shape[-2:]
+        wrap: bool = topology is Topology.TORUS
+        for start, stop in zip(starts, stops):
+            index: tuple[int, ...] = tuple(int(axis[start]) for axis in coordinates[:-2])
+            xs: np.ndarray = coordinates[-2][start:stop]
+            ys: np.ndarray = coordinates[-1][start:stop]
+            if wrap:
+                xs, ys = ComponentLabeller.__unwrap(xs, n_cells_x), ComponentLabeller.__unwrap(ys, n_cells_y)
+            yield index, ComponentLabeller.crop(xs, ys)
+
+    @staticmethod
+    def crop(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        pattern: np.ndarray = np.zeros((xs.max() - xs.min() + 1, ys.max() - ys.min() + 1), dtype=np.uint8)
+        pattern[xs - xs.min(), ys - ys.min()] = CellState.ALIVE
+        return pattern
+
+    @staticmethod
+    def __unwrap(positions: np.ndarray, size: int) -> np.ndarray:
+        occupied: np.ndarray = np.unique(positions)
+        gaps: np.ndarray = np.diff(occupied)
+        if len(gaps) == 0 or occupied[0] + size - occupied[-1] >= gaps.max():
+            return positions
+        start: int = int(occupied[np.argmax(gaps) + 1])
+        return (positions - start) % size
+
+
+class PatternLibrary:
+    __libraries: dict[tuple[str, str | None], 'PatternLibrary'] = {}
+
+    def __init__(self, ruleset: Ruleset, max_period: int = 16):
+        self.ruleset: Ruleset = ruleset
+        self.max_period: int = max_period
+        self.__names: dict[bytes, str] = {}
+        self.__cache: dict[bytes, str] = {}
+
+    @staticmethod
+    def get(ruleset: Ruleset, directory: str | None = DEFAULT_PATTERN_DIRECTORY) -> 'PatternLibrary':
+        key: tuple[str, str | None] = (ruleset.get_rulestring(), directory)
+        if key not in PatternLibrary.__libraries:
+            library: PatternLibrary = PatternLibrary(ruleset)
+            if PatternLibrary.__is_conways_life(ruleset):
+                for name, pattern in _CONWAYS_LIFE_PATTERNS.items():
+                    library.add(name, PatternLibrary.parse(pattern))
+            if directory is not None and os.path.isdir(directory):
+                library.add_directory(directory)
+            PatternLibrary.__libraries[key] = library
+        return PatternLibrary.__libraries[key]
+
+    def add(self, name: str, pattern: np.ndarray) -> int:
+        phases: list[bytes] = self.__get_phases(pattern)
+        for phase in phases:
+            self.__names.setdefault(phase, name)
+        self.__cache.clear()
+        return len(phases)
+
+    def add_directory(self, directory: str):
+        for file_name in sorted(os.listdir(directory)):
+            if os.path.splitext(file_name)[1] != PatternFormat.PYLIFE.value:
+                continue
+            generation, rulestring, name = PatternCodecFactory.get_codec_for_file(
+                os.path.join(directory, file_name)).load(os.path.join(directory, file_name))
+            if not PatternLibrary.__is_same_rule(self.ruleset, RulesetFactory.get_custom_ruleset(rulestring)):
+                continue
+            components: list[np.ndarray] = [pattern for _, pattern in
+                                            ComponentLabeller.get_components(generation != CellState.DEAD,
+                                                                             Topology.BOUNDED)]
+            if len(components) == 1:
+                self.add(name or os.path.splitext(file_name)[0], components[0])
+
+    def identify(self, pattern: np.ndarray) -> str:
+        key: bytes = PatternLibrary.__encode(pattern)
+        if key not in self.__cache:
+            canonical: bytes = PatternLibrary.canonicalize(pattern)
+            self.__cache[key] = self.__names.get(
+                canonical, f'x{int(np.count_nonzero(pattern))}_{PatternLibrary.hash(canonical)}')
+        return self.__cache[key]
+
+    def get_names(self) -> set[str]:
+        return set(self.__names.values())
+
+    def __get_phases(self, pattern: np.ndarray) -> list[bytes]:
+        margin: int = self.max_period * self.ruleset.get_range() + 2
+        board: Board = Board(pattern.shape[0] + 2 * margin, pattern.shape[1] + 2 * margin, self.ruleset,
+                             topology=Topology.BOUNDED)
+        generation: np.ndarray = np.zeros((board.n_cells_x, board.n_cells_y), dtype=np.uint8)
+        generation[margin:-margin, margin:-margin] = pattern != CellState.DEAD
+        board.set_current_generation(generation)
+
+        phases: list[bytes] = [PatternLibrary.canonicalize(ComponentLabeller.crop(*np.nonzero(pattern)))]
+        for _ in range(self.max_period):
+            board.next_generation()
+            xs, ys = np.nonzero(board.get_current_generation() != CellState.DEAD)
+            if len(xs) == 0:
+                break
+            phase: bytes = PatternLibrary.canonicalize(ComponentLabeller.crop(xs, ys))
+            if phase == phases[0]:
+                return phases
+            phases.append(phase)
+        return phases[:1]
+
+    @staticmethod
+    def parse(pattern: str) -> np.ndarray:
+        rows: list[str] = pattern.split('\n')
+        cells: np.ndarray = np.zeros((max(map(len, rows)), len(rows)), dtype=np.uint8)
+        for y, row in enumerate(rows):
+            cells[:len(row), y] = np.frombuffer(row.encode(), dtype=np.uint8) == ord('*')
+        return cells
+
+    @staticmethod
+    def canonicalize(pattern: np.ndarray) -> bytes:
+        cells: np.ndarray = pattern != CellState.DEAD
+        return min(PatternLibrary.__encode(transform) for rotation in range(4)
+                   for transform in (np.rot90(cells, rotation), np.rot90(cells, rotation).T))
+
+    @staticmethod
+    def hash(canonical: bytes) -> str:
+        return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
+    @staticmethod
+    def __encode(pattern: np.ndarray) -> bytes:
+        n_cells_x, n_cells_y = pattern.shape
+        return (n_cells_x.to_bytes(2, 'big') + n_cells_y.to_bytes(2, 'big')
+                + np.packbits(pattern != CellState.DEAD).tobytes())
+
+    @staticmethod
+    def __is_conways_life(ruleset: Ruleset) -> bool:
+        return PatternLibrary.__is_same_rule(ruleset, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+
+    @staticmethod
+    def __is_same_rule(ruleset: Ruleset, other: Ruleset) -> bool:
+        return (ruleset.is_outer_totalistic() and other.is_outer_totalistic()
+                and sorted(ruleset.birth) == sorted(other.birth) and sorted(ruleset.survival) == sorted(other.survival))
+
+
+class Census:
+    def __init__(self, ruleset: Ruleset, library: PatternLibrary | None = None, reach: int = 2):
+        self.ruleset: Ruleset = ruleset
+        self.library: PatternLibrary = library if library is not None else PatternLibrary.get(ruleset)
+        self.reach: int = reach
+
+    def take(self, generation: np.ndarray, topology: Topology = Topology.TORUS) -> Counter[str]:
+        return self.take_all(generation[np.newaxis], topology)[0]
+
+    def take_board(self, board: Board) -> Counter[str]:
+        return self.take(board.get_current_generation(), board.topology)
+
+    def take_all(self, generations: np.ndarray, topology: Topology = Topology.TORUS) -> list[Counter[str]]:
+        counts: list[Counter[str]] = [Counter() for _ in range(len(generations))]
+        for (index,), pattern in ComponentLabeller.get_components(generations != CellState.DEAD, topology,
+                                                                  self.reach):
+            counts[index][self.library.identify(pattern)] += 1
+        return counts
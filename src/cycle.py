@@ -0,0 +1,72 @@
+import hashlib
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+from board import Board
+
+
+class CycleKind(Enum):
+    EXTINCTION = 'extinction'
+    STILL_LIFE = 'still life'
+    OSCILLATOR = 'oscillator'
+
+
+@dataclass
+class Cycle:
+    kind: CycleKind
+    start: int
+    generation: int
+    period: int
+
+    def get_remaining_generations(self, current_generation: int, target_generation: int) -> int:
+        return max(0, target_generation - current_generation) % self.period
+
+    def describe(self) -> str:
+        if self.kind is CycleKind.OSCILLATOR:
+            return f'period {self.period} oscillator since generation {self.start}'
+        return f'{self.kind.value} since generation {self.start}'
+
+
+class CycleDetector:
+    def __init__(self, max_period: int = 16):
+        if max_period < 1:
+            raise ValueError("Maximum cycle period must be at least 1.")
+        self.max_period: int = max_period
+        self.__history: deque[tuple[bytes, int]] = deque(maxlen=max_period)
+        self.__candidate: tuple[int, int, np.ndarray] | None = None
+
+    def observe(self, board: Board, generation: int) -> Cycle | None:
+        if board.get_population() == 0 and 0 not in board.ruleset.birth:
+            return Cycle(CycleKind.EXTINCTION, generation, generation, 1)
+
+        state: np.ndarray = np.ascontiguousarray(board.get_state())
+        digest: bytes = hashlib.blake2b(state.data, digest_size=16).digest()
+        cycle: Cycle | None = None
+        if self.__candidate is not None:
+            cycle = self.__confirm(state, generation)
+        else:
+            for previous_digest, previous_generation in reversed(self.__history):
+                if previous_digest == digest:
+                    self.__candidate = (generation, generation - previous_generation, np.copy(state))
+                    break
+
+        self.__history.append((digest, generation))
+        return cycle
+
+    def reset(self):
+        self.__history.clear()
+        self.__candidate = None
+
+    def __confirm(self, state: np.ndarray, generation: int) -> Cycle | None:
+        candidate_generation, period, candidate_state = self.__candidate
+        if generation < candidate_generation + period:
+            return None
+
+        self.__candidate = None
+        if generation != candidate_generation + period or not np.array_equal(candidate_state, state):
+            return None
+        return Cycle(CycleKind.STILL_LIFE if period == 1 else CycleKind.OSCILLATOR, candidate_generation - period,
+                     generation, period)
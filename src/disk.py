@@ -0,0 +1,189 @@
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+from engine import NumpyEngine
+from instrumentation import Phase, Profiler
+from regions import RegionStatistics
+from rule import Ruleset
+from topology import Topology
+
+_BYTES_PER_CELL_IN_FLIGHT: int = 10
+
+
+class DiskBoard(Board):
+    def __init__(self, n_cells_x: int, n_cells_y: int, ruleset: Ruleset, directory: str | None = None,
+                 max_memory_bytes: int = 256 << 20, topology: Topology = Topology.TORUS):
+        DiskBoard.__check_ruleset(ruleset)
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.ruleset: Ruleset = ruleset
+        self.max_memory_bytes: int = max_memory_bytes
+        self.profiler: Profiler | None = None
+        self.topology: Topology = Topology.TORUS
+        self.set_topology(topology)
+        self.origin_x: int = 0
+        self.origin_y: int = 0
+        self.directory: str = directory if directory is not None else tempfile.mkdtemp(prefix='gol-')
+        self.__finalizer: weakref.finalize = weakref.finalize(self, DiskBoard.__release, self.directory,
+                                                              directory is None)
+        self.__files: list[str] = [os.path.join(self.directory, f'generation_{index}.npy') for index in range(2)]
+        self.__offset: int = 0
+        self.__allocate()
+
+    def next_generation(self):
+        if self.profiler is None:
+            self.__step()
+            return
+
+        previous_population: int = self.get_population()
+        start: float = time.perf_counter()
+        births, deaths = self.__step()
+        self.profiler.record(Phase.STEP, time.perf_counter() - start)
+        self.profiler.end_generation(previous_population + births - deaths, births, deaths)
+
+    def get_stripe_rows(self) -> int:
+        return max(1, self.max_memory_bytes // (_BYTES_PER_CELL_IN_FLIGHT * (self.n_cells_y + 2)))
+
+    def get_population(self) -> int:
+        return sum(int(np.count_nonzero(self.__read_rows(0, start, stop)))
+                   for start, stop in self.__get_stripes())
+
+    def change_cell_state(self, x: int, y: int):
+        self.current_generation[x, y] = not self.current_generation[x, y]
+
+    def set_cell_state(self, x: int, y: int, cell_state: CellState):
+        self.current_generation[x, y] = cell_state
+
+    def set_cell_states(self, cells: np.ndarray, cell_state: CellState):
+        self.current_generation[cells[:, 0], cells[:, 1]] = cell_state
+
+    def randomize(self):
+        for start, stop in self.__get_stripes():
+            self.__write_rows(0, start, np.less(
+                np.random.randint(0, 5, size=(stop - start, self.n_cells_y), dtype=np.uint8), 1).astype(np.uint8))
+
+    def clear(self):
+        for start, stop in self.__get_stripes():
+            self.__write_rows(0, start, np.zeros((stop - start, self.n_cells_y), dtype=np.uint8))
+
+    def update_ruleset(self, ruleset: Ruleset):
+        DiskBoard.__check_ruleset(ruleset)
+        self.ruleset = ruleset
+
+    def update_engine(self, engine):
+        pass
+
+    def set_profiler(self, profiler: Profiler | None):
+        self.profiler = profiler
+
+    def set_statistics(self, statistics: RegionStatistics | None):
+        if statistics is not None:
+            raise ValueError("Disk boards do not keep region statistics, they would hold the whole board in memory.")
+
+    def set_topology(self, topology: Topology):
+        if topology is Topology.INFINITE:
+            raise ValueError("Disk boards cannot grow, use a torus, bounded or Klein bottle topology.")
+        self.topology = topology
+
+    def set_current_generation(self, new_generation: np.ndarray):
+        if new_generation.shape != (self.n_cells_x, self.n_cells_y):
+            self.n_cells_x, self.n_cells_y = new_generation.shape
+            self.__allocate()
+        for start, stop in self.__get_stripes():
+            self.__write_rows(0, start, (new_generation[start:stop] != CellState.DEAD).astype(np.uint8))
+
+    def close(self):
+        self.current_generation = None
+        self.__finalizer()
+
+    def __allocate(self):
+        self.current_generation = None
+        for file_name in self.__files:
+            generation: np.memmap = np.lib.format.open_memmap(file_name, mode='w+', dtype=np.uint8,
+                                                              shape=(self.n_cells_x, self.n_cells_y))
+            self.__offset = generation.offset
+            del generation
+        self.__map_current_generation()
+
+    def __map_current_generation(self):
+        self.current_generation = np.lib.format.open_memmap(self.__files[0], mode='r+')
+
+    def __get_stripes(self) -> list[tuple[int, int]]:
+        stripe_rows: int = self.get_stripe_rows()
+        return [(start, min(start + stripe_rows, self.n_cells_x)) for start in range(0, self.n_cells_x, stripe_rows)]
+
+    def __read_rows(self, file_index: int, start: int, stop: int) -> np.ndarray:
+        rows: np.memmap = np.memmap(self.__files[file_index], dtype=np.uint8, mode='r', shape=(stop - start, self.n_cells_y),
+                                    offset=self.__offset + start * self.n_cells_y)
+        copy: np.ndarray = np.array(rows)
+        del rows
+        return copy
+
+    def __write_rows(self, file_index: int, start: int, values: np.ndarray):
+        rows: np.memmap = np.memmap(self.__files[file_index], dtype=np.uint8, mode='r+', shape=values.shape,
+                                    offset=self.__offset + start * self.n_cells_y)
+        rows[...] = values
+        rows.flush()
+        del rows
+
+    def __load_stripe(self, start: int, stop: int) -> np.ndarray:
+        padded: np.ndarray = np.zeros((stop - start + 2, self.n_cells_y + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.__read_rows(0, start, stop)
+        wraps: bool = self.topology in (Topology.TORUS, Topology.KLEIN_BOTTLE)
+        if start > 0:
+            padded[0, 1:-1] = self.__read_rows(0, start - 1, start)
+        elif wraps:
+            padded[0, 1:-1] = self.__read_edge_row(self.n_cells_x - 1)
+        if stop < self.n_cells_x:
+            padded[-1, 1:-1] = self.__read_rows(0, stop, stop + 1)
+        elif wraps:
+            padded[-1, 1:-1] = self.__read_edge_row(0)
+        if wraps:
+            padded[:, 0] = padded[:, -2]
+            padded[:, -1] = padded[:, 1]
+        return padded
+
+    def __read_edge_row(self, x: int) -> np.ndarray:
+        row: np.ndarray = self.__read_rows(0, x, x + 1)
+        return row[:, ::-1] if self.topology is Topology.KLEIN_BOTTLE else row
+
+    def __step(self) -> tuple[int, int]:
+        transition_table: np.ndarray = NumpyEngine.get_transition_table(self.ruleset, np.uint8)
+        stripes: list[tuple[int, int]] = self.__get_stripes()
+        births: int = 0
+        deaths: int = 0
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch') as prefetcher:
+            pending: Future = prefetcher.submit(self.__load_stripe, *stripes[0])
+            for index, (start, stop) in enumerate(stripes):
+                padded: np.ndarray = pending.result()
+                if index + 1 < len(stripes):
+                    pending = prefetcher.submit(self.__load_stripe, *stripes[index + 1])
+                alive: np.ndarray = padded[1:-1, 1:-1]
+                next_rows: np.ndarray = transition_table[alive, NumpyEngine.count_neighbours_with_halo(padded)]
+                if self.profiler is not None:
+                    births += int(np.count_nonzero(next_rows > alive))
+                    deaths += int(np.count_nonzero(next_rows < alive))
+                self.__write_rows(1, start, next_rows)
+
+        self.current_generation = None
+        self.__files.reverse()
+        self.__map_current_generation()
+        return births, deaths
+
+    @staticmethod
+    def __release(directory: str, owns_directory: bool):
+        if owns_directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    def __check_ruleset(ruleset: Ruleset):
+        if not ruleset.is_outer_totalistic():
+            raise ValueError(f"Disk boards only handle outer totalistic rules: {ruleset.get_rulestring()}.")
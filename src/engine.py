@@ -0,0 +1,363 @@
+import logging
+import os
+import time
+import weakref
+from abc import ABC, abstractmethod
+from enum import Enum
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.pool import Pool as PoolType
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from cell import CellState
+from instrumentation import Phase, Profiler
+from rule import Ruleset
+from topology import Halo, Topology
+
+
+class Engine(Enum):
+    LOOP = 0
+    NUMPY = 1
+    PARALLEL = 2
+    TILED = 3
+    JIT = 4
+
+
+class StepEngine(ABC):
+    profiler: Profiler | None = None
+    topology: Topology = Topology.TORUS
+
+    @abstractmethod
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        pass
+
+    def reset(self):
+        pass
+
+    def get_changed_tiles(self) -> tuple[np.ndarray, int] | None:
+        return None
+
+
+class LoopEngine(StepEngine):
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        n_cells_x, n_cells_y = current_generation.shape
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        padded: np.ndarray = Halo.pad(current_generation, self.topology)
+
+        for y in range(n_cells_y):
+            for x in range(n_cells_x):
+                n_neighbors: int = int(
+                    (
+                            padded[x, y] + padded[x + 1, y] + padded[x + 2, y]
+                            + padded[x, y + 1] + padded[x + 2, y + 1]
+                            + padded[x, y + 2] + padded[x + 1, y + 2] + padded[x + 2, y + 2]
+                    )
+                )
+
+                next_generation[x, y] = ruleset.apply(CellState(padded[x + 1, y + 1]), n_neighbors)
+
+        return next_generation
+
+
+class NumpyEngine(StepEngine):
+    chunk_cells: int = 1 << 16
+
+    def __init__(self):
+        self.__padded: np.ndarray | None = None
+        self.__column_sums: np.ndarray | None = None
+        self.__indices: np.ndarray | None = None
+
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        if self.profiler is None:
+            self.__count_neighbours(current_generation)
+            return self.__apply_rules(ruleset, next_generation)
+
+        start: float = time.perf_counter()
+        self.__count_neighbours(current_generation)
+        rules_start: float = time.perf_counter()
+        self.__apply_rules(ruleset, next_generation)
+        self.profiler.record(Phase.NEIGHBOURS, rules_start - start)
+        self.profiler.record(Phase.RULES, time.perf_counter() - rules_start)
+        return next_generation
+
+    def __count_neighbours(self, current_generation: np.ndarray):
+        n_cells_x, n_cells_y = current_generation.shape
+        if self.__padded is None or self.__padded.shape != (n_cells_x + 2, n_cells_y + 2):
+            self.__padded = np.empty((n_cells_x + 2, n_cells_y + 2), dtype=np.uint8)
+            self.__column_sums = np.empty((n_cells_x, n_cells_y + 2), dtype=np.uint8)
+            self.__indices = np.empty((n_cells_x, n_cells_y), dtype=np.uint8)
+
+        padded, column_sums, indices = self.__padded, self.__column_sums, self.__indices
+        Halo.pad(current_generation, self.topology, out=padded)
+        np.add(padded[:-2], padded[1:-1], out=column_sums)
+        column_sums += padded[2:]
+
+        np.add(column_sums[:, :-2], column_sums[:, 1:-1], out=indices)
+        indices += column_sums[:, 2:]
+        np.left_shift(padded[1:-1, 1:-1], 3, out=column_sums[:, 1:-1])
+        indices += column_sums[:, 1:-1]
+
+    def __apply_rules(self, ruleset: Ruleset, next_generation: np.ndarray) -> np.ndarray:
+        transition_table: np.ndarray = NumpyEngine.get_transition_table(ruleset, next_generation.dtype).reshape(-1)
+        chunk_rows: int = max(1, NumpyEngine.chunk_cells // max(1, next_generation.shape[1]))
+        for start in range(0, next_generation.shape[0], chunk_rows):
+            np.take(transition_table, self.__indices[start:start + chunk_rows], out=next_generation[start:start + chunk_rows],
+                    mode='clip')
+        return next_generation
+
+    @staticmethod
+    def count_neighbours(cell_states: np.ndarray, topology: Topology = Topology.TORUS) -> np.ndarray:
+        return NumpyEngine.count_neighbours_with_halo(Halo.pad(cell_states, topology))
+
+    @staticmethod
+    def count_neighbours_with_halo(padded: np.ndarray) -> np.ndarray:
+        column_sums: np.ndarray = padded[:-2] + padded[1:-1] + padded[2:]
+        return column_sums[:, :-2] + column_sums[:, 1:-1] + column_sums[:, 2:] - padded[1:-1, 1:-1]
+
+    @staticmethod
+    def get_transition_table(ruleset: Ruleset, dtype: np.dtype) -> np.ndarray:
+        return ruleset.get_transition_table().astype(dtype, copy=False)
+
+
+class ParallelEngine(StepEngine):
+    def __init__(self, workers: int | None = None):
+        self.workers: int = workers if workers is not None else os.cpu_count()
+        self.__shape: tuple[int, int] | None = None
+        self.__pool: PoolType | None = None
+        self.__shared_memory: list[SharedMemory] = []
+        self.__source: np.ndarray | None = None
+        self.__target: np.ndarray | None = None
+        self.__finalizer: weakref.finalize | None = None
+
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        if self.__shape != current_generation.shape:
+            self.__allocate(current_generation.shape)
+
+        Halo.pad(current_generation, self.topology, out=self.__source)
+        transition_table: np.ndarray = NumpyEngine.get_transition_table(ruleset, np.dtype(np.uint8))
+        bounds: np.ndarray = np.linspace(0, self.__shape[0], min(self.workers, self.__shape[0]) + 1, dtype=int)
+        self.__pool.starmap(_ParallelWorker.step_stripe,
+                            [(int(start), int(stop), transition_table) for start, stop in zip(bounds[:-1], bounds[1:])])
+        if out is None:
+            return self.__target.astype(current_generation.dtype)
+        np.copyto(out, self.__target, casting='unsafe')
+        return out
+
+    def close(self):
+        if self.__finalizer is not None:
+            self.__finalizer()
+        self.__shape = None
+        self.__pool = None
+        self.__source = None
+        self.__target = None
+
+    def __allocate(self, shape: tuple[int, int]):
+        self.close()
+        size: int = max(1, shape[0] * shape[1])
+        padded_shape: tuple[int, int] = (shape[0] + 2, shape[1] + 2)
+        self.__shared_memory = [SharedMemory(create=True, size=padded_shape[0] * padded_shape[1]),
+                                SharedMemory(create=True, size=size)]
+        self.__source = np.ndarray(padded_shape, dtype=np.uint8, buffer=self.__shared_memory[0].buf)
+        self.__target = np.ndarray(shape, dtype=np.uint8, buffer=self.__shared_memory[1].buf)
+        context: BaseContext = get_context('spawn' if _JitKernel.kernel is not None else None)
+        self.__pool = context.Pool(self.workers, _ParallelWorker.attach,
+                                   (self.__shared_memory[0].name, self.__shared_memory[1].name, shape))
+        self.__finalizer = weakref.finalize(self, ParallelEngine.__release, self.__pool, self.__shared_memory)
+        self.__shape = shape
+
+    @staticmethod
+    def __release(pool: PoolType, shared_memory: list[SharedMemory]):
+        pool.terminate()
+        pool.join()
+        for block in shared_memory:
+            block.close()
+            block.unlink()
+
+
+class _ParallelWorker:
+    shared_memory: list[SharedMemory] = []
+    source: np.ndarray | None = None
+    target: np.ndarray | None = None
+
+    @staticmethod
+    def attach(source_name: str, target_name: str, shape: tuple[int, int]):
+        _ParallelWorker.shared_memory = [SharedMemory(name=source_name), SharedMemory(name=target_name)]
+        _ParallelWorker.source = np.ndarray((shape[0] + 2, shape[1] + 2), dtype=np.uint8,
+                                            buffer=_ParallelWorker.shared_memory[0].buf)
+        _ParallelWorker.target = np.ndarray(shape, dtype=np.uint8, buffer=_ParallelWorker.shared_memory[1].buf)
+
+    @staticmethod
+    def step_stripe(start: int, stop: int, transition_table: np.ndarray):
+        rows: np.ndarray = _ParallelWorker.source[start:stop + 2]
+        neighbours: np.ndarray = NumpyEngine.count_neighbours_with_halo(rows)
+        _ParallelWorker.target[start:stop] = transition_table[rows[1:-1, 1:-1], neighbours]
+
+
+class TiledEngine(StepEngine):
+    def __init__(self, tile_size: int = 32, full_step_ratio: float = 0.5):
+        self.tile_size: int = tile_size
+        self.full_step_ratio: float = full_step_ratio
+        self.__numpy_engine: NumpyEngine = NumpyEngine()
+        self.__padded: np.ndarray | None = None
+        self.__changed_tiles: np.ndarray | None = None
+        self.__last_generation: np.ndarray | None = None
+        self.__last_source: np.ndarray | None = None
+        self.__skipped_tiles: int = 0
+
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        tile_shape: tuple[int, int] = self.__tile_shape(current_generation.shape)
+        in_sync: bool = out is not None and out is self.__last_source
+        if (self.__last_generation is not current_generation or self.__changed_tiles is None
+                or self.__changed_tiles.shape != tile_shape):
+            self.__changed_tiles = np.ones(tile_shape, dtype=bool)
+            in_sync = False
+
+        active_tiles: np.ndarray = self.__dilate(self.__changed_tiles)
+        n_active_tiles: int = int(np.count_nonzero(active_tiles))
+        if n_active_tiles > self.full_step_ratio * active_tiles.size:
+            self.__numpy_engine.topology = self.topology
+            next_generation: np.ndarray = self.__numpy_engine.next_generation(current_generation, ruleset, out)
+            self.__changed_tiles = self.__find_changed_tiles(current_generation, next_generation)
+        else:
+            next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+            # The last source differs from the current generation only in tiles that changed, all of them active.
+            if not in_sync:
+                np.copyto(next_generation, current_generation)
+            self.__changed_tiles = self.__step_tiles(current_generation, next_generation, active_tiles, ruleset)
+
+        self.__skipped_tiles = active_tiles.size - n_active_tiles
+        self.__last_generation = next_generation
+        self.__last_source = current_generation
+        return next_generation
+
+    def reset(self):
+        self.__changed_tiles = None
+        self.__last_generation = None
+        self.__last_source = None
+
+    def get_skipped_tiles(self) -> int:
+        return self.__skipped_tiles
+
+    def get_changed_tiles(self) -> tuple[np.ndarray, int] | None:
+        if self.__last_generation is None:
+            return None
+        return self.__changed_tiles, self.tile_size
+
+    def get_total_tiles(self) -> int:
+        return 0 if self.__changed_tiles is None else self.__changed_tiles.size
+
+    def __tile_shape(self, shape: tuple[int, int]) -> tuple[int, int]:
+        return -(-shape[0] // self.tile_size), -(-shape[1] // self.tile_size)
+
+    def __dilate(self, tiles: np.ndarray) -> np.ndarray:
+        rows: np.ndarray = tiles | np.roll(tiles, 1, axis=0) | np.roll(tiles, -1, axis=0)
+        if self.topology is Topology.KLEIN_BOTTLE:
+            rows[0] |= tiles[-1].any()
+            rows[-1] |= tiles[0].any()
+        return rows | np.roll(rows, 1, axis=1) | np.roll(rows, -1, axis=1)
+
+    def __find_changed_tiles(self, current_generation: np.ndarray, next_generation: np.ndarray) -> np.ndarray:
+        changed_cells: np.ndarray = current_generation != next_generation
+        changed_rows: np.ndarray = np.logical_or.reduceat(
+            changed_cells, np.arange(0, changed_cells.shape[0], self.tile_size), axis=0)
+        return np.logical_or.reduceat(changed_rows, np.arange(0, changed_cells.shape[1], self.tile_size), axis=1)
+
+    def __step_tiles(self, current_generation: np.ndarray, next_generation: np.ndarray, active_tiles: np.ndarray,
+                     ruleset: Ruleset) -> np.ndarray:
+        transition_table: np.ndarray = NumpyEngine.get_transition_table(ruleset, current_generation.dtype)
+        changed_tiles: np.ndarray = np.zeros_like(active_tiles)
+        if self.__padded is None or self.__padded.shape != (current_generation.shape[0] + 2,
+                                                            current_generation.shape[1] + 2):
+            self.__padded = None
+        self.__padded = Halo.pad(current_generation, self.topology, self.__padded)
+
+        for tile_x, tile_y in np.argwhere(active_tiles):
+            x_start: int = tile_x * self.tile_size
+            y_start: int = tile_y * self.tile_size
+            x_stop: int = min(x_start + self.tile_size, current_generation.shape[0])
+            y_stop: int = min(y_start + self.tile_size, current_generation.shape[1])
+            window: np.ndarray = self.__padded[x_start:x_stop + 2, y_start:y_stop + 2]
+            cell_states: np.ndarray = window[1:-1, 1:-1]
+            neighbours: np.ndarray = (window[:-2, :-2] + window[:-2, 1:-1] + window[:-2, 2:]
+                                      + window[1:-1, :-2] + window[1:-1, 2:]
+                                      + window[2:, :-2] + window[2:, 1:-1] + window[2:, 2:])
+            tile: np.ndarray = transition_table[cell_states, neighbours]
+            changed_tiles[tile_x, tile_y] = np.any(tile != cell_states)
+            next_generation[x_start:x_stop, y_start:y_stop] = tile
+
+        return changed_tiles
+
+
+class JitEngine(NumpyEngine):
+    def __init__(self):
+        super().__init__()
+        self.__kernel = _JitKernel.get()
+        self.__padded: np.ndarray | None = None
+
+    def is_compiled(self) -> bool:
+        return self.__kernel is not None
+
+    def next_generation(self, current_generation: np.ndarray, ruleset: Ruleset,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        if self.__kernel is None:
+            return super().next_generation(current_generation, ruleset, out)
+
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        if self.__padded is None or self.__padded.shape != (current_generation.shape[0] + 2,
+                                                            current_generation.shape[1] + 2):
+            self.__padded = None
+        self.__padded = Halo.pad(current_generation, self.topology, self.__padded)
+        self.__kernel(self.__padded, NumpyEngine.get_transition_table(ruleset, next_generation.dtype), next_generation)
+        return next_generation
+
+
+class _JitKernel:
+    kernel = None
+    failed: bool = False
+
+    @staticmethod
+    def get():
+        try:
+            from jit import step
+        except ImportError:
+            return None
+        if _JitKernel.kernel is None and not _JitKernel.failed:
+            _JitKernel.kernel = _JitKernel.__load(step)
+            _JitKernel.failed = _JitKernel.kernel is None
+        return _JitKernel.kernel
+
+    @staticmethod
+    def __load(kernel):
+        try:
+            kernel(np.zeros((3, 3), dtype=np.uint8), np.zeros((2, 9), dtype=np.uint8), np.zeros((1, 1), dtype=np.uint8))
+        except Exception as err:
+            logging.warning(f'Could not compile the jit engine, falling back to numpy: {err}')
+            return None
+        return kernel
+
+
+class EngineFactory:
+    @staticmethod
+    def get_engine(engine: Engine, workers: int | None = None) -> StepEngine:
+
+        match engine:
+            case Engine.LOOP:
+                return LoopEngine()
+            case Engine.NUMPY:
+                return NumpyEngine()
+            case Engine.PARALLEL:
+                return ParallelEngine(workers)
+            case Engine.TILED:
+                return TiledEngine()
+            case Engine.JIT:
+                return JitEngine()
+            case _:
+                raise ValueError("Invalid engine.")
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from cell import CellState
+from rule import Ruleset
+
+
+class BoardEnsemble:
+    def __init__(self, n_cells_x: int, n_cells_y: int, rulesets: list[Ruleset]):
+        if not rulesets:
+            raise ValueError("An ensemble needs at least one board.")
+        for ruleset in rulesets:
+            if not ruleset.is_outer_totalistic():
+                raise ValueError(f"Ensembles only handle outer totalistic rules: {ruleset.get_rulestring()}.")
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.rulesets: list[Ruleset] = list(rulesets)
+        self.generations: np.ndarray = np.zeros((len(self.rulesets), n_cells_x, n_cells_y), dtype=np.uint8)
+        self.__transition_tables: np.ndarray = np.stack(
+            [ruleset.get_transition_table() for ruleset in self.rulesets]).reshape(-1)
+        self.__table_offsets: np.ndarray = (np.arange(len(self.rulesets), dtype=np.intp) * 18)[:, np.newaxis, np.newaxis]
+
+    def next_generation(self):
+        neighbours: np.ndarray = BoardEnsemble.count_neighbours(self.generations)
+        indices: np.ndarray = neighbours.astype(np.intp)
+        indices += self.__table_offsets
+        indices += self.generations * 9
+        self.generations = self.__transition_tables.take(indices)
+
+    def advance(self, generations: int):
+        for _ in range(generations):
+            self.next_generation()
+
+    def randomize(self, seeds: list[int], density: float = 0.2):
+        if len(seeds) != len(self.rulesets):
+            raise ValueError(f"Expected {len(self.rulesets)} seeds, got {len(seeds)}.")
+        for index, seed in enumerate(seeds):
+            self.generations[index] = np.random.default_rng(seed).random((self.n_cells_x, self.n_cells_y)) < density
+
+    def get_generation(self, index: int) -> np.ndarray:
+        return self.generations[index]
+
+    def set_generation(self, index: int, generation: np.ndarray):
+        self.generations[index] = generation != CellState.DEAD
+
+    def get_populations(self) -> np.ndarray:
+        return np.count_nonzero(self.generations, axis=(1, 2))
+
+    @staticmethod
+    def count_neighbours(generations: np.ndarray) -> np.ndarray:
+        rows: np.ndarray = np.concatenate((generations[:, -1:], generations, generations[:, :1]), axis=1)
+        columns: np.ndarray = rows[:, :-2] + rows[:, 1:-1] + rows[:, 2:]
+        return columns + np.roll(columns, 1, axis=2) + np.roll(columns, -1, axis=2) - generations
+
+
+@dataclass
+class SweepResult:
+    rulestrings: list[str]
+    seeds: list[int]
+    populations: np.ndarray
+    final_generations: np.ndarray
+
+    def get_survivors(self) -> np.ndarray:
+        return self.populations[:, :, -1] > 0
+
+
+class SweepRunner:
+    def __init__(self, n_cells_x: int, n_cells_y: int, batch_size: int = 1024, density: float = 0.2):
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.batch_size: int = batch_size
+        self.density: float = density
+
+    def run(self, rulesets: list[Ruleset], seeds: list[int], generations: int) -> SweepResult:
+        n_boards: int = len(rulesets) * len(seeds)
+        populations: np.ndarray = np.zeros((n_boards, generations + 1), dtype=np.int64)
+        final_generations: np.ndarray = np.zeros((n_boards, self.n_cells_x, self.n_cells_y), dtype=np.uint8)
+
+        for start in range(0, n_boards, self.batch_size):
+            stop: int = min(start + self.batch_size, n_boards)
+            ensemble: BoardEnsemble = BoardEnsemble(self.n_cells_x, self.n_cells_y,
+                                                    [rulesets[index // len(seeds)] for index in range(start, stop)])
+            ensemble.randomize([seeds[index % len(seeds)] for index in range(start, stop)], self.density)
+            populations[start:stop, 0] = ensemble.get_populations()
+            for generation in range(1, generations + 1):
+                ensemble.next_generation()
+                populations[start:stop, generation] = ensemble.get_populations()
+            final_generations[start:stop] = ensemble.generations
+
+        return SweepResult([ruleset.get_rulestring() for ruleset in rulesets], list(seeds),
+                           populations.reshape(len(rulesets), len(seeds), generations + 1),
+                           final_generations.reshape(len(rulesets), len(seeds), self.n_cells_x, self.n_cells_y))
@@ -4,115 +4,196 @@ import logging
 import pygame
 
 from board import Board, BoardPersistence
+from camera import Camera
+from cycle import CycleDetector
+from engine import Engine, EngineFactory, StepEngine
+from history import History
+from instrumentation import Phase, Profiler, measure
+from packed import PackedBoard
+from regions import RegionStatistics
 from rule import Rule, Ruleset, RulesetFactory
+from simulation import Simulation
+from topology import Topology
 from ui import RendererSettings, PygameRenderer, Color, Button, ButtonFactory
 
-logging.root.setLevel(logging.NOTSET)
-
-parser: argparse = argparse.ArgumentParser(description='Game Of Life')
-parser.add_argument('-r', '--ruleset', required=False, type=str,
-                    help='Custom ruleset in birth/survival notation. Example: B3/S23.')
-args = parser.parse_args()
-
-pygame.init()
-pygame.display.set_caption("Game of life")
-clock: pygame.time.Clock = pygame.time.Clock()
-
-width, height = 1000, 1000
-screen = pygame.display.set_mode((width, height))
-
-n_cells_x, n_cells_y = 100, 100
-cell_width = width // n_cells_x
-cell_height = height // n_cells_y
-
-button_factory: ButtonFactory = ButtonFactory(height)
-
-if args.ruleset is not None:
-    ruleset: Ruleset = RulesetFactory.get_custom_ruleset(args.ruleset)
-else:
-    ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
-
-ruleset_name: str = ruleset.get_name() if ruleset.get_rule() is not Rule.CUSTOM else ruleset.get_rulestring()
-
-next_generation_button: Button = button_factory.create_button((width - 200) // 2, 200, Color.MUTED, "Next generation",
-                                                              Color.TEXT)
-start_stop_button: Button = button_factory.create_button(10, 130, Color.PINE, "Start", Color.BASE)
-clear_button: Button = button_factory.create_button(150, 70, Color.MUTED,
-                                                    "Clear", Color.TEXT)
-randomize_button: Button = button_factory.create_button(230, 160, Color.MUTED,
-                                                        "Randomize", Color.TEXT)
-rule_button: Button = button_factory.create_button(610, 380, Color.MUTED,
-                                                   ruleset_name, Color.TEXT)
-
-board: Board = Board(n_cells_x, n_cells_y, ruleset)
-renderer_settings: RendererSettings = RendererSettings(height, width, n_cells_x, n_cells_y, cell_height, cell_width)
-renderer: PygameRenderer = PygameRenderer(screen, renderer_settings,
-                                          [next_generation_button, start_stop_button, clear_button,
-                                           randomize_button, rule_button])
-
-running = True
-paused: bool = True
-while running:
-    renderer.draw(board.current_generation)
-    if not paused:
-        board.next_generation()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if next_generation_button.is_clicked(event.pos[0], event.pos[1]):
-                if paused:
-                    board.next_generation()
-                break
-            if start_stop_button.is_clicked(event.pos[0], event.pos[1]):
-                if paused:
-                    paused = False
-                    start_stop_button.label = "Stop"
-                    start_stop_button.color = Color.ROSE
-                else:
-                    paused = True
-                    start_stop_button.label = "Start"
-                    start_stop_button.color = Color.PINE
-                break
-            if clear_button.is_clicked(event.pos[0], event.pos[1]):
-                board.clear()
-                paused = True
-                start_stop_button.label = "Start"
-                start_stop_button.color = Color.PINE
-                break
-            if randomize_button.is_clicked(event.pos[0], event.pos[1]):
-                board.randomize()
-                break
-            if rule_button.is_clicked(event.pos[0], event.pos[1]):
-                if event.button == 1:
-                    ruleset = RulesetFactory.get_ruleset(ruleset.get_rule().next())
-                if event.button == 3:
-                    ruleset = RulesetFactory.get_ruleset(ruleset.get_rule().previous())
-                rule_button.label = ruleset.get_name()
-                board.update_ruleset(ruleset)
-            else:
-                x, y = event.pos[0] // cell_width, event.pos[1] // cell_height
-                board.change_cell_state(x, y)
-                break
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_s:
-                BoardPersistence.save(board)
-            if event.key == pygame.K_l:
-                try:
-                    new_ruleset: str = BoardPersistence.load(board)
-                    ruleset = RulesetFactory.get_custom_ruleset(new_ruleset)
-                    board.update_ruleset(ruleset)
-                    paused = True
-                    start_stop_button.label = "Start"
-                    start_stop_button.color = Color.PINE
-                    rule_button.label = new_ruleset
-                except IOError as err:
-                    logging.warning(err)
-                except ValueError as err:
-                    logging.warning(err)
-
-                break
-    clock.tick(60)
-
-pygame.quit()
+
+def main():
+    logging.root.setLevel(logging.NOTSET)
+
+    parser: argparse = argparse.ArgumentParser(description='Game Of Life')
+    parser.add_argument('-r', '--ruleset', required=False, type=str,
+                        help='Custom ruleset in birth/survival, Generations, Larger than Life or Hensel notation. '
+                             'Examples: B3/S23, B2/S/C3, R5,C0,M1,S34..58,B34..45,NM, B2-a/S12.')
+    parser.add_argument('-e', '--engine', required=False, type=str, default=Engine.NUMPY.name.lower(),
+                        choices=[engine.name.lower() for engine in Engine],
+                        help='Engine used to compute next generations. Default: numpy.')
+    parser.add_argument('-w', '--workers', required=False, type=int,
+                        help='Worker processes of the parallel engine. Default: one per CPU.')
+    parser.add_argument('-p', '--packed', action='store_true',
+                        help='Store the board bit-packed, 64 cells per word, and step it with bitwise operations.')
+    parser.add_argument('-g', '--generations-per-second', required=False, type=float,
+                        help='Step the board in a background thread at this rate, 0 for as fast as possible. '
+                             'By default one generation is computed per frame.')
+    parser.add_argument('--profile', required=False, type=int, metavar='N',
+                        help='Time the step, render and event phases and log a summary every N generations.')
+    parser.add_argument('--stop-on-cycle', required=False, type=int, metavar='P',
+                        help='Pause once the board dies out, settles or repeats with a period of at most P generations.')
+    parser.add_argument('-x', '--cells-x', required=False, type=int, default=100,
+                        help='Cells in x. Boards larger than the window are explored by panning and zooming. Default: 100.')
+    parser.add_argument('-y', '--cells-y', required=False, type=int, default=100, help='Cells in y. Default: 100.')
+    parser.add_argument('-t', '--topology', required=False, type=str, default=Topology.TORUS.name.lower(),
+                        choices=[topology.name.lower() for topology in Topology],
+                        help='How the edges of the board connect. An infinite board grows as live cells reach its edge. '
+                             'Default: torus.')
+    parser.add_argument('--history-mb', required=False, type=int, default=64, metavar='MB',
+                        help='Memory kept for stepping back through past generations with backspace. Default: 64.')
+    args = parser.parse_args()
+    if args.packed and Topology[args.topology.upper()] is not Topology.TORUS:
+        parser.error('Packed boards only support the torus topology.')
+
+    pygame.init()
+    pygame.display.set_caption("Game of life")
+    clock: pygame.time.Clock = pygame.time.Clock()
+
+    width, height = 1000, 1000
+    screen = pygame.display.set_mode((width, height))
+
+    n_cells_x, n_cells_y = args.cells_x, args.cells_y
+    cell_width = max(1, width // n_cells_x)
+    cell_height = max(1, height // n_cells_y)
+    camera: Camera = Camera(n_cells_x, n_cells_y, width, height)
+
+    button_factory: ButtonFactory = ButtonFactory(height)
+
+    if args.ruleset is not None:
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset(args.ruleset)
+    else:
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    ruleset_name: str = ruleset.get_name() if ruleset.get_rule() is not Rule.CUSTOM else ruleset.get_rulestring()
+
+    next_generation_button: Button = button_factory.create_button((width - 200) // 2, 200, Color.MUTED, "Next generation",
+                                                                  Color.TEXT)
+    start_stop_button: Button = button_factory.create_button(10, 130, Color.PINE, "Start", Color.BASE)
+    clear_button: Button = button_factory.create_button(150, 70, Color.MUTED,
+                                                        "Clear", Color.TEXT)
+    randomize_button: Button = button_factory.create_button(230, 160, Color.MUTED,
+                                                            "Randomize", Color.TEXT)
+    rule_button: Button = button_factory.create_button(610, 380, Color.MUTED,
+                                                       ruleset_name, Color.TEXT)
+
+    if args.packed:
+        board: Board = PackedBoard(n_cells_x, n_cells_y, ruleset)
+    else:
+        engine: StepEngine = EngineFactory.get_engine(Engine[args.engine.upper()], args.workers)
+        board: Board = Board(n_cells_x, n_cells_y, ruleset, engine, Topology[args.topology.upper()])
+    renderer_settings: RendererSettings = RendererSettings(height, width, n_cells_x, n_cells_y, cell_height, cell_width)
+    renderer: PygameRenderer = PygameRenderer(screen, renderer_settings,
+                                              [next_generation_button, start_stop_button, clear_button,
+                                               randomize_button, rule_button])
+
+    profiler: Profiler | None = Profiler(args.profile) if args.profile is not None else None
+    board.set_profiler(profiler)
+    statistics: RegionStatistics | None = None if args.packed else RegionStatistics(n_cells_x, n_cells_y)
+    board.set_statistics(statistics)
+
+    cycle_detector: CycleDetector | None = CycleDetector(args.stop_on_cycle) if args.stop_on_cycle is not None else None
+    simulation: Simulation = Simulation(board, args.generations_per_second is not None, args.generations_per_second or 0,
+                                        cycle_detector, camera.get_region, History(max_bytes=args.history_mb << 20))
+    simulation.start()
+
+    def pause_simulation():
+        simulation.pause()
+        start_stop_button.label = "Start"
+        start_stop_button.color = Color.PINE
+
+    running = True
+    while running:
+        hud_text: str = (f'generation {simulation.generation} | {simulation.get_generations_per_second():.1f} gen/s | '
+                         f'{clock.get_fps():.1f} FPS')
+        if statistics is not None:
+            hud_text = f'{hud_text} | population {statistics.get_population()}'
+        if profiler is not None and profiler.get_last_summary():
+            hud_text = f'{hud_text} | {profiler.get_last_summary()}'
+        if simulation.cycle is not None:
+            hud_text = f'{hud_text} | {simulation.cycle.describe()}'
+            if start_stop_button.label == "Stop":
+                pause_simulation()
+        with measure(profiler, Phase.RENDER):
+            renderer.draw(simulation.get_latest_generation(), hud_text, camera)
+        simulation.update()
+
+        with measure(profiler, Phase.EVENTS):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.MOUSEWHEEL:
+                    simulation.refresh(lambda: camera.zoom_at(1.25 ** event.y, *pygame.mouse.get_pos()))
+                if event.type == pygame.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+                    simulation.refresh(lambda: camera.pan(*event.rel))
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 2, 3):
+                    if next_generation_button.is_clicked(event.pos[0], event.pos[1]):
+                        if simulation.is_paused():
+                            simulation.step()
+                        break
+                    if start_stop_button.is_clicked(event.pos[0], event.pos[1]):
+                        if simulation.is_paused():
+                            simulation.resume()
+                            start_stop_button.label = "Stop"
+                            start_stop_button.color = Color.ROSE
+                        else:
+                            pause_simulation()
+                        break
+                    if clear_button.is_clicked(event.pos[0], event.pos[1]):
+                        simulation.execute(lambda board: board.clear())
+                        pause_simulation()
+                        break
+                    if randomize_button.is_clicked(event.pos[0], event.pos[1]):
+                        simulation.execute(lambda board: board.randomize())
+                        break
+                    if rule_button.is_clicked(event.pos[0], event.pos[1]):
+                        if event.button == 1:
+                            ruleset = RulesetFactory.get_ruleset(ruleset.get_rule().next())
+                        if event.button == 3:
+                            ruleset = RulesetFactory.get_ruleset(ruleset.get_rule().previous())
+                        rule_button.label = ruleset.get_name()
+                        simulation.execute(lambda current_board: current_board.update_ruleset(ruleset))
+                    elif event.button == 1 and camera.screen_to_cell(*event.pos) is not None:
+                        x, y = camera.screen_to_cell(*event.pos)
+                        simulation.execute(lambda current_board: current_board.change_cell_state(x, y))
+                        break
+                if event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
+                        dx: int = {pygame.K_LEFT: width // 4, pygame.K_RIGHT: -width // 4}.get(event.key, 0)
+                        dy: int = {pygame.K_UP: height // 4, pygame.K_DOWN: -height // 4}.get(event.key, 0)
+                        simulation.refresh(lambda: camera.pan(dx, dy))
+                    if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_MINUS, pygame.K_KP_MINUS):
+                        factor: float = 2.0 if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS) else 0.5
+                        simulation.refresh(lambda: camera.zoom_at(factor, width / 2, height / 2))
+                    if event.key == pygame.K_BACKSPACE:
+                        pause_simulation()
+                        simulation.step_back()
+                    if event.key == pygame.K_s:
+                        with measure(profiler, Phase.IO):
+                            simulation.execute(BoardPersistence.save)
+                    if event.key == pygame.K_l:
+                        pause_simulation()
+                        try:
+                            with measure(profiler, Phase.IO):
+                                new_ruleset: str = simulation.execute(BoardPersistence.load)
+                            ruleset = RulesetFactory.get_custom_ruleset(new_ruleset)
+                            rule_button.label = new_ruleset
+                        except IOError as err:
+                            logging.warning(err)
+                        except ValueError as err:
+                            logging.warning(err)
+
+                        break
+        clock.tick(60)
+
+    simulation.stop()
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
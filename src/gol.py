@@ -0,0 +1,332 @@
+import argparse
+import json
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, asdict
+from enum import Enum
+
+import numpy as np
+
+from board import Board, BoardPersistence
+from cycle import Cycle, CycleDetector
+from engine import Engine, EngineFactory
+from rule import Rule, Ruleset, RulesetFactory
+from topology import Topology
+
+
+class BoardType(Enum):
+    DENSE = 0
+    PACKED = 1
+    SPARSE = 2
+    DISK = 3
+
+
+@dataclass
+class RunStatistics:
+    generations: int
+    seconds: float
+    generations_per_second: float
+    cells_per_second: float
+    n_cells_x: int
+    n_cells_y: int
+    population: int
+    stepped_generations: int | None = None
+    cycle: str | None = None
+    cycle_period: int | None = None
+
+
+class HeadlessRunner:
+    def __init__(self, board: Board, cycle_detector: CycleDetector | None = None, fast_forward: bool = False):
+        self.board = board
+        self.cycle_detector: CycleDetector | None = cycle_detector
+        self.fast_forward: bool = fast_forward
+
+    def run(self, generations: int) -> RunStatistics:
+        start: float = time.perf_counter()
+        generation: int = 0
+        cycle: Cycle | None = self.__observe(generation)
+        while generation < generations and cycle is None:
+            self.board.next_generation()
+            generation += 1
+            cycle = self.__observe(generation)
+
+        stepped_generations: int = generation
+        if cycle is not None and self.fast_forward:
+            for _ in range(cycle.get_remaining_generations(generation, generations)):
+                self.board.next_generation()
+                stepped_generations += 1
+            generation = generations
+        seconds: float = time.perf_counter() - start
+
+        generations_per_second: float = stepped_generations / seconds if seconds > 0 else float('inf')
+        return RunStatistics(generation, seconds, generations_per_second,
+                             generations_per_second * self.board.n_cells_x * self.board.n_cells_y,
+                             self.board.n_cells_x, self.board.n_cells_y,
+                             self.board.get_population(), stepped_generations,
+                             cycle.describe() if cycle is not None else None,
+                             cycle.period if cycle is not None else None)
+
+    def __observe(self, generation: int) -> Cycle | None:
+        return self.cycle_detector.observe(self.board, generation) if self.cycle_detector is not None else None
+
+
+class BoardFactory:
+    @staticmethod
+    def create_board(board_type: BoardType, n_cells_x: int, n_cells_y: int, ruleset: Ruleset,
+                     engine: Engine = Engine.NUMPY, max_memory_bytes: int = 256 << 20,
+                     workers: int | None = None) -> Board:
+
+        match board_type:
+            case BoardType.DENSE:
+                return Board(n_cells_x, n_cells_y, ruleset, EngineFactory.get_engine(engine, workers))
+            case BoardType.PACKED:
+                from packed import PackedBoard
+                return PackedBoard(n_cells_x, n_cells_y, ruleset)
+            case BoardType.SPARSE:
+                from sparse import SparseBoard
+                return SparseBoard(n_cells_x, n_cells_y, ruleset)
+            case BoardType.DISK:
+                from disk import DiskBoard
+                return DiskBoard(n_cells_x, n_cells_y, ruleset, max_memory_bytes=max_memory_bytes)
+            case _:
+                raise ValueError("Invalid board type.")
+
+
+def load_board(args: argparse.Namespace) -> Board:
+    ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+    if args.ruleset is not None:
+        ruleset = RulesetFactory.get_custom_ruleset(args.ruleset)
+
+    board: Board = BoardFactory.create_board(BoardType[args.board.upper()], args.width, args.height, ruleset,
+                                             Engine[args.engine.upper()], args.memory_mb << 20, args.workers)
+    board.set_topology(Topology[args.topology.upper()])
+    if args.pattern is not None:
+        BoardPersistence.load(board, args.pattern)
+        if args.ruleset is not None:
+            board.update_ruleset(ruleset)
+    else:
+        board.randomize()
+    return board
+
+
+def run(args: argparse.Namespace):
+    board: Board = load_board(args)
+    cycle_detector: CycleDetector | None = CycleDetector(args.max_period) if args.on_cycle != 'continue' else None
+    statistics: RunStatistics = HeadlessRunner(board, cycle_detector, args.on_cycle == 'fast-forward').run(
+        args.generations)
+    if statistics.cycle is not None:
+        logging.info(f'Detected {statistics.cycle}, {args.on_cycle.replace("-", " ")} '
+                     f'after {statistics.stepped_generations} stepped generations')
+    logging.info(f'{statistics.generations} generations of {statistics.n_cells_x}x{statistics.n_cells_y} '
+                 f'in {statistics.seconds:.3f} s: {statistics.generations_per_second:.2f} gen/s, '
+                 f'{statistics.cells_per_second:.3e} cells/s, population {statistics.population}')
+
+    if args.output is not None:
+        BoardPersistence.save(board, args.output)
+    if args.stats is not None:
+        with open(args.stats, 'w') as writer:
+            json.dump(asdict(statistics), writer, indent=2)
+
+
+def record(args: argparse.Namespace):
+    from recording import FrameSink, GifWriter, NpyFrameWriter, PbmSequenceWriter, PopulationCsvWriter, Recorder
+
+    sinks: list[FrameSink] = []
+    if args.npy is not None:
+        sinks.append(NpyFrameWriter(args.npy))
+    if args.csv is not None:
+        sinks.append(PopulationCsvWriter(args.csv))
+    if args.gif is not None:
+        sinks.append(GifWriter(args.gif, args.delay, args.scale))
+    if args.frames is not None:
+        sinks.append(PbmSequenceWriter(args.frames))
+    if not sinks:
+        raise ValueError("Nothing to record, pass at least one of --npy, --csv, --gif or --frames.")
+
+    board: Board = load_board(args)
+    start: float = time.perf_counter()
+    n_frames: int = Recorder(sinks).record(board.iter_generations(args.generations, args.every))
+    logging.info(f'Recorded {n_frames} frames of {args.generations} generations in '
+                 f'{time.perf_counter() - start:.3f} s')
+
+
+def serve(args: argparse.Namespace):
+    import asyncio
+
+    from server import SimulationServer
+    from simulation import Simulation
+
+    simulation: Simulation = Simulation(load_board(args), True, args.generations_per_second)
+    server: SimulationServer = SimulationServer(simulation, args.frames_per_second)
+
+    async def listen():
+        if args.unix is not None:
+            await server.start_unix(args.unix)
+        else:
+            await server.start(args.host, args.port)
+        logging.info(f'Serving a {simulation.board.n_cells_x}x{simulation.board.n_cells_y} board on '
+                     f'{args.unix or f"{args.host}:{server.get_port()}"}')
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    simulation.start()
+    try:
+        asyncio.run(listen())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulation.stop()
+
+
+def census(args: argparse.Namespace):
+    from census import Census
+    from ensemble import SweepResult, SweepRunner
+
+    ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+    if args.ruleset is not None:
+        ruleset = RulesetFactory.get_custom_ruleset(args.ruleset)
+    seeds: list[int] = list(range(args.first_seed, args.first_seed + args.seeds))
+
+    start: float = time.perf_counter()
+    result: SweepResult = SweepRunner(args.width, args.height, args.batch_size).run([ruleset], seeds, args.generations)
+    counts: Counter[str] = sum(Census(ruleset).take_all(result.final_generations[0]), Counter())
+    seconds: float = time.perf_counter() - start
+    logging.info(f'{len(seeds)} soups of {args.width}x{args.height} after {args.generations} generations '
+                 f'in {seconds:.3f} s: {counts.total()} objects')
+    for name, count in counts.most_common():
+        logging.info(f'{count:>8} {name}')
+
+    if args.output is not None:
+        with open(args.output, 'w') as writer:
+            json.dump(dict(counts.most_common()), writer, indent=2)
+
+
+def sweep(args: argparse.Namespace):
+    from ensemble import SweepResult, SweepRunner
+
+    rulesets: list[Ruleset] = [RulesetFactory.get_ruleset(Rule[rule.upper()]) for rule in args.rules]
+    rulesets += [RulesetFactory.get_custom_ruleset(rulestring) for rulestring in args.rulestrings or []]
+    seeds: list[int] = list(range(args.first_seed, args.first_seed + args.seeds))
+
+    start: float = time.perf_counter()
+    result: SweepResult = SweepRunner(args.width, args.height, args.batch_size).run(rulesets, seeds, args.generations)
+    seconds: float = time.perf_counter() - start
+    logging.info(f'{len(rulesets) * len(seeds)} boards of {args.width}x{args.height}, {args.generations} generations '
+                 f'in {seconds:.3f} s')
+    for rulestring, survivors, populations in zip(result.rulestrings, result.get_survivors(), result.populations):
+        logging.info(f'{rulestring}: {survivors.mean():.1%} alive, mean final population {populations[:, -1].mean():.1f}')
+
+    if args.output is not None:
+        np.savez_compressed(args.output, rulestrings=np.array(result.rulestrings), seeds=np.array(result.seeds),
+                            populations=result.populations, final_generations=result.final_generations)
+
+
+def main(argv: list[str] | None = None):
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='gol', description='Headless Game Of Life')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    board_parser: argparse.ArgumentParser = argparse.ArgumentParser(add_help=False)
+    board_parser.add_argument('-p', '--pattern', type=str, help='Pattern file to load. Random board if omitted.')
+    board_parser.add_argument('-r', '--ruleset', type=str,
+                              help='Custom ruleset in birth/survival, Generations, Larger than Life or Hensel '
+                                   'notation. Defaults to the pattern ruleset or B3/S23.')
+    board_parser.add_argument('-x', '--width', type=int, default=100,
+                              help='Cells in x of a random board. Default: 100.')
+    board_parser.add_argument('-y', '--height', type=int, default=100,
+                              help='Cells in y of a random board. Default: 100.')
+    board_parser.add_argument('-b', '--board', type=str, default=BoardType.DENSE.name.lower(),
+                              choices=[board_type.name.lower() for board_type in BoardType],
+                              help='Board representation. Default: dense.')
+    board_parser.add_argument('-e', '--engine', type=str, default=Engine.NUMPY.name.lower(),
+                              choices=[engine.name.lower() for engine in Engine],
+                              help='Engine used by a dense board. Default: numpy.')
+    board_parser.add_argument('-w', '--workers', type=int,
+                              help='Worker processes of the parallel engine. Default: one per CPU.')
+    board_parser.add_argument('--memory-mb', type=int, default=256,
+                              help='Megabytes of rows a disk board reads and writes per step. Default: 256.')
+    board_parser.add_argument('-t', '--topology', type=str, default=Topology.TORUS.name.lower(),
+                              choices=[topology.name.lower() for topology in Topology],
+                              help='How the edges of a dense board connect. An infinite board doubles in size as '
+                                   'live cells reach its edge. Default: torus.')
+
+    run_parser: argparse.ArgumentParser = subparsers.add_parser('run', parents=[board_parser],
+                                                                help='Run generations without a display.')
+    run_parser.add_argument('-g', '--generations', type=int, default=1000, help='Generations to run. Default: 1000.')
+    run_parser.add_argument('-o', '--output', type=str, help='File the final generation is saved to.')
+    run_parser.add_argument('--on-cycle', type=str, default='continue', choices=['continue', 'stop', 'fast-forward'],
+                            help='What to do once the board dies out, settles or repeats: keep stepping, stop, or '
+                                 'step only the generations left modulo the period. Default: continue.')
+    run_parser.add_argument('--max-period', type=int, default=16,
+                            help='Longest oscillator period detected. Default: 16.')
+    run_parser.add_argument('-s', '--stats', type=str, help='File the run statistics are written to as JSON.')
+    run_parser.set_defaults(handler=run)
+
+    record_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'record', parents=[board_parser], help='Run generations and stream every k-th one to files.')
+    record_parser.add_argument('-g', '--generations', type=int, default=1000,
+                               help='Generations to run. Default: 1000.')
+    record_parser.add_argument('-k', '--every', type=int, default=1, help='Record every k-th generation. Default: 1.')
+    record_parser.add_argument('--npy', type=str,
+                               help='.npy file the frames are appended to, loadable with mmap_mode="r".')
+    record_parser.add_argument('--csv', type=str, help='CSV file of population, births and deaths per frame.')
+    record_parser.add_argument('--gif', type=str, help='Animated GIF the frames are appended to.')
+    record_parser.add_argument('--delay', type=int, default=5,
+                               help='Delay between GIF frames in hundredths of a second. Default: 5.')
+    record_parser.add_argument('--scale', type=int, default=1, help='Pixels per cell in the GIF. Default: 1.')
+    record_parser.add_argument('--frames', type=str, help='Directory a PBM image per frame is written to.')
+    record_parser.set_defaults(handler=record)
+
+    sweep_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'sweep', help='Step many random boards per ruleset together and record their populations.')
+    sweep_parser.add_argument('-R', '--rules', type=str, nargs='*', default=[Rule.CONWAYS_LIFE.name.lower()],
+                              choices=[rule.name.lower() for rule in Rule if rule is not Rule.CUSTOM],
+                              help='Predefined rules to sweep. Default: conways_life.')
+    sweep_parser.add_argument('-r', '--rulestrings', type=str, nargs='*',
+                              help='Custom rulesets in birth/survival notation to sweep as well.')
+    sweep_parser.add_argument('-n', '--seeds', type=int, default=1000, help='Random seeds per ruleset. Default: 1000.')
+    sweep_parser.add_argument('--first-seed', type=int, default=0, help='First random seed. Default: 0.')
+    sweep_parser.add_argument('-g', '--generations', type=int, default=100, help='Generations to run. Default: 100.')
+    sweep_parser.add_argument('-x', '--width', type=int, default=32, help='Cells in x of every board. Default: 32.')
+    sweep_parser.add_argument('-y', '--height', type=int, default=32, help='Cells in y of every board. Default: 32.')
+    sweep_parser.add_argument('--batch-size', type=int, default=1024,
+                              help='Boards stepped together in one call. Default: 1024.')
+    sweep_parser.add_argument('-o', '--output', type=str,
+                              help='.npz file the population curves and final generations are written to.')
+    sweep_parser.set_defaults(handler=sweep)
+
+    serve_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'serve', parents=[board_parser], help='Serve one simulation to several clients over a socket.')
+    serve_parser.add_argument('--host', type=str, default='127.0.0.1', help='Address to listen on. Default: 127.0.0.1.')
+    serve_parser.add_argument('--port', type=int, default=7777, help='TCP port to listen on. Default: 7777.')
+    serve_parser.add_argument('--unix', type=str, help='Listen on this Unix socket path instead of TCP.')
+    serve_parser.add_argument('-g', '--generations-per-second', type=float, default=0.0,
+                              help='Rate the board is stepped at once started, 0 for as fast as possible. Default: 0.')
+    serve_parser.add_argument('-f', '--frames-per-second', type=float, default=30.0,
+                              help='Rate updates are sent to subscribers at. Default: 30.')
+    serve_parser.set_defaults(handler=serve)
+
+    census_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'census', help='Settle random soups and count the objects they contain.')
+    census_parser.add_argument('-r', '--ruleset', type=str,
+                               help='Custom ruleset in birth/survival notation. Default: B3/S23.')
+    census_parser.add_argument('-n', '--seeds', type=int, default=1000, help='Random soups. Default: 1000.')
+    census_parser.add_argument('--first-seed', type=int, default=0, help='First random seed. Default: 0.')
+    census_parser.add_argument('-g', '--generations', type=int, default=1000,
+                               help='Generations each soup settles for. Default: 1000.')
+    census_parser.add_argument('-x', '--width', type=int, default=16, help='Cells in x of every soup. Default: 16.')
+    census_parser.add_argument('-y', '--height', type=int, default=16, help='Cells in y of every soup. Default: 16.')
+    census_parser.add_argument('--batch-size', type=int, default=1024,
+                               help='Soups stepped together in one call. Default: 1024.')
+    census_parser.add_argument('-o', '--output', type=str, help='File the object counts are written to as JSON.')
+    census_parser.set_defaults(handler=census)
+
+    args: argparse.Namespace = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import bisect
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+
+
+@dataclass
+class _Segment:
+    generation: int
+    shape: tuple[int, int]
+    keyframe: bytes
+    deltas: list[bytes] = field(default_factory=list)
+    size: int = 0
+
+    def get_last_generation(self) -> int:
+        return self.generation + len(self.deltas)
+
+
+class History:
+    def __init__(self, keyframe_interval: int = 64, max_bytes: int = 64 << 20, compression_level: int = 1):
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be at least 1.")
+        self.keyframe_interval: int = keyframe_interval
+        self.max_bytes: int = max_bytes
+        self.compression_level: int = compression_level
+        self.__segments: deque[_Segment] = deque()
+        self.__last: np.ndarray | None = None
+        self.__size: int = 0
+
+    def record(self, board: Board, generation: int):
+        if self.__segments and generation <= self.get_last_generation():
+            self.truncate(generation - 1)
+
+        shape: tuple[int, int] = (board.n_cells_x, board.n_cells_y)
+        packed: np.ndarray = np.packbits(board.get_current_generation() != CellState.DEAD)
+        segment: _Segment | None = self.__segments[-1] if self.__segments else None
+        if (segment is None or segment.shape != shape or generation != segment.get_last_generation() + 1
+                or len(segment.deltas) + 1 >= self.keyframe_interval):
+            segment = _Segment(generation, shape, self.__compress(packed))
+            segment.size = len(segment.keyframe)
+            self.__segments.append(segment)
+            self.__size += segment.size
+        else:
+            delta: bytes = self.__compress(np.bitwise_xor(self.__last, packed))
+            segment.deltas.append(delta)
+            segment.size += len(delta)
+            self.__size += len(delta)
+        self.__last = packed
+        self.__evict()
+
+    def seek(self, generation: int) -> np.ndarray:
+        segment: _Segment = self.__find_segment(generation)
+        packed: np.ndarray = self.__replay(segment, generation)
+        return np.unpackbits(packed, count=segment.shape[0] * segment.shape[1]).reshape(segment.shape)
+
+    def restore(self, board: Board, generation: int):
+        board.set_current_generation(self.seek(generation))
+
+    def truncate(self, generation: int):
+        while self.__segments and self.__segments[-1].generation > generation:
+            self.__size -= self.__segments.pop().size
+        if not self.__segments:
+            self.__last = None
+            return
+
+        segment: _Segment = self.__segments[-1]
+        while segment.get_last_generation() > generation:
+            delta: bytes = segment.deltas.pop()
+            segment.size -= len(delta)
+            self.__size -= len(delta)
+        self.__last = self.__replay(segment, segment.get_last_generation())
+
+    def clear(self):
+        self.__segments.clear()
+        self.__last = None
+        self.__size = 0
+
+    def contains(self, generation: int) -> bool:
+        return bool(self.__segments) and self.get_first_generation() <= generation <= self.get_last_generation()
+
+    def get_first_generation(self) -> int:
+        if not self.__segments:
+            raise ValueError("History is empty.")
+        return self.__segments[0].generation
+
+    def get_last_generation(self) -> int:
+        if not self.__segments:
+            raise ValueError("History is empty.")
+        return self.__segments[-1].get_last_generation()
+
+    def get_size(self) -> int:
+        return self.__size
+
+    def get_keyframe_count(self) -> int:
+        return len(self.__segments)
+
+    def __find_segment(self, generation: int) -> _Segment:
+        if not self.contains(generation):
+            raise ValueError(f"Generation {generation} is not in the history.")
+        index: int = bisect.bisect_right(self.__segments, generation, key=lambda segment: segment.generation) - 1
+        return self.__segments[index]
+
+    def __replay(self, segment: _Segment, generation: int) -> np.ndarray:
+        packed: np.ndarray = self.__decompress(segment.keyframe)
+        for delta in segment.deltas[:generation - segment.generation]:
+            np.bitwise_xor(packed, self.__decompress(delta), out=packed)
+        return packed
+
+    def __evict(self):
+        while self.__size > self.max_bytes and len(self.__segments) > 1:
+            self.__size -= self.__segments.popleft().size
+
+    def __compress(self, packed: np.ndarray) -> bytes:
+        return zlib.compress(packed.tobytes(), self.compression_level)
+
+    @staticmethod
+    def __decompress(data: bytes) -> np.ndarray:
+        return np.frombuffer(zlib.decompress(data), dtype=np.uint8).copy()
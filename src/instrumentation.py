@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, ContextManager, Iterator
+
+import numpy as np
+
+
+class Phase(Enum):
+    STEP = 'step'
+    NEIGHBOURS = 'neighbours'
+    RULES = 'rules'
+    SWAP = 'swap'
+    RENDER = 'render'
+    EVENTS = 'events'
+    IO = 'io'
+
+
+@dataclass
+class GenerationStatistics:
+    generation: int
+    population: int
+    births: int
+    deaths: int
+
+
+class Profiler:
+    def __init__(self, summary_interval: int = 0):
+        self.summary_interval: int = summary_interval
+        self.generation: int = 0
+        self.last_statistics: GenerationStatistics | None = None
+        self.__lock: threading.Lock = threading.Lock()
+        self.__seconds: dict[Phase, float] = {}
+        self.__calls: dict[Phase, int] = {}
+        self.__hooks: list[Callable[[GenerationStatistics], None]] = []
+        self.__summary: str = ''
+
+    def add_hook(self, hook: Callable[[GenerationStatistics], None]):
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[GenerationStatistics], None]):
+        self.__hooks.remove(hook)
+
+    def record(self, phase: Phase, seconds: float):
+        with self.__lock:
+            self.__seconds[phase] = self.__seconds.get(phase, 0.0) + seconds
+            self.__calls[phase] = self.__calls.get(phase, 0) + 1
+
+    @contextmanager
+    def measure(self, phase: Phase) -> Iterator[None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def end_generation(self, population: int, births: int, deaths: int):
+        self.generation += 1
+        self.last_statistics = GenerationStatistics(self.generation, population, births, deaths)
+        for hook in self.__hooks:
+            hook(self.last_statistics)
+
+        if self.summary_interval > 0 and self.generation % self.summary_interval == 0:
+            self.__summary = self.get_summary()
+            logging.info(self.__summary)
+            self.reset()
+
+    def get_average_seconds(self) -> dict[Phase, float]:
+        with self.__lock:
+            return {phase: self.__seconds[phase] / self.__calls[phase] for phase in self.__seconds}
+
+    def get_summary(self) -> str:
+        timings: str = ', '.join(f'{phase.value} {seconds * 1000:.2f} ms'
+                                 for phase, seconds in self.get_average_seconds().items())
+        statistics: GenerationStatistics | None = self.last_statistics
+        counters: str = (f'population {statistics.population}, births {statistics.births}, deaths {statistics.deaths}'
+                         if statistics is not None else 'no generations')
+        return f'generation {self.generation}: {timings or "no timings"}; {counters}'
+
+    def get_last_summary(self) -> str:
+        return self.__summary
+
+    def reset(self):
+        with self.__lock:
+            self.__seconds.clear()
+            self.__calls.clear()
+
+    @staticmethod
+    def count_changes(previous_generation: np.ndarray, current_generation: np.ndarray) -> tuple[int, int, int]:
+        alive: np.ndarray = current_generation != 0
+        changed: np.ndarray = alive != (previous_generation != 0)
+        births: int = int(np.count_nonzero(changed & alive))
+        return int(np.count_nonzero(alive)), births, int(np.count_nonzero(changed)) - births
+
+
+def measure(profiler: Profiler | None, phase: Phase) -> ContextManager[None]:
+    return profiler.measure(phase) if profiler is not None else nullcontext()
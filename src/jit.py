@@ -0,0 +1,13 @@
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def step(padded: np.ndarray, transition_table: np.ndarray, next_generation: np.ndarray):
+    n_cells_x, n_cells_y = next_generation.shape
+    for x in numba.prange(n_cells_x):
+        for y in range(n_cells_y):
+            n_neighbors: int = (padded[x, y] + padded[x + 1, y] + padded[x + 2, y]
+                                + padded[x, y + 1] + padded[x + 2, y + 1]
+                                + padded[x, y + 2] + padded[x + 1, y + 2] + padded[x + 2, y + 2])
+            next_generation[x, y] = transition_table[padded[x + 1, y + 1], n_neighbors]
@@ -0,0 +1,209 @@
+import time
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+from instrumentation import Phase, Profiler
+from regions import RegionStatistics
+from rule import Ruleset
+from topology import Topology
+
+WORD_BITS: int = 64
+
+_ONE: np.uint64 = np.uint64(1)
+_WORD_DTYPE: np.dtype = np.dtype('<u8')
+
+
+class PackedBoard(Board):
+    def __init__(self, n_cells_x: int, n_cells_y: int, ruleset: Ruleset, chunk_words: int = 1 << 20):
+        PackedBoard.__check_ruleset(ruleset)
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.ruleset: Ruleset = ruleset
+        self.n_words: int = -(-n_cells_y // WORD_BITS)
+        self.words: np.ndarray = np.zeros((n_cells_x, self.n_words), dtype=_WORD_DTYPE)
+        self.chunk_words: int = chunk_words
+        self.topology: Topology = Topology.TORUS
+        self.origin_x: int = 0
+        self.origin_y: int = 0
+        self.profiler: Profiler | None = None
+        self.statistics: RegionStatistics | None = None
+
+    def next_generation(self):
+        if self.profiler is None:
+            self.words = self.__step()
+            return
+
+        previous_words: np.ndarray = self.words
+        start: float = time.perf_counter()
+        next_words: np.ndarray = self.__step()
+        swap_start: float = time.perf_counter()
+        self.words = next_words
+        self.profiler.record(Phase.STEP, swap_start - start)
+        self.profiler.record(Phase.SWAP, time.perf_counter() - swap_start)
+        population: int = int(np.bitwise_count(next_words).sum())
+        births: int = int(np.bitwise_count(next_words & ~previous_words).sum())
+        deaths: int = int(np.bitwise_count(previous_words & ~next_words).sum())
+        self.profiler.end_generation(population, births, deaths)
+
+    def update_engine(self, engine):
+        pass
+
+    def set_profiler(self, profiler: Profiler | None):
+        self.profiler = profiler
+
+    def set_statistics(self, statistics: RegionStatistics | None):
+        if statistics is not None:
+            raise ValueError("Packed boards do not keep region statistics, they would unpack the board every step.")
+
+    def set_topology(self, topology: Topology):
+        if topology is not Topology.TORUS:
+            raise ValueError("Packed boards only support the torus topology.")
+
+    def __step(self) -> np.ndarray:
+        next_words: np.ndarray = np.empty_like(self.words)
+        chunk_rows: int = max(1, self.chunk_words // self.n_words)
+        birth_masks, survival_masks = self.ruleset.birth, self.ruleset.survival
+
+        for start in range(0, self.n_cells_x, chunk_rows):
+            stop: int = min(start + chunk_rows, self.n_cells_x)
+            rows: np.ndarray = self.words.take(range(start - 1, stop + 1), axis=0, mode='wrap')
+            up: np.ndarray = self.__shift_up(rows)
+            down: np.ndarray = self.__shift_down(rows)
+
+            triple_bit_0, triple_bit_1 = _Adder.full(up, rows, down)
+            pair_bit_0: np.ndarray = up[1:-1] ^ down[1:-1]
+            pair_bit_1: np.ndarray = up[1:-1] & down[1:-1]
+
+            count_bit_0, carry_0 = _Adder.full(triple_bit_0[:-2], pair_bit_0, triple_bit_0[2:])
+            partial_bit_1, carry_1 = _Adder.full(triple_bit_1[:-2], pair_bit_1, triple_bit_1[2:])
+            count_bit_1: np.ndarray = partial_bit_1 ^ carry_0
+            carry_2: np.ndarray = partial_bit_1 & carry_0
+            count_bits: tuple[np.ndarray, ...] = (count_bit_0, count_bit_1, carry_1 ^ carry_2, carry_1 & carry_2)
+
+            alive: np.ndarray = rows[1:-1]
+            next_words[start:stop] = (
+                    (~alive & _Adder.equals_any(count_bits, birth_masks))
+                    | (alive & _Adder.equals_any(count_bits, survival_masks))
+            )
+
+        next_words[:, -1] &= self.__last_word_mask()
+        return next_words
+
+    def get_current_generation(self) -> np.ndarray:
+        return _Packing.unpack(self.words, self.n_cells_y)
+
+    def get_packed_generation(self) -> np.ndarray:
+        return self.words
+
+    def get_state(self) -> np.ndarray:
+        return self.words
+
+    def get_cells(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        words: np.ndarray = self.words[np.ix_(xs, ys // WORD_BITS)]
+        return ((words >> (ys % WORD_BITS).astype(np.uint64)) & _ONE).astype(np.uint8)
+
+    def get_pooled_cells(self, x_start: int, x_stop: int, y_start: int, y_stop: int, step: int) -> np.ndarray:
+        words: np.ndarray = Board.pool(self.words[x_start:x_stop, y_start // WORD_BITS:-(-y_stop // WORD_BITS)], step, 0,
+                                       np.bitwise_or)
+        cells: np.ndarray = _Packing.unpack(words, words.shape[1] * WORD_BITS)
+        return Board.pool(cells[:, y_start % WORD_BITS:y_start % WORD_BITS + y_stop - y_start], step, 1)
+
+    def get_population(self) -> int:
+        return int(np.bitwise_count(self.words).sum())
+
+    def change_cell_state(self, x: int, y: int):
+        self.words[x, y // WORD_BITS] ^= _ONE << np.uint64(y % WORD_BITS)
+
+    def set_cell_state(self, x: int, y: int, cell_state: CellState):
+        bit: np.uint64 = _ONE << np.uint64(y % WORD_BITS)
+        if cell_state == CellState.ALIVE:
+            self.words[x, y // WORD_BITS] |= bit
+        else:
+            self.words[x, y // WORD_BITS] &= ~bit
+
+    def set_cell_states(self, cells: np.ndarray, cell_state: CellState):
+        words: tuple[np.ndarray, np.ndarray] = (cells[:, 0], cells[:, 1] // WORD_BITS)
+        bits: np.ndarray = _ONE << (cells[:, 1] % WORD_BITS).astype(np.uint64)
+        if cell_state == CellState.ALIVE:
+            np.bitwise_or.at(self.words, words, bits)
+        else:
+            np.bitwise_and.at(self.words, words, ~bits)
+
+    def randomize(self):
+        chunk_rows: int = max(1, self.chunk_words // self.n_words)
+        for start in range(0, self.n_cells_x, chunk_rows):
+            stop: int = min(start + chunk_rows, self.n_cells_x)
+            self.words[start:stop] = _Packing.pack(np.random.random((stop - start, self.n_cells_y)) < 0.2)
+
+    def clear(self):
+        self.words.fill(0)
+
+    def update_ruleset(self, ruleset: Ruleset):
+        PackedBoard.__check_ruleset(ruleset)
+        self.ruleset = ruleset
+
+    def set_current_generation(self, new_generation: np.ndarray):
+        self.n_cells_x, self.n_cells_y = new_generation.shape
+        self.n_words = -(-self.n_cells_y // WORD_BITS)
+        self.words = _Packing.pack(new_generation != CellState.DEAD)
+
+    def get_memory_usage(self) -> int:
+        return self.words.nbytes
+
+    @staticmethod
+    def __check_ruleset(ruleset: Ruleset):
+        if not ruleset.is_outer_totalistic():
+            raise ValueError(f"Packed boards only handle outer totalistic rules: {ruleset.get_rulestring()}.")
+
+    def __last_word_mask(self) -> np.uint64:
+        return np.uint64((1 << (self.n_cells_y - (self.n_words - 1) * WORD_BITS)) - 1)
+
+    def __last_bit(self) -> np.uint64:
+        return np.uint64((self.n_cells_y - 1) % WORD_BITS)
+
+    def __shift_up(self, words: np.ndarray) -> np.ndarray:
+        carry: np.ndarray = np.empty_like(words)
+        carry[:, 1:] = words[:, :-1] >> np.uint64(WORD_BITS - 1)
+        carry[:, 0] = (words[:, -1] >> self.__last_bit()) & _ONE
+        shifted: np.ndarray = (words << _ONE) | carry
+        shifted[:, -1] &= self.__last_word_mask()
+        return shifted
+
+    def __shift_down(self, words: np.ndarray) -> np.ndarray:
+        carry: np.ndarray = np.empty_like(words)
+        carry[:, :-1] = (words[:, 1:] & _ONE) << np.uint64(WORD_BITS - 1)
+        carry[:, -1] = (words[:, 0] & _ONE) << self.__last_bit()
+        return (words >> _ONE) | carry
+
+
+class _Adder:
+    @staticmethod
+    def full(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        half_sum: np.ndarray = a ^ b
+        return half_sum ^ c, (a & b) | (half_sum & c)
+
+    @staticmethod
+    def equals_any(count_bits: tuple[np.ndarray, ...], counts: list[int]) -> np.ndarray | np.uint64:
+        result: np.ndarray | np.uint64 = np.uint64(0)
+        for count in counts:
+            matches: np.ndarray = ~np.zeros_like(count_bits[0])
+            for bit_index, count_bit in enumerate(count_bits):
+                matches &= count_bit if count >> bit_index & 1 else ~count_bit
+            result = result | matches
+        return result
+
+
+class _Packing:
+    @staticmethod
+    def pack(cells: np.ndarray) -> np.ndarray:
+        n_words: int = -(-cells.shape[1] // WORD_BITS)
+        packed_bytes: np.ndarray = np.zeros((cells.shape[0], n_words * WORD_BITS // 8), dtype=np.uint8)
+        packed: np.ndarray = np.packbits(cells.astype(bool), axis=1, bitorder='little')
+        packed_bytes[:, :packed.shape[1]] = packed
+        return packed_bytes.view(_WORD_DTYPE)
+
+    @staticmethod
+    def unpack(words: np.ndarray, n_cells_y: int) -> np.ndarray:
+        return np.unpackbits(words.view(np.uint8), axis=1, count=n_cells_y, bitorder='little')
@@ -0,0 +1,226 @@
+import os
+import re
+import struct
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TextIO
+
+import numpy as np
+
+from cell import CellState
+
+type _Pattern = tuple[np.ndarray, str, str]
+
+
+class PatternFormat(Enum):
+    PYLIFE = '.pylife'
+    RLE = '.rle'
+    BINARY = '.lifeb'
+
+
+class PatternCodec(ABC):
+    chunk_cells: int = 1 << 22
+    dying_state_tags: str = 'BCDEFGHIJKLMNOPQRSTUVWX'
+
+    @abstractmethod
+    def load(self, file_name: str) -> _Pattern:
+        pass
+
+    @abstractmethod
+    def save(self, file_name: str, generation: np.ndarray, rulestring: str, name: str):
+        pass
+
+    @staticmethod
+    def chunk_size(line_length: int) -> int:
+        return max(1, PatternCodec.chunk_cells // max(1, line_length))
+
+    @staticmethod
+    def count_states(generation: np.ndarray) -> int:
+        n_states: int = int(generation.max(initial=CellState.ALIVE)) + 1
+        if n_states > len(PatternCodec.dying_state_tags) + 2:
+            raise ValueError(f"Patterns store at most {len(PatternCodec.dying_state_tags) + 2} cell states.")
+        return n_states
+
+
+class PylifeCodec(PatternCodec):
+    characters: np.ndarray = np.frombuffer(f'.*{PatternCodec.dying_state_tags}'.encode(), dtype=np.uint8)
+    states: np.ndarray = np.zeros(256, dtype=np.uint8)
+    states[characters[1:]] = np.arange(1, len(characters))
+
+    def load(self, file_name: str) -> _Pattern:
+        with open(file_name, 'rb') as reader:
+            name: str = reader.readline().decode().replace("#Name:", "").strip()
+            rulestring: str = reader.readline().decode().replace("#Rulestring:", "").strip()
+            lines: list[bytes] = [line.rstrip(b'\r\n') for line in reader]
+
+        generation: np.ndarray = np.zeros((max(map(len, lines), default=0), len(lines)), dtype=np.uint8)
+        for y, line in enumerate(lines):
+            generation[:len(line), y] = PylifeCodec.states[np.frombuffer(line, dtype=np.uint8)]
+        return generation, rulestring, name
+
+    def save(self, file_name: str, generation: np.ndarray, rulestring: str, name: str):
+        n_cells_x, n_cells_y = generation.shape
+        PatternCodec.count_states(generation)
+        with open(file_name, 'wb') as writer:
+            writer.write(f"#Name:{name}\n#Rulestring:{rulestring}\n".encode())
+            for start in range(0, n_cells_y, PatternCodec.chunk_size(n_cells_x)):
+                rows: np.ndarray = generation[:, start:start + PatternCodec.chunk_size(n_cells_x)].T
+                characters: np.ndarray = np.full((rows.shape[0], n_cells_x + 1), ord('\n'), dtype=np.uint8)
+                characters[:, :-1] = PylifeCodec.characters[rows.astype(np.intp)]
+                writer.write(characters.tobytes())
+
+
+class RleCodec(PatternCodec):
+    header_regex: re.Pattern = re.compile(r'x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?', re.IGNORECASE)
+    token_regex: re.Pattern = re.compile(r'(\d*)([a-zA-Z.$!])')
+    line_length: int = 70
+
+    def load(self, file_name: str) -> _Pattern:
+        name: str = os.path.splitext(os.path.basename(file_name))[0]
+        with open(file_name, 'r') as reader:
+            for line in reader:
+                if line.startswith('#N'):
+                    name = line[2:].strip()
+                elif not line.startswith('#') and line.strip():
+                    header: re.Match | None = RleCodec.header_regex.match(line.strip())
+                    if header is None:
+                        raise ValueError(f"Invalid RLE header: {line.strip()}.")
+                    break
+            else:
+                raise ValueError("Missing RLE header.")
+
+            generation: np.ndarray = np.zeros((int(header.group(1)), int(header.group(2))), dtype=np.uint8)
+            rulestring: str = RleCodec.__normalize_rule(header.group(3) or "B3/S23")
+            self.__read_body(reader, generation)
+        return generation, rulestring, name
+
+    def save(self, file_name: str, generation: np.ndarray, rulestring: str, name: str):
+        n_cells_x, n_cells_y = generation.shape
+        tags: str = 'bo' if PatternCodec.count_states(generation) == 2 else f'.A{PatternCodec.dying_state_tags}'
+        with open(file_name, 'w') as writer:
+            writer.write(f"#N {name}\nx = {n_cells_x}, y = {n_cells_y}, rule = {rulestring}\n")
+            line: list[str] = []
+            line_length: int = 0
+            pending_rows: int = 0
+            for y in range(n_cells_y):
+                tokens: list[str] = RleCodec.__encode_row(generation[:, y], tags)
+                if tokens:
+                    if pending_rows:
+                        tokens.insert(0, f'{pending_rows if pending_rows > 1 else ""}$')
+                    pending_rows = 0
+                pending_rows += 1
+                for token in tokens:
+                    if line_length + len(token) > RleCodec.line_length:
+                        writer.write(''.join(line) + '\n')
+                        line, line_length = [], 0
+                    line.append(token)
+                    line_length += len(token)
+            writer.write(''.join(line) + '!\n')
+
+    @staticmethod
+    def __read_body(reader: TextIO, generation: np.ndarray):
+        x: int = 0
+        y: int = 0
+        for line in reader:
+            if line.startswith('#'):
+                continue
+            for count, tag in RleCodec.token_regex.findall(line):
+                run: int = int(count) if count else 1
+                if tag == '!':
+                    return
+                if tag == '$':
+                    x, y = 0, y + run
+                    continue
+                if tag not in 'b.':
+                    generation[x:x + run, y] = RleCodec.__decode_state(tag)
+                x += run
+
+    @staticmethod
+    def __decode_state(tag: str) -> int:
+        if 'A' <= tag <= 'X':
+            return ord(tag) - ord('A') + 1
+        return CellState.ALIVE
+
+    @staticmethod
+    def __encode_row(row: np.ndarray, tags: str) -> list[str]:
+        live: np.ndarray = np.flatnonzero(row != CellState.DEAD)
+        if not len(live):
+            return []
+        row = row[:live[-1] + 1].astype(np.intp)
+        starts: np.ndarray = np.concatenate(([0], np.flatnonzero(np.diff(row)) + 1))
+        lengths: np.ndarray = np.diff(np.concatenate((starts, [len(row)])))
+        return [f'{length if length > 1 else ""}{tags[state]}'
+                for state, length in zip(row[starts].tolist(), lengths.tolist())]
+
+    @staticmethod
+    def __normalize_rule(rule: str) -> str:
+        if '/' not in rule:
+            return rule.upper()
+        parts: list[str] = [part[:1].upper() + part[1:] for part in rule.split('/')]
+        if parts[0].startswith('B'):
+            return '/'.join(parts)
+        survival, birth = parts[0].removeprefix('S'), parts[1].removeprefix('B')
+        return '/'.join([f'B{birth}', f'S{survival}', *parts[2:]])
+
+
+class BinaryCodec(PatternCodec):
+    magic: bytes = b'PYLIFEB\x01'
+    header_format: str = '<8sIIHH'
+
+    def load(self, file_name: str) -> _Pattern:
+        with open(file_name, 'rb') as reader:
+            magic, n_cells_x, n_cells_y, rulestring_length, name_length = struct.unpack(
+                BinaryCodec.header_format, reader.read(struct.calcsize(BinaryCodec.header_format)))
+            if magic != BinaryCodec.magic:
+                raise ValueError(f"{file_name} is not a binary pattern file.")
+            rulestring: str = reader.read(rulestring_length).decode()
+            name: str = reader.read(name_length).decode()
+            offset: int = reader.tell()
+
+        row_bytes: int = -(-n_cells_y // 8)
+        generation: np.ndarray = np.zeros((n_cells_x, n_cells_y), dtype=np.uint8)
+        if generation.size:
+            packed: np.memmap = np.memmap(file_name, dtype=np.uint8, mode='r', offset=offset, shape=(n_cells_x, row_bytes))
+            for start in range(0, n_cells_x, PatternCodec.chunk_size(n_cells_y)):
+                stop: int = start + PatternCodec.chunk_size(n_cells_y)
+                generation[start:stop] = np.unpackbits(packed[start:stop], axis=1, count=n_cells_y)
+            del packed
+        return generation, rulestring, name
+
+    def save(self, file_name: str, generation: np.ndarray, rulestring: str, name: str):
+        n_cells_x, n_cells_y = generation.shape
+        if PatternCodec.count_states(generation) > 2:
+            raise ValueError("Binary patterns only store live and dead cells.")
+        encoded_rulestring: bytes = rulestring.encode()
+        encoded_name: bytes = name.encode()
+        with open(file_name, 'wb') as writer:
+            writer.write(struct.pack(BinaryCodec.header_format, BinaryCodec.magic, n_cells_x, n_cells_y,
+                                     len(encoded_rulestring), len(encoded_name)))
+            writer.write(encoded_rulestring)
+            writer.write(encoded_name)
+            for start in range(0, n_cells_x, PatternCodec.chunk_size(n_cells_y)):
+                rows: np.ndarray = generation[start:start + PatternCodec.chunk_size(n_cells_y)] == CellState.ALIVE
+                writer.write(np.packbits(rows, axis=1).tobytes())
+
+
+class PatternCodecFactory:
+    @staticmethod
+    def get_codec(pattern_format: PatternFormat) -> PatternCodec:
+
+        match pattern_format:
+            case PatternFormat.PYLIFE:
+                return PylifeCodec()
+            case PatternFormat.RLE:
+                return RleCodec()
+            case PatternFormat.BINARY:
+                return BinaryCodec()
+            case _:
+                raise ValueError("Invalid pattern format.")
+
+    @staticmethod
+    def get_codec_for_file(file_name: str) -> PatternCodec:
+        extension: str = os.path.splitext(file_name)[1].lower()
+        try:
+            return PatternCodecFactory.get_codec(PatternFormat(extension))
+        except ValueError:
+            raise ValueError(f"Unsupported pattern file extension: {extension or file_name}.")
@@ -0,0 +1,189 @@
+import csv
+import os
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from cell import CellState
+
+type Frame = tuple[int, np.ndarray]
+
+_NPY_MAGIC: bytes = b'\x93NUMPY\x01\x00'
+_NPY_HEADER_SIZE: int = 128
+
+_GIF_PALETTE: bytes = bytes((35, 33, 54, 196, 167, 231, 110, 106, 134, 0, 0, 0))
+_GIF_CLEAR: int = 4
+_GIF_END: int = 5
+
+
+class FrameSink(ABC):
+    @abstractmethod
+    def write(self, generation: int, frame: np.ndarray):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NpyFrameWriter(FrameSink):
+    def __init__(self, file_name: str, flush_every: int = 64):
+        self.file_name: str = file_name
+        self.flush_every: int = flush_every
+        self.n_frames: int = 0
+        self.__file = open(file_name, 'wb')
+        self.__frame_shape: tuple[int, ...] | None = None
+        self.__dtype: np.dtype | None = None
+
+    def write(self, generation: int, frame: np.ndarray):
+        if self.__frame_shape is None:
+            self.__frame_shape, self.__dtype = frame.shape, frame.dtype
+            self.__write_header()
+        elif frame.shape != self.__frame_shape:
+            raise ValueError(f"Frame of shape {frame.shape} does not match {self.__frame_shape}.")
+
+        self.__file.write(np.ascontiguousarray(frame, dtype=self.__dtype).tobytes())
+        self.n_frames += 1
+        if self.n_frames % self.flush_every == 0:
+            self.__write_header()
+
+    def close(self):
+        if self.__file.closed:
+            return
+        if self.__frame_shape is not None:
+            self.__write_header()
+        self.__file.close()
+
+    def __write_header(self):
+        header: str = repr({'descr': np.lib.format.dtype_to_descr(self.__dtype), 'fortran_order': False,
+                            'shape': (self.n_frames, *self.__frame_shape)})
+        header = header.ljust(_NPY_HEADER_SIZE - len(_NPY_MAGIC) - 3) + '\n'
+        if len(header) + len(_NPY_MAGIC) + 2 != _NPY_HEADER_SIZE:
+            raise ValueError(f"Frame shape {self.__frame_shape} does not fit in the .npy header.")
+
+        position: int = self.__file.tell()
+        self.__file.seek(0)
+        self.__file.write(_NPY_MAGIC + len(header).to_bytes(2, 'little') + header.encode('latin1'))
+        self.__file.seek(max(position, _NPY_HEADER_SIZE))
+        self.__file.flush()
+
+    @staticmethod
+    def open(file_name: str) -> np.ndarray:
+        return np.load(file_name, mmap_mode='r')
+
+
+class PopulationCsvWriter(FrameSink):
+    def __init__(self, file_name: str):
+        self.file_name: str = file_name
+        self.__file = open(file_name, 'w', newline='')
+        self.__writer = csv.writer(self.__file)
+        self.__writer.writerow(['generation', 'population', 'births', 'deaths'])
+        self.__previous: np.ndarray | None = None
+
+    def write(self, generation: int, frame: np.ndarray):
+        alive: np.ndarray = frame == CellState.ALIVE
+        births: int = 0
+        deaths: int = 0
+        if self.__previous is not None:
+            births = int(np.count_nonzero(alive & ~self.__previous))
+            deaths = int(np.count_nonzero(self.__previous & ~alive))
+            np.copyto(self.__previous, alive)
+        else:
+            self.__previous = alive
+        self.__writer.writerow([generation, int(np.count_nonzero(alive)), births, deaths])
+
+    def close(self):
+        self.__file.close()
+
+
+class PbmSequenceWriter(FrameSink):
+    def __init__(self, directory: str, prefix: str = 'generation'):
+        self.directory: str = directory
+        self.prefix: str = prefix
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, generation: int, frame: np.ndarray):
+        n_cells_x, n_cells_y = frame.shape
+        with open(os.path.join(self.directory, f'{self.prefix}_{generation:08d}.pbm'), 'wb') as writer:
+            writer.write(f'P4\n{n_cells_x} {n_cells_y}\n'.encode('ascii'))
+            writer.write(np.packbits(frame.T == CellState.ALIVE, axis=1).tobytes())
+
+
+class GifWriter(FrameSink):
+    def __init__(self, file_name: str, delay: int = 5, scale: int = 1):
+        self.file_name: str = file_name
+        self.delay: int = delay
+        self.scale: int = scale
+        self.__file = open(file_name, 'wb')
+        self.__shape: tuple[int, int] | None = None
+
+    def write(self, generation: int, frame: np.ndarray):
+        pixels: np.ndarray = np.minimum(frame.T, 2).astype(np.uint8)
+        if self.scale > 1:
+            pixels = pixels.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+        height, width = pixels.shape
+        if self.__shape is None:
+            self.__shape = (width, height)
+            self.__file.write(b'GIF89a' + GifWriter.__shorts(width, height) + b'\xf1\x00\x00' + _GIF_PALETTE)
+            self.__file.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')
+        elif self.__shape != (width, height):
+            raise ValueError(f"Frame of {width}x{height} pixels does not match {self.__shape[0]}x{self.__shape[1]}.")
+
+        self.__file.write(b'\x21\xf9\x04\x04' + GifWriter.__shorts(self.delay) + b'\x00\x00')
+        self.__file.write(b'\x2c' + GifWriter.__shorts(0, 0, width, height) + b'\x00\x02')
+        data: bytes = GifWriter.__encode(pixels.reshape(-1))
+        for start in range(0, len(data), 255):
+            block: bytes = data[start:start + 255]
+            self.__file.write(bytes((len(block),)) + block)
+        self.__file.write(b'\x00')
+
+    def close(self):
+        if not self.__file.closed:
+            self.__file.write(b'\x3b')
+            self.__file.close()
+
+    @staticmethod
+    def __encode(pixels: np.ndarray) -> bytes:
+        padded: np.ndarray = np.full(len(pixels) + len(pixels) % 2, _GIF_CLEAR, dtype=np.uint8)
+        padded[:len(pixels)] = pixels
+        pairs: np.ndarray = np.full((len(padded) // 2, 3), _GIF_CLEAR, dtype=np.uint8)
+        pairs[:, 1:] = padded.reshape(-1, 2)
+        codes: np.ndarray = pairs.reshape(-1)
+        if len(pixels) % 2:
+            codes = codes[:-1]
+        codes = np.append(codes, _GIF_END)
+        bits: np.ndarray = ((codes[:, np.newaxis] >> np.arange(3)) & 1).astype(np.uint8)
+        return np.packbits(bits.reshape(-1), bitorder='little').tobytes()
+
+    @staticmethod
+    def __shorts(*values: int) -> bytes:
+        return b''.join(value.to_bytes(2, 'little') for value in values)
+
+
+class Recorder:
+    def __init__(self, sinks: list[FrameSink]):
+        self.sinks: list[FrameSink] = sinks
+
+    def record(self, frames: Iterable[Frame]) -> int:
+        n_frames: int = 0
+        try:
+            for generation, frame in frames:
+                for sink in self.sinks:
+                    sink.write(generation, frame)
+                n_frames += 1
+        finally:
+            for sink in self.sinks:
+                sink.close()
+        return n_frames
+
+
+def read_population_csv(file_name: str) -> Iterator[dict[str, int]]:
+    with open(file_name, newline='') as reader:
+        for row in csv.DictReader(reader):
+            yield {key: int(value) for key, value in row.items()}
@@ -0,0 +1,167 @@
+import numpy as np
+
+from cell import CellState
+
+_DEAD: np.uint8 = np.uint8(CellState.DEAD)
+
+
+class RegionStatistics:
+    def __init__(self, n_cells_x: int, n_cells_y: int, block_size: int = 64):
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1.")
+        self.block_size: int = block_size
+        self.births: int = 0
+        self.deaths: int = 0
+        self.__population: int = 0
+        self.__generation: np.ndarray = np.zeros((n_cells_x, n_cells_y), dtype=np.uint8)
+        self.__block_counts: np.ndarray = np.zeros(self.__get_block_shape(n_cells_x, n_cells_y), dtype=np.int64)
+        self.__block_areas: np.ndarray = self.__get_block_areas(n_cells_x, n_cells_y)
+        self.__summed_area_table: np.ndarray | None = None
+        self.__alive: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+        self.__changed: np.ndarray = np.zeros((0, 0), dtype=bool)
+
+    def reset(self, generation: np.ndarray):
+        if generation.shape != self.__generation.shape:
+            self.__block_areas = self.__get_block_areas(*generation.shape)
+        self.__generation = generation
+        self.__count_blocks()
+        self.births = self.deaths = 0
+
+    def update(self, previous: np.ndarray, current: np.ndarray, changed_tiles: tuple[np.ndarray, int] | None = None):
+        if previous.shape != current.shape or previous.shape != self.__generation.shape:
+            self.reset(current)
+            return
+
+        if changed_tiles is not None and np.count_nonzero(changed_tiles[0]) * changed_tiles[1] ** 2 <= current.size // 64:
+            self.__generation = current
+            self.__update_tiles(previous, current, *changed_tiles)
+            return
+
+        if self.__changed.shape != current.shape:
+            self.__changed = np.empty(current.shape, dtype=bool)
+        changed: np.ndarray = np.not_equal(previous, current, out=self.__changed)
+        self.__generation = current
+        if np.count_nonzero(changed) > current.size // 64:
+            previous_population: int = self.__population
+            alive: np.ndarray = self.__count_blocks()
+            np.not_equal(previous, _DEAD, out=changed)
+            n_changes: int = int(np.count_nonzero(np.not_equal(changed, alive, out=changed)))
+            self.births = (n_changes + self.__population - previous_population) // 2
+            self.deaths = n_changes - self.births
+            return
+
+        changes: np.ndarray = np.flatnonzero(changed)
+        alive: np.ndarray = current.reshape(-1)[changes] != _DEAD
+        flipped: np.ndarray = alive != (previous.reshape(-1)[changes] != _DEAD)
+        self.__apply_changes(changes[flipped], alive[flipped])
+
+    def set_cell_state(self, x: int, y: int, cell_state: CellState):
+        was_alive: bool = self.__generation[x, y] != CellState.DEAD
+        if was_alive != (cell_state != CellState.DEAD):
+            self.__apply_changes(np.array([x * self.__generation.shape[1] + y]), np.array([not was_alive]))
+
+    def get_population(self) -> int:
+        return self.__population
+
+    def get_rectangle_population(self, x: int, y: int, width: int, height: int) -> int:
+        n_cells_x, n_cells_y = self.__generation.shape
+        x_stop, y_stop = min(x + width, n_cells_x), min(y + height, n_cells_y)
+        x, y = max(x, 0), max(y, 0)
+        if x >= x_stop or y >= y_stop:
+            return 0
+
+        block_x_start, block_y_start = -(-x // self.block_size), -(-y // self.block_size)
+        block_x_stop, block_y_stop = x_stop // self.block_size, y_stop // self.block_size
+        if block_x_start >= block_x_stop or block_y_start >= block_y_stop:
+            return self.__count(x, y, x_stop, y_stop)
+
+        table: np.ndarray = self.__get_summed_area_table()
+        inner: int = int(table[block_x_stop, block_y_stop] - table[block_x_start, block_y_stop]
+                         - table[block_x_stop, block_y_start] + table[block_x_start, block_y_start])
+        inner_x_start, inner_x_stop = block_x_start * self.block_size, block_x_stop * self.block_size
+        inner_y_start, inner_y_stop = block_y_start * self.block_size, block_y_stop * self.block_size
+        return (inner + self.__count(x, y, inner_x_start, y_stop) + self.__count(inner_x_stop, y, x_stop, y_stop)
+                + self.__count(inner_x_start, y, inner_x_stop, inner_y_start)
+                + self.__count(inner_x_start, inner_y_stop, inner_x_stop, y_stop))
+
+    def get_block_counts(self) -> np.ndarray:
+        block_counts: np.ndarray = self.__block_counts.view()
+        block_counts.flags.writeable = False
+        return block_counts
+
+    def get_density_map(self, blocks_per_pixel: int = 1) -> np.ndarray:
+        if blocks_per_pixel < 1:
+            raise ValueError("Blocks per pixel must be at least 1.")
+        counts: np.ndarray = self.__pool(self.__block_counts, blocks_per_pixel)
+        areas: np.ndarray = self.__pool(self.__block_areas, blocks_per_pixel)
+        return (counts / areas).astype(np.float32)
+
+    def __update_tiles(self, previous: np.ndarray, current: np.ndarray, changed_tiles: np.ndarray, tile_size: int):
+        n_cells_y: int = current.shape[1]
+        changes: list[np.ndarray] = [np.empty(0, dtype=np.intp)]
+        alive: list[np.ndarray] = [np.empty(0, dtype=bool)]
+        for tile_x, tile_y in np.argwhere(changed_tiles).tolist():
+            x_start, y_start = tile_x * tile_size, tile_y * tile_size
+            current_tile: np.ndarray = current[x_start:x_start + tile_size, y_start:y_start + tile_size] != _DEAD
+            previous_tile: np.ndarray = previous[x_start:x_start + tile_size, y_start:y_start + tile_size] != _DEAD
+            xs, ys = np.nonzero(current_tile != previous_tile)
+            changes.append((xs + x_start) * n_cells_y + ys + y_start)
+            alive.append(current_tile[xs, ys])
+        self.__apply_changes(np.concatenate(changes), np.concatenate(alive))
+
+    def __apply_changes(self, changes: np.ndarray, alive: np.ndarray):
+        n_cells_y: int = self.__generation.shape[1]
+        n_blocks_y: int = self.__block_counts.shape[1]
+        xs, ys = np.divmod(changes, n_cells_y)
+        blocks: np.ndarray = xs // self.block_size * n_blocks_y + ys // self.block_size
+        births: int = int(np.count_nonzero(alive))
+        deltas: np.ndarray = np.where(alive, 1, -1)
+        self.__block_counts += np.bincount(blocks, deltas, self.__block_counts.size).astype(np.int64).reshape(
+            self.__block_counts.shape)
+        self.births, self.deaths = births, changes.size - births
+        self.__population += self.births - self.deaths
+        if changes.size > 0:
+            self.__summed_area_table = None
+
+    def __count_blocks(self) -> np.ndarray:
+        n_cells_x, n_cells_y = self.__generation.shape
+        n_blocks_x, n_blocks_y = self.__block_areas.shape
+        if self.__alive.shape != (n_blocks_x * self.block_size, n_blocks_y * self.block_size):
+            self.__alive = np.zeros((n_blocks_x * self.block_size, n_blocks_y * self.block_size), dtype=np.uint8)
+        alive: np.ndarray = np.not_equal(self.__generation, _DEAD,
+                                         out=self.__alive[:n_cells_x, :n_cells_y].view(bool))
+        row_counts: np.ndarray = self.__alive.reshape(n_blocks_x, self.block_size, -1).sum(axis=1, dtype=np.uint32)
+        self.__block_counts = row_counts.reshape(n_blocks_x, n_blocks_y, self.block_size).sum(axis=2, dtype=np.int64)
+        self.__population = int(self.__block_counts.sum())
+        self.__summed_area_table = None
+        return alive
+
+    def __get_summed_area_table(self) -> np.ndarray:
+        if self.__summed_area_table is None:
+            table: np.ndarray = np.zeros((self.__block_counts.shape[0] + 1, self.__block_counts.shape[1] + 1),
+                                         dtype=np.int64)
+            np.cumsum(np.cumsum(self.__block_counts, axis=0), axis=1, out=table[1:, 1:])
+            self.__summed_area_table = table
+        return self.__summed_area_table
+
+    def __count(self, x_start: int, y_start: int, x_stop: int, y_stop: int) -> int:
+        if x_start >= x_stop or y_start >= y_stop:
+            return 0
+        return int(np.count_nonzero(self.__generation[x_start:x_stop, y_start:y_stop]))
+
+    def __get_block_shape(self, n_cells_x: int, n_cells_y: int) -> tuple[int, int]:
+        return -(-n_cells_x // self.block_size), -(-n_cells_y // self.block_size)
+
+    def __get_block_areas(self, n_cells_x: int, n_cells_y: int) -> np.ndarray:
+        n_blocks_x, n_blocks_y = self.__get_block_shape(n_cells_x, n_cells_y)
+        rows: np.ndarray = np.minimum(self.block_size, n_cells_x - self.block_size * np.arange(n_blocks_x))
+        columns: np.ndarray = np.minimum(self.block_size, n_cells_y - self.block_size * np.arange(n_blocks_y))
+        return np.outer(rows, columns)
+
+    @staticmethod
+    def __pool(blocks: np.ndarray, factor: int) -> np.ndarray:
+        n_blocks_x, n_blocks_y = blocks.shape
+        padded: np.ndarray = np.zeros((-(-n_blocks_x // factor) * factor, -(-n_blocks_y // factor) * factor),
+                                      dtype=blocks.dtype)
+        padded[:n_blocks_x, :n_blocks_y] = blocks
+        return padded.reshape(padded.shape[0] // factor, factor, padded.shape[1] // factor, factor).sum(axis=(1, 3))
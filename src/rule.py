@@ -2,7 +2,10 @@ import re
 from abc import ABC
 from enum import Enum
 
+import numpy as np
+
 from cell import CellState
+from topology import Halo, Topology
 
 type _BirthSurvival = tuple[list[int], list[int]]
 
@@ -40,13 +43,53 @@ class Ruleset(ABC):
         self.survival = birth_survival[1]
         self.rulestring = rulestring
         self.rule = rule
+        self.transition_table: np.ndarray = np.zeros((2, 9), dtype=np.uint8)
+        self.transition_table[CellState.DEAD, self.birth] = CellState.ALIVE
+        self.transition_table[CellState.ALIVE, self.survival] = CellState.ALIVE
+        self.__neighbourhood_table: np.ndarray | None = None
+        self.__block_table: np.ndarray | None = None
 
     def apply(self, cell_state: CellState, neighbours: int) -> CellState:
-        return (
-            self.__apply_ruleset_for_alive_cell(neighbours)
-            if cell_state == CellState.ALIVE
-            else self.__apply_ruleset_for_dead_cell(neighbours)
-        )
+        return CellState(self.transition_table[cell_state, neighbours])
+
+    def is_outer_totalistic(self) -> bool:
+        return True
+
+    def get_range(self) -> int:
+        return 1
+
+    def get_n_states(self) -> int:
+        return 2
+
+    def next_generation(self, current_generation: np.ndarray, topology: Topology,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        padded: np.ndarray = Halo.pad(current_generation, topology)
+        next_generation[...] = self.transition_table[padded[1:-1, 1:-1], _Utils.count_neighbours(padded)]
+        return next_generation
+
+    def get_transition_table(self) -> np.ndarray:
+        return self.transition_table
+
+    def get_neighbourhood_table(self) -> np.ndarray:
+        if self.__neighbourhood_table is None:
+            neighbourhoods: np.ndarray = np.arange(512)
+            cells: np.ndarray = (neighbourhoods[:, np.newaxis] >> np.arange(9)) & 1
+            cell_states: np.ndarray = cells[:, 4]
+            self.__neighbourhood_table = self.transition_table[cell_states, cells.sum(axis=1) - cell_states]
+        return self.__neighbourhood_table
+
+    def get_block_table(self) -> np.ndarray:
+        if self.__block_table is None:
+            blocks: np.ndarray = np.arange(1 << 16)
+            cells: np.ndarray = ((blocks[:, np.newaxis] >> np.arange(16)) & 1).reshape(-1, 4, 4)
+            neighbourhood_table: np.ndarray = self.get_neighbourhood_table()
+            self.__block_table = np.zeros(1 << 16, dtype=np.uint8)
+            for x, y in ((1, 1), (1, 2), (2, 1), (2, 2)):
+                window: np.ndarray = cells[:, x - 1:x + 2, y - 1:y + 2].reshape(-1, 9)
+                neighbourhoods: np.ndarray = (window << np.arange(9)).sum(axis=1)
+                self.__block_table |= neighbourhood_table[neighbourhoods] << (2 * (x - 1) + (y - 1))
+        return self.__block_table
 
     def get_rule(self):
         return self.rule
@@ -57,18 +100,6 @@ class Ruleset(ABC):
     def get_rulestring(self):
         return self.rulestring
 
-    def __apply_ruleset_for_alive_cell(self, neighbours: int) -> CellState:
-        return (
-            CellState.ALIVE
-            if self.survival.__contains__(neighbours)
-            else CellState.DEAD
-        )
-
-    def __apply_ruleset_for_dead_cell(self, neighbours: int) -> CellState:
-        return (
-            CellState.ALIVE if self.birth.__contains__(neighbours) else CellState.DEAD
-        )
-
 
 class ConwaysLifeRuleset(Ruleset):
     def __init__(self):
@@ -142,9 +173,120 @@ class CustomRuleset(Ruleset):
         super().__init__(_Utils.convert_rulestring_to_birth_survival(rulestring), rulestring, Rule.CUSTOM)
 
 
+class GenerationsRuleset(Ruleset):
+    def __init__(self, rulestring: str):
+        birth_survival, n_states = _Utils.convert_rulestring_to_generations(rulestring)
+        super().__init__(birth_survival, rulestring, Rule.CUSTOM)
+        self.n_states: int = n_states
+        self.state_table: np.ndarray = _Utils.create_state_table(self.birth, self.survival, n_states, 9)
+
+    def is_outer_totalistic(self) -> bool:
+        return False
+
+    def get_n_states(self) -> int:
+        return self.n_states
+
+    def count_neighbours(self, alive: np.ndarray, topology: Topology) -> np.ndarray:
+        return _Utils.count_neighbours(Halo.pad(alive, topology))
+
+    def next_generation(self, current_generation: np.ndarray, topology: Topology,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        neighbours: np.ndarray = self.count_neighbours(current_generation == CellState.ALIVE, topology)
+        next_generation[...] = self.state_table[current_generation.astype(np.intp), neighbours]
+        return next_generation
+
+
+class LargerThanLifeRuleset(GenerationsRuleset):
+    def __init__(self, rulestring: str):
+        neighbourhood_range, n_states, include_middle, survival, birth = (
+            _Utils.convert_rulestring_to_larger_than_life(rulestring))
+        Ruleset.__init__(self, ([], []), rulestring, Rule.CUSTOM)
+        self.birth = birth
+        self.survival = survival
+        self.neighbourhood_range: int = neighbourhood_range
+        self.include_middle: bool = include_middle
+        self.n_states: int = n_states
+        self.state_table: np.ndarray = _Utils.create_state_table(birth, survival, n_states,
+                                                                 (2 * neighbourhood_range + 1) ** 2 + 1)
+
+    def get_range(self) -> int:
+        return self.neighbourhood_range
+
+    def count_neighbours(self, alive: np.ndarray, topology: Topology) -> np.ndarray:
+        width: int = 2 * self.neighbourhood_range + 1
+        padded: np.ndarray = Halo.pad(alive, topology, width=self.neighbourhood_range)
+        summed_area: np.ndarray = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.int32)
+        np.cumsum(padded, axis=0, dtype=np.int32, out=summed_area[1:, 1:])
+        np.cumsum(summed_area[1:, 1:], axis=1, out=summed_area[1:, 1:])
+        neighbours: np.ndarray = (summed_area[width:, width:] - summed_area[:-width, width:]
+                                  - summed_area[width:, :-width] + summed_area[:-width, :-width])
+        if not self.include_middle:
+            neighbours -= alive
+        return neighbours
+
+
+class NonTotalisticRuleset(Ruleset):
+    def __init__(self, rulestring: str):
+        birth, survival = _Utils.convert_rulestring_to_neighbourhoods(rulestring)
+        super().__init__(([], []), rulestring, Rule.CUSTOM)
+        self.birth = sorted({count for count, _ in birth})
+        self.survival = sorted({count for count, _ in survival})
+        classes: list[tuple[int, str]] = _Utils.get_neighbourhood_classes()
+        cell_states: np.ndarray = (np.arange(512) >> 4) & 1
+        self.__neighbourhood_table: np.ndarray = np.array(
+            [neighbourhood_class in (survival if cell_state else birth)
+             for neighbourhood_class, cell_state in zip(classes, cell_states)], dtype=np.uint8)
+
+    def is_outer_totalistic(self) -> bool:
+        return False
+
+    def get_neighbourhood_table(self) -> np.ndarray:
+        return self.__neighbourhood_table
+
+    def next_generation(self, current_generation: np.ndarray, topology: Topology,
+                        out: np.ndarray | None = None) -> np.ndarray:
+        next_generation: np.ndarray = out if out is not None else np.empty_like(current_generation)
+        n_cells_x, n_cells_y = current_generation.shape
+        padded: np.ndarray = Halo.pad(current_generation, topology)
+        neighbourhoods: np.ndarray = np.zeros((n_cells_x, n_cells_y), dtype=np.uint16)
+        for x in range(3):
+            for y in range(3):
+                neighbourhoods |= padded[x:x + n_cells_x, y:y + n_cells_y].astype(np.uint16) << (3 * x + y)
+        next_generation[...] = self.__neighbourhood_table[neighbourhoods]
+        return next_generation
+
+
 class RulesetFactory:
+    __rulesets: dict[Rule, Ruleset] = {}
+    __custom_rulesets: dict[str, Ruleset] = {}
+
     @staticmethod
     def get_ruleset(rule: Rule) -> Ruleset:
+        if rule not in RulesetFactory.__rulesets:
+            RulesetFactory.__rulesets[rule] = RulesetFactory.__create_ruleset(rule)
+        return RulesetFactory.__rulesets[rule]
+
+    @staticmethod
+    def get_custom_ruleset(rulestring: str) -> Ruleset:
+        if rulestring not in RulesetFactory.__custom_rulesets:
+            RulesetFactory.__custom_rulesets[rulestring] = RulesetFactory.__create_custom_ruleset(rulestring)
+        return RulesetFactory.__custom_rulesets[rulestring]
+
+    @staticmethod
+    def __create_custom_ruleset(rulestring: str) -> Ruleset:
+        if _Utils.birth_survival_notation_regex.match(rulestring):
+            return CustomRuleset(rulestring)
+        if _Utils.generations_notation_regex.match(rulestring):
+            return GenerationsRuleset(rulestring)
+        if _Utils.larger_than_life_notation_regex.match(rulestring):
+            return LargerThanLifeRuleset(rulestring)
+        if _Utils.hensel_notation_regex.match(rulestring):
+            return NonTotalisticRuleset(rulestring)
+        raise ValueError("Invalid rulestring.")
+
+    @staticmethod
+    def __create_ruleset(rule: Rule) -> Ruleset:
 
         match rule:
             case Rule.CONWAYS_LIFE:
@@ -172,13 +314,22 @@ class RulesetFactory:
             case _:
                 raise ValueError("Invalid rule.")
 
-    @staticmethod
-    def get_custom_ruleset(rulestring: str) -> Ruleset:
-        return CustomRuleset(rulestring)
-
 
 class _Utils:
     birth_survival_notation_regex: re.Pattern = re.compile(r'^B[0-8]{0,9}/S[0-8]{0,9}$')
+    generations_notation_regex: re.Pattern = re.compile(r'^B([0-8]{0,9})/S([0-8]{0,9})/C(\d+)$')
+    larger_than_life_notation_regex: re.Pattern = re.compile(
+        r'^R(\d+),C(\d+),M([01]),S(\d+)\.\.(\d+),B(\d+)\.\.(\d+),NM$')
+    hensel_notation_regex: re.Pattern = re.compile(r'^B((?:[0-8]-?[a-z]*)*)/S((?:[0-8]-?[a-z]*)*)$')
+    hensel_token_regex: re.Pattern = re.compile(r'([0-8])(-?)([a-z]*)')
+    hensel_letters: dict[int, str] = {1: 'ce', 2: 'ceaikn', 3: 'ceaiknjqry', 4: 'ceaiknjqrtwyz'}
+    hensel_neighbourhoods: dict[int, list[int]] = {
+        1: [1, 2],
+        2: [5, 10, 3, 40, 33, 68],
+        3: [69, 42, 11, 7, 98, 13, 14, 70, 41, 97],
+        4: [325, 170, 15, 45, 99, 71, 106, 102, 43, 101, 105, 78, 108],
+    }
+    neighbourhood_classes: list[tuple[int, str]] | None = None
 
     @staticmethod
     def __remove_alpha(param: str) -> str:
@@ -196,3 +347,82 @@ class _Utils:
         parsed_rulestring: list[str] = list(map(_Utils.__remove_alpha, rulestring.split("/")))
         return _Utils.__map_list_of_strings_to_list_of_ints(
             list(parsed_rulestring[0])), _Utils.__map_list_of_strings_to_list_of_ints(list(parsed_rulestring[1]))
+
+    @staticmethod
+    def convert_rulestring_to_generations(rulestring: str) -> tuple[_BirthSurvival, int]:
+        match: re.Match = _Utils.generations_notation_regex.match(rulestring)
+        if not match or int(match.group(3)) < 2:
+            raise ValueError("Invalid rulestring.")
+        return ((_Utils.__map_list_of_strings_to_list_of_ints(list(match.group(1))),
+                 _Utils.__map_list_of_strings_to_list_of_ints(list(match.group(2)))), int(match.group(3)))
+
+    @staticmethod
+    def convert_rulestring_to_larger_than_life(rulestring: str) -> tuple[int, int, bool, list[int], list[int]]:
+        match: re.Match = _Utils.larger_than_life_notation_regex.match(rulestring)
+        if not match:
+            raise ValueError("Invalid rulestring.")
+        neighbourhood_range, n_states, include_middle, *bounds = map(int, match.groups())
+        max_neighbours: int = (2 * neighbourhood_range + 1) ** 2
+        if neighbourhood_range < 1 or any(bound > max_neighbours for bound in bounds):
+            raise ValueError("Invalid rulestring.")
+        survival_min, survival_max, birth_min, birth_max = bounds
+        return (neighbourhood_range, max(2, n_states), include_middle == 1, list(range(survival_min, survival_max + 1)),
+                list(range(birth_min, birth_max + 1)))
+
+    @staticmethod
+    def convert_rulestring_to_neighbourhoods(rulestring: str) -> tuple[set[tuple[int, str]], set[tuple[int, str]]]:
+        match: re.Match = _Utils.hensel_notation_regex.match(rulestring)
+        if not match:
+            raise ValueError("Invalid rulestring.")
+        return _Utils.__parse_hensel(match.group(1)), _Utils.__parse_hensel(match.group(2))
+
+    @staticmethod
+    def __parse_hensel(param: str) -> set[tuple[int, str]]:
+        neighbourhoods: set[tuple[int, str]] = set()
+        for count, exclude, letters in _Utils.hensel_token_regex.findall(param):
+            all_letters: str = _Utils.hensel_letters.get(min(int(count), 8 - int(count)), '')
+            if (exclude and not letters) or not set(letters) <= set(all_letters):
+                raise ValueError("Invalid rulestring.")
+            if exclude:
+                selected: list[str] = [letter for letter in all_letters if letter not in letters]
+            else:
+                selected: list[str] = list(letters or all_letters) or ['']
+            neighbourhoods |= {(int(count), letter) for letter in selected}
+        return neighbourhoods
+
+    @staticmethod
+    def get_neighbourhood_classes() -> list[tuple[int, str]]:
+        if _Utils.neighbourhood_classes is None:
+            symmetries: list[np.ndarray] = []
+            grid: np.ndarray = np.arange(9).reshape(3, 3)
+            for transposed in (grid, grid.T):
+                for rotation in range(4):
+                    symmetries.append(np.rot90(transposed, rotation).reshape(-1))
+
+            classes: list[tuple[int, str]] = [(0, '')] * 512
+            for count, letters in _Utils.hensel_letters.items():
+                for letter, neighbourhood in zip(letters, _Utils.hensel_neighbourhoods[count]):
+                    cells: np.ndarray = (neighbourhood >> np.arange(9)) & 1
+                    for symmetry in symmetries:
+                        image: int = int((cells[symmetry] << np.arange(9)).sum())
+                        classes[image] = (count, letter)
+                        if count < 4:
+                            classes[image ^ 0b111101111] = (8 - count, letter)
+            classes[0b111101111] = (8, '')
+            _Utils.neighbourhood_classes = [classes[neighbourhood & 0b111101111] for neighbourhood in range(512)]
+        return _Utils.neighbourhood_classes
+
+    @staticmethod
+    def create_state_table(birth: list[int], survival: list[int], n_states: int, n_counts: int) -> np.ndarray:
+        state_table: np.ndarray = np.zeros((n_states, n_counts), dtype=np.uint8)
+        state_table[CellState.ALIVE] = 2 % n_states
+        state_table[CellState.DEAD, birth] = CellState.ALIVE
+        state_table[CellState.ALIVE, survival] = CellState.ALIVE
+        for state in range(2, n_states):
+            state_table[state] = (state + 1) % n_states
+        return state_table
+
+    @staticmethod
+    def count_neighbours(padded: np.ndarray) -> np.ndarray:
+        column_sums: np.ndarray = padded[:-2] + padded[1:-1] + padded[2:]
+        return column_sums[:, :-2] + column_sums[:, 1:-1] + column_sums[:, 2:] - padded[1:-1, 1:-1]
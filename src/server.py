@@ -0,0 +1,282 @@
+import asyncio
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+from rule import Rule, Ruleset, RulesetFactory
+from simulation import Simulation
+
+_HEADER: struct.Struct = struct.Struct('>IB')
+_FRAME_HEADER: struct.Struct = struct.Struct('>qII')
+
+
+class MessageKind(Enum):
+    COMMAND = 0
+    REPLY = 1
+    KEYFRAME = 2
+    CHANGES = 3
+    XOR = 4
+
+
+class FrameCodec:
+    @staticmethod
+    def encode_message(kind: MessageKind, payload: bytes) -> bytes:
+        return _HEADER.pack(len(payload), kind.value) + payload
+
+    @staticmethod
+    async def read_message(reader: asyncio.StreamReader) -> tuple[MessageKind, bytes]:
+        length, kind = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+        return MessageKind(kind), await reader.readexactly(length)
+
+    @staticmethod
+    def encode_frame(previous: np.ndarray | None, current: np.ndarray, generation: int,
+                     compression_level: int = 1) -> bytes:
+        header: bytes = _FRAME_HEADER.pack(generation, *current.shape)
+        if previous is None or previous.shape != current.shape:
+            return FrameCodec.encode_message(
+                MessageKind.KEYFRAME, header + zlib.compress(np.packbits(current).tobytes(), compression_level))
+
+        changes: np.ndarray = np.flatnonzero(previous != current).astype('>u4')
+        if changes.nbytes < current.size // 64:
+            return FrameCodec.encode_message(MessageKind.CHANGES, header + changes.tobytes())
+        xor: np.ndarray = np.packbits(previous != current)
+        return FrameCodec.encode_message(MessageKind.XOR, header + zlib.compress(xor.tobytes(), compression_level))
+
+    @staticmethod
+    def decode_frame(kind: MessageKind, payload: bytes, previous: np.ndarray | None) -> tuple[int, np.ndarray]:
+        generation, n_cells_x, n_cells_y = _FRAME_HEADER.unpack_from(payload)
+        body: bytes = payload[_FRAME_HEADER.size:]
+        n_cells: int = n_cells_x * n_cells_y
+        match kind:
+            case MessageKind.KEYFRAME:
+                cells: np.ndarray = np.unpackbits(np.frombuffer(zlib.decompress(body), dtype=np.uint8), count=n_cells)
+                return generation, cells.astype(bool).reshape(n_cells_x, n_cells_y)
+            case MessageKind.CHANGES:
+                current: np.ndarray = np.copy(FrameCodec.__check_basis(previous, n_cells_x, n_cells_y))
+                np.logical_not.at(current.reshape(-1), np.frombuffer(body, dtype='>u4').astype(np.intp))
+                return generation, current
+            case MessageKind.XOR:
+                xor: np.ndarray = np.unpackbits(np.frombuffer(zlib.decompress(body), dtype=np.uint8), count=n_cells)
+                basis: np.ndarray = FrameCodec.__check_basis(previous, n_cells_x, n_cells_y)
+                return generation, basis ^ xor.astype(bool).reshape(n_cells_x, n_cells_y)
+            case _:
+                raise ValueError(f"{kind.name} is not a frame.")
+
+    @staticmethod
+    def __check_basis(previous: np.ndarray | None, n_cells_x: int, n_cells_y: int) -> np.ndarray:
+        if previous is None or previous.shape != (n_cells_x, n_cells_y):
+            raise ValueError("Delta frame received without a matching previous frame.")
+        return previous
+
+
+@dataclass
+class _Subscriber:
+    writer: asyncio.StreamWriter
+    basis: np.ndarray | None = None
+    version: int = 0
+    task: asyncio.Task | None = None
+
+
+class SimulationServer:
+    def __init__(self, simulation: Simulation, frames_per_second: float = 30.0, write_buffer_bytes: int = 1 << 16):
+        self.simulation: Simulation = simulation
+        self.frames_per_second: float = frames_per_second
+        self.write_buffer_bytes: int = write_buffer_bytes
+        self.frames_sent: int = 0
+        self.__server: asyncio.Server | None = None
+        self.__broadcaster: asyncio.Task | None = None
+        self.__subscribers: dict[asyncio.StreamWriter, _Subscriber] = {}
+        self.__updated: asyncio.Condition | None = None
+        self.__frame: np.ndarray | None = None
+        self.__generation: int = 0
+        self.__version: int = 0
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0):
+        self.__server = await asyncio.start_server(self.__handle, host, port)
+        self.__start_broadcasting()
+
+    async def start_unix(self, path: str):
+        self.__server = await asyncio.start_unix_server(self.__handle, path)
+        self.__start_broadcasting()
+
+    def get_port(self) -> int:
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.__server.serve_forever()
+
+    async def close(self):
+        if self.__broadcaster is not None:
+            self.__broadcaster.cancel()
+        for subscriber in list(self.__subscribers.values()):
+            subscriber.writer.close()
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    def __start_broadcasting(self):
+        self.__updated = asyncio.Condition()
+        self.__broadcaster = asyncio.create_task(self.__broadcast())
+
+    async def __broadcast(self):
+        while True:
+            await self.publish()
+            await asyncio.sleep(1 / self.frames_per_second)
+
+    async def publish(self):
+        generation: int = self.simulation.generation
+        frame: np.ndarray = self.simulation.get_latest_generation() != CellState.DEAD
+        if (self.__frame is not None and generation == self.__generation and frame.shape == self.__frame.shape
+                and np.array_equal(frame, self.__frame)):
+            return
+        self.__frame, self.__generation = frame, generation
+        self.__version += 1
+        async with self.__updated:
+            self.__updated.notify_all()
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.transport.set_write_buffer_limits(high=self.write_buffer_bytes)
+        try:
+            while True:
+                kind, payload = await FrameCodec.read_message(reader)
+                if kind is not MessageKind.COMMAND:
+                    raise ValueError(f"Expected a command, got {kind.name}.")
+                reply: dict = await self.__execute(json.loads(payload), writer)
+                writer.write(FrameCodec.encode_message(MessageKind.REPLY, json.dumps(reply).encode()))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self.__unsubscribe(writer)
+            writer.close()
+
+    async def __execute(self, command: dict, writer: asyncio.StreamWriter) -> dict:
+        simulation: Simulation = self.simulation
+        try:
+            match command.get('command'):
+                case 'step':
+                    if simulation.is_paused():
+                        await asyncio.to_thread(simulation.step)
+                case 'start':
+                    simulation.resume()
+                case 'stop':
+                    simulation.pause()
+                case 'clear':
+                    await asyncio.to_thread(simulation.execute, lambda board: board.clear())
+                    simulation.pause()
+                case 'randomize':
+                    await asyncio.to_thread(simulation.execute, lambda board: board.randomize())
+                case 'rule':
+                    await asyncio.to_thread(simulation.execute, lambda board: board.update_ruleset(
+                        SimulationServer.__get_ruleset(board, command)))
+                case 'toggle':
+                    x, y = int(command['x']), int(command['y'])
+                    if not (0 <= x < simulation.board.n_cells_x and 0 <= y < simulation.board.n_cells_y):
+                        raise ValueError(f"Cell ({x}, {y}) is outside the board.")
+                    await asyncio.to_thread(simulation.execute, lambda board: board.change_cell_state(x, y))
+                case 'subscribe':
+                    self.__subscribe(writer)
+                case 'unsubscribe':
+                    self.__unsubscribe(writer)
+                case _:
+                    raise ValueError(f"Unknown command {command.get('command')}.")
+        except (KeyError, ValueError) as err:
+            return {'ok': False, 'error': str(err)}
+        except Exception as err:
+            return {'ok': False, 'error': f'{type(err).__name__}: {err}'}
+        await self.publish()
+        return {'ok': True, 'generation': simulation.generation, 'paused': simulation.is_paused(),
+                'rulestring': simulation.board.ruleset.get_rulestring()}
+
+    @staticmethod
+    def __get_ruleset(board: Board, command: dict) -> Ruleset:
+        if 'rulestring' in command:
+            return RulesetFactory.get_custom_ruleset(command['rulestring'])
+        match command['rule']:
+            case 'next':
+                return RulesetFactory.get_ruleset(board.ruleset.get_rule().next())
+            case 'previous':
+                return RulesetFactory.get_ruleset(board.ruleset.get_rule().previous())
+            case name:
+                return RulesetFactory.get_ruleset(Rule[name.upper()])
+
+    def __subscribe(self, writer: asyncio.StreamWriter):
+        if writer not in self.__subscribers:
+            subscriber: _Subscriber = _Subscriber(writer)
+            subscriber.task = asyncio.create_task(self.__send_frames(subscriber))
+            self.__subscribers[writer] = subscriber
+
+    def __unsubscribe(self, writer: asyncio.StreamWriter):
+        subscriber: _Subscriber | None = self.__subscribers.pop(writer, None)
+        if subscriber is not None:
+            subscriber.task.cancel()
+
+    async def __send_frames(self, subscriber: _Subscriber):
+        try:
+            while True:
+                async with self.__updated:
+                    await self.__updated.wait_for(lambda: self.__version != subscriber.version)
+                frame, generation, subscriber.version = self.__frame, self.__generation, self.__version
+                subscriber.writer.write(FrameCodec.encode_frame(subscriber.basis, frame, generation))
+                subscriber.basis = frame
+                self.frames_sent += 1
+                await subscriber.writer.drain()
+        except ConnectionError:
+            pass
+
+
+class SimulationClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.generation: int = -1
+        self.cells: np.ndarray | None = None
+        self.frames_received: int = 0
+        self.__reader: asyncio.StreamReader = reader
+        self.__writer: asyncio.StreamWriter = writer
+        self.__replies: asyncio.Queue[dict] = asyncio.Queue()
+        self.__updated: asyncio.Event = asyncio.Event()
+        self.__receiver: asyncio.Task = asyncio.create_task(self.__receive())
+
+    @staticmethod
+    async def connect(host: str = '127.0.0.1', port: int = 0) -> 'SimulationClient':
+        return SimulationClient(*await asyncio.open_connection(host, port))
+
+    @staticmethod
+    async def connect_unix(path: str) -> 'SimulationClient':
+        return SimulationClient(*await asyncio.open_unix_connection(path))
+
+    async def send(self, command: str, **parameters) -> dict:
+        message: bytes = json.dumps({'command': command, **parameters}).encode()
+        self.__writer.write(FrameCodec.encode_message(MessageKind.COMMAND, message))
+        await self.__writer.drain()
+        return await self.__replies.get()
+
+    async def wait_for_update(self) -> tuple[int, np.ndarray]:
+        await self.__updated.wait()
+        self.__updated.clear()
+        return self.generation, self.cells
+
+    async def wait_for_generation(self, generation: int) -> np.ndarray:
+        while self.generation < generation:
+            await self.wait_for_update()
+        return self.cells
+
+    async def close(self):
+        self.__receiver.cancel()
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+    async def __receive(self):
+        while True:
+            kind, payload = await FrameCodec.read_message(self.__reader)
+            if kind is MessageKind.REPLY:
+                await self.__replies.put(json.loads(payload))
+                continue
+            self.generation, self.cells = FrameCodec.decode_frame(kind, payload, self.cells)
+            self.frames_received += 1
+            self.__updated.set()
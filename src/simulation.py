@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+from board import Board
+from cycle import Cycle, CycleDetector
+from history import History
+
+
+class RateMeter:
+    def __init__(self, window: float = 1.0):
+        self.window: float = window
+        self.__ticks: deque[float] = deque()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def tick(self):
+        with self.__lock:
+            self.__ticks.append(time.perf_counter())
+            self.__prune()
+
+    def get_rate(self) -> float:
+        with self.__lock:
+            self.__prune()
+            return len(self.__ticks) / self.window
+
+    def __prune(self):
+        oldest: float = time.perf_counter() - self.window
+        while self.__ticks and self.__ticks[0] < oldest:
+            self.__ticks.popleft()
+
+
+class Simulation:
+    def __init__(self, board: Board, threaded: bool = False, generations_per_second: float = 0.0,
+                 cycle_detector: CycleDetector | None = None, snapshot: Callable[[Board], np.ndarray] | None = None,
+                 history: History | None = None):
+        self.board: Board = board
+        self.snapshot: Callable[[Board], np.ndarray] | None = snapshot
+        self.threaded: bool = threaded
+        self.generations_per_second: float = generations_per_second
+        self.generation: int = 0
+        self.cycle_detector: CycleDetector | None = cycle_detector
+        self.cycle: Cycle | None = None
+        self.history: History | None = history
+        self.__board_lock: threading.Lock = threading.Lock()
+        self.__buffer_lock: threading.Lock = threading.Lock()
+        self.__front: np.ndarray = np.copy(self.__take_snapshot())
+        self.__back: np.ndarray = np.empty_like(self.__front)
+        self.__consumed: bool = False
+        self.__running: threading.Event = threading.Event()
+        self.__stopping: threading.Event = threading.Event()
+        self.__thread: threading.Thread | None = None
+        self.__rate_meter: RateMeter = RateMeter()
+        self.__record_history()
+
+    def start(self):
+        if self.threaded and self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name='simulation', daemon=True)
+            self.__thread.start()
+
+    def stop(self):
+        self.__stopping.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def pause(self):
+        self.__running.clear()
+
+    def resume(self):
+        with self.__board_lock:
+            self.__reset_cycle_detector()
+        self.__running.set()
+
+    def is_paused(self) -> bool:
+        return not self.__running.is_set()
+
+    def update(self):
+        if not self.threaded and not self.is_paused():
+            self.step()
+
+    def step(self):
+        with self.__board_lock:
+            self.board.next_generation()
+            self.generation += 1
+            self.__record_history()
+            self.__publish()
+            if self.cycle is None:
+                self.__observe_cycle()
+        self.__rate_meter.tick()
+
+    def execute(self, action: Callable[[Board], object]) -> object:
+        with self.__board_lock:
+            result: object = action(self.board)
+            self.__record_history()
+            self.__publish()
+            self.__reset_cycle_detector()
+        return result
+
+    def step_back(self, generations: int = 1) -> bool:
+        return self.seek(self.generation - generations)
+
+    def seek(self, generation: int) -> bool:
+        with self.__board_lock:
+            if self.history is None or not self.history.contains(generation):
+                return False
+            self.history.restore(self.board, generation)
+            self.generation = generation
+            self.__publish()
+            self.__reset_cycle_detector()
+        return True
+
+    def refresh(self, action: Callable[[], object] | None = None):
+        with self.__board_lock:
+            if action is not None:
+                action()
+            self.__publish()
+
+    def get_latest_generation(self) -> np.ndarray:
+        with self.__buffer_lock:
+            self.__consumed = True
+            return self.__front
+
+    def get_generations_per_second(self) -> float:
+        return self.__rate_meter.get_rate()
+
+    def __reset_cycle_detector(self):
+        self.cycle = None
+        if self.cycle_detector is not None:
+            self.cycle_detector.reset()
+            self.__observe_cycle()
+
+    def __observe_cycle(self):
+        if self.cycle_detector is not None:
+            self.cycle = self.cycle_detector.observe(self.board, self.generation)
+            if self.cycle is not None:
+                self.pause()
+
+    def __record_history(self):
+        if self.history is not None:
+            self.history.record(self.board, self.generation)
+
+    def __take_snapshot(self) -> np.ndarray:
+        return self.snapshot(self.board) if self.snapshot is not None else self.board.get_current_generation()
+
+    def __publish(self):
+        current_generation: np.ndarray = self.__take_snapshot()
+        with self.__buffer_lock:
+            if self.__front.shape != current_generation.shape or self.__front.dtype != current_generation.dtype:
+                self.__front = np.copy(current_generation)
+                self.__back = np.empty_like(self.__front)
+            elif self.__consumed:
+                np.copyto(self.__back, current_generation)
+                self.__front, self.__back = self.__back, self.__front
+            else:
+                np.copyto(self.__front, current_generation)
+            self.__consumed = False
+
+    def __run(self):
+        deadline: float = time.perf_counter()
+        while not self.__stopping.is_set():
+            if not self.__running.wait(0.05):
+                deadline = time.perf_counter()
+                continue
+
+            self.step()
+            if self.generations_per_second > 0:
+                deadline += 1 / self.generations_per_second
+                delay: float = deadline - time.perf_counter()
+                if delay > 0:
+                    self.__stopping.wait(delay)
+                else:
+                    deadline = time.perf_counter()
+            else:
+                time.sleep(0)
@@ -0,0 +1,321 @@
+import time
+
+import numpy as np
+
+from board import Board
+from cell import CellState
+from instrumentation import Phase, Profiler
+from regions import RegionStatistics
+from rule import Ruleset
+from topology import Topology
+
+_NEIGHBOUR_OFFSETS: np.ndarray = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)])
+
+
+class SparseBoard(Board):
+    def __init__(self, n_cells_x: int, n_cells_y: int, ruleset: Ruleset):
+        _Utils.check_ruleset(ruleset)
+        self.n_cells_x: int = n_cells_x
+        self.n_cells_y: int = n_cells_y
+        self.ruleset: Ruleset = ruleset
+        self.live_cells: np.ndarray = np.empty(0, dtype=np.int64)
+        self.topology: Topology = Topology.TORUS
+        self.origin_x: int = 0
+        self.origin_y: int = 0
+        self.profiler: Profiler | None = None
+        self.statistics: RegionStatistics | None = None
+
+    def next_generation(self):
+        if self.profiler is None:
+            self.live_cells = self.__step()
+            return
+
+        previous_live_cells: np.ndarray = self.live_cells
+        start: float = time.perf_counter()
+        next_live_cells: np.ndarray = self.__step()
+        swap_start: float = time.perf_counter()
+        self.live_cells = next_live_cells
+        self.profiler.record(Phase.STEP, swap_start - start)
+        self.profiler.record(Phase.SWAP, time.perf_counter() - swap_start)
+        survivors: int = len(np.intersect1d(previous_live_cells, next_live_cells, assume_unique=True))
+        self.profiler.end_generation(len(next_live_cells), len(next_live_cells) - survivors,
+                                     len(previous_live_cells) - survivors)
+
+    def update_engine(self, engine):
+        pass
+
+    def set_profiler(self, profiler: Profiler | None):
+        self.profiler = profiler
+
+    def set_statistics(self, statistics: RegionStatistics | None):
+        if statistics is not None:
+            raise ValueError("Sparse boards do not keep region statistics, they would hold the whole board in memory.")
+
+    def set_topology(self, topology: Topology):
+        if topology is not Topology.TORUS:
+            raise ValueError("Sparse boards only support the torus topology.")
+
+    def __step(self) -> np.ndarray:
+        x, y = np.divmod(self.live_cells, self.n_cells_y)
+        neighbours_x: np.ndarray = (x + _NEIGHBOUR_OFFSETS[:, 0, np.newaxis]) % self.n_cells_x
+        neighbours_y: np.ndarray = (y + _NEIGHBOUR_OFFSETS[:, 1, np.newaxis]) % self.n_cells_y
+        candidates, neighbours = np.unique(neighbours_x * self.n_cells_y + neighbours_y, return_counts=True)
+        cell_states: np.ndarray = self.__contains(candidates).astype(np.uint8)
+        next_live_cells: np.ndarray = candidates[self.ruleset.get_transition_table()[cell_states, neighbours] == 1]
+
+        if 0 in self.ruleset.survival:
+            isolated: np.ndarray = self.live_cells[~np.isin(self.live_cells, candidates, assume_unique=True)]
+            next_live_cells = np.union1d(next_live_cells, isolated)
+
+        return next_live_cells
+
+    def advance(self, generations: int):
+        for _ in range(generations):
+            self.next_generation()
+
+    def get_current_generation(self) -> np.ndarray:
+        current_generation: np.ndarray = np.zeros((self.n_cells_x, self.n_cells_y), dtype=np.uint8)
+        current_generation.flat[self.live_cells] = CellState.ALIVE
+        return current_generation
+
+    def get_live_cells(self) -> np.ndarray:
+        return np.stack(np.divmod(self.live_cells, self.n_cells_y), axis=1)
+
+    def get_packed_generation(self) -> np.ndarray:
+        return self.live_cells
+
+    def get_state(self) -> np.ndarray:
+        return self.live_cells
+
+    def get_cells(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        return self.__contains(xs[:, np.newaxis] * self.n_cells_y + ys[np.newaxis, :]).astype(np.uint8)
+
+    def get_pooled_cells(self, x_start: int, x_stop: int, y_start: int, y_stop: int, step: int) -> np.ndarray:
+        xs, ys = np.divmod(self.live_cells, self.n_cells_y)
+        visible: np.ndarray = (xs >= x_start) & (xs < x_stop) & (ys >= y_start) & (ys < y_stop)
+        cells: np.ndarray = np.zeros((-(-(x_stop - x_start) // step), -(-(y_stop - y_start) // step)), dtype=np.uint8)
+        cells[(xs[visible] - x_start) // step, (ys[visible] - y_start) // step] = CellState.ALIVE
+        return cells
+
+    def get_population(self) -> int:
+        return len(self.live_cells)
+
+    def change_cell_state(self, x: int, y: int):
+        self.set_cell_state(x, y, CellState.DEAD if self.__contains(x * self.n_cells_y + y) else CellState.ALIVE)
+
+    def set_cell_state(self, x: int, y: int, cell_state: CellState):
+        index: int = x * self.n_cells_y + y
+        position: int = int(np.searchsorted(self.live_cells, index))
+        is_alive: bool = bool(self.__contains(index))
+        if cell_state == CellState.ALIVE and not is_alive:
+            self.live_cells = np.insert(self.live_cells, position, index)
+        elif cell_state == CellState.DEAD and is_alive:
+            self.live_cells = np.delete(self.live_cells, position)
+
+    def set_cell_states(self, cells: np.ndarray, cell_state: CellState):
+        indices: np.ndarray = np.unique(cells[:, 0] * self.n_cells_y + cells[:, 1]).astype(np.int64)
+        if cell_state == CellState.ALIVE:
+            self.live_cells = np.union1d(self.live_cells, indices)
+        else:
+            self.live_cells = np.setdiff1d(self.live_cells, indices, assume_unique=True)
+
+    def randomize(self):
+        n_cells: int = self.n_cells_x * self.n_cells_y
+        rng: np.random.Generator = np.random.default_rng()
+        self.live_cells = np.sort(rng.choice(n_cells, size=rng.binomial(n_cells, 0.2), replace=False))
+
+    def clear(self):
+        self.live_cells = np.empty(0, dtype=np.int64)
+
+    def update_ruleset(self, ruleset: Ruleset):
+        _Utils.check_ruleset(ruleset)
+        self.ruleset = ruleset
+
+    def set_current_generation(self, new_generation: np.ndarray):
+        self.n_cells_x, self.n_cells_y = new_generation.shape
+        self.live_cells = np.flatnonzero(new_generation).astype(np.int64)
+
+    def __contains(self, indices: np.ndarray | int) -> np.ndarray:
+        return np.isin(indices, self.live_cells)
+
+
+class _Node:
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(self, level: int, nw, ne, sw, se, population: int):
+        self.level: int = level
+        self.nw: _Node = nw
+        self.ne: _Node = ne
+        self.sw: _Node = sw
+        self.se: _Node = se
+        self.population: int = population
+
+
+class HashLife:
+    def __init__(self, ruleset: Ruleset):
+        _Utils.check_ruleset(ruleset)
+        self.ruleset: Ruleset = ruleset
+        self.__block_table: np.ndarray = ruleset.get_block_table()
+        self.__dead: _Node = _Node(0, None, None, None, None, 0)
+        self.__alive: _Node = _Node(0, None, None, None, None, 1)
+        self.__nodes: dict[tuple[_Node, _Node, _Node, _Node], _Node] = {}
+        self.__empty_nodes: list[_Node] = [self.__dead]
+        self.__successors: dict[tuple[_Node, int], _Node] = {}
+        self.root: _Node = self.__empty(3)
+        self.origin_x: int = 0
+        self.origin_y: int = 0
+        self.generation: int = 0
+
+    def set_live_cells(self, live_cells: np.ndarray):
+        live_cells = np.asarray(live_cells, dtype=np.int64).reshape(-1, 2)
+        self.origin_x, self.origin_y = map(int, live_cells.min(axis=0) if len(live_cells) else (0, 0))
+        relative: np.ndarray = live_cells - (self.origin_x, self.origin_y)
+        extent: int = int(relative.max()) + 1 if len(relative) else 1
+        level: int = max(3, (extent - 1).bit_length())
+        self.root = self.__build(level, relative)
+
+    def get_live_cells(self) -> np.ndarray:
+        live_cells: list[tuple[int, int]] = []
+        self.__collect(self.root, self.origin_x, self.origin_y, live_cells)
+        return np.array(live_cells, dtype=np.int64).reshape(-1, 2)
+
+    def get_population(self) -> int:
+        return self.root.population
+
+    def advance(self, generations: int):
+        exponent: int = 0
+        while generations:
+            if generations & 1:
+                self.step(exponent)
+            generations >>= 1
+            exponent += 1
+
+    def step(self, exponent: int):
+        while self.root.level < exponent + 3 or not self.__is_padded(self.root):
+            self.__expand()
+        self.__expand()
+        offset: int = 1 << (self.root.level - 2)
+        self.root = self.__successor(self.root, exponent)
+        self.origin_x += offset
+        self.origin_y += offset
+        self.generation += 1 << exponent
+
+    def clear_cache(self):
+        self.__successors.clear()
+
+    def __expand(self):
+        offset: int = 1 << (self.root.level - 1)
+        self.root = self.__centre(self.root)
+        self.origin_x -= offset
+        self.origin_y -= offset
+
+    def __join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        key: tuple[_Node, _Node, _Node, _Node] = (nw, ne, sw, se)
+        node: _Node | None = self.__nodes.get(key)
+        if node is None:
+            node = _Node(nw.level + 1, nw, ne, sw, se, nw.population + ne.population + sw.population + se.population)
+            self.__nodes[key] = node
+        return node
+
+    def __empty(self, level: int) -> _Node:
+        while len(self.__empty_nodes) <= level:
+            child: _Node = self.__empty_nodes[-1]
+            self.__empty_nodes.append(self.__join(child, child, child, child))
+        return self.__empty_nodes[level]
+
+    def __centre(self, node: _Node) -> _Node:
+        empty: _Node = self.__empty(node.level - 1)
+        return self.__join(
+            self.__join(empty, empty, empty, node.nw), self.__join(empty, empty, node.ne, empty),
+            self.__join(empty, node.sw, empty, empty), self.__join(node.se, empty, empty, empty),
+        )
+
+    @staticmethod
+    def __is_padded(node: _Node) -> bool:
+        return (
+                node.nw.population == node.nw.se.population
+                and node.ne.population == node.ne.sw.population
+                and node.sw.population == node.sw.ne.population
+                and node.se.population == node.se.nw.population
+        )
+
+    def __build(self, level: int, cells: np.ndarray) -> _Node:
+        if len(cells) == 0:
+            return self.__empty(level)
+        if level == 0:
+            return self.__alive
+        half: int = 1 << (level - 1)
+        east: np.ndarray = cells[:, 0] >= half
+        south: np.ndarray = cells[:, 1] >= half
+        return self.__join(
+            self.__build(level - 1, cells[~east & ~south]),
+            self.__build(level - 1, cells[east & ~south] - (half, 0)),
+            self.__build(level - 1, cells[~east & south] - (0, half)),
+            self.__build(level - 1, cells[east & south] - (half, half)),
+        )
+
+    def __collect(self, node: _Node, x: int, y: int, live_cells: list[tuple[int, int]]):
+        if node.population == 0:
+            return
+        if node.level == 0:
+            live_cells.append((x, y))
+            return
+        half: int = 1 << (node.level - 1)
+        self.__collect(node.nw, x, y, live_cells)
+        self.__collect(node.ne, x + half, y, live_cells)
+        self.__collect(node.sw, x, y + half, live_cells)
+        self.__collect(node.se, x + half, y + half, live_cells)
+
+    def __successor(self, node: _Node, exponent: int) -> _Node:
+        exponent = min(exponent, node.level - 2)
+        key: tuple[_Node, int] = (node, exponent)
+        result: _Node | None = self.__successors.get(key)
+        if result is not None:
+            return result
+
+        if node.population == 0:
+            result = node.nw
+        elif node.level == 2:
+            result = self.__step_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            parts: list[_Node] = [
+                nw, self.__join(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                self.__join(nw.sw, nw.se, sw.nw, sw.ne), self.__join(nw.se, ne.sw, sw.ne, se.nw),
+                self.__join(ne.sw, ne.se, se.nw, se.ne),
+                sw, self.__join(sw.ne, se.nw, sw.se, se.sw), se,
+            ]
+            c = [self.__successor(part, exponent) for part in parts]
+            if exponent < node.level - 2:
+                result = self.__join(
+                    self.__join(c[0].se, c[1].sw, c[3].ne, c[4].nw), self.__join(c[1].se, c[2].sw, c[4].ne, c[5].nw),
+                    self.__join(c[3].se, c[4].sw, c[6].ne, c[7].nw), self.__join(c[4].se, c[5].sw, c[7].ne, c[8].nw),
+                )
+            else:
+                result = self.__join(
+                    self.__successor(self.__join(c[0], c[1], c[3], c[4]), exponent),
+                    self.__successor(self.__join(c[1], c[2], c[4], c[5]), exponent),
+                    self.__successor(self.__join(c[3], c[4], c[6], c[7]), exponent),
+                    self.__successor(self.__join(c[4], c[5], c[7], c[8]), exponent),
+                )
+
+        self.__successors[key] = result
+        return result
+
+    def __step_4x4(self, node: _Node) -> _Node:
+        block: int = 0
+        for x_offset, y_offset, quadrant in ((0, 0, node.nw), (2, 0, node.ne), (0, 2, node.sw), (2, 2, node.se)):
+            for x, y, cell in ((0, 0, quadrant.nw), (1, 0, quadrant.ne), (0, 1, quadrant.sw), (1, 1, quadrant.se)):
+                block |= cell.population << (4 * (x + x_offset) + y + y_offset)
+
+        next_block: int = int(self.__block_table[block])
+        return self.__join(*[self.__alive if next_block >> bit & 1 else self.__dead for bit in (0, 2, 1, 3)])
+
+
+class _Utils:
+    @staticmethod
+    def check_ruleset(ruleset: Ruleset):
+        if not ruleset.is_outer_totalistic():
+            raise ValueError(f"Sparse engines only handle outer totalistic rules: {ruleset.get_rulestring()}.")
+        if 0 in ruleset.birth:
+            raise ValueError(f"Sparse engines cannot handle birth on 0 neighbours: {ruleset.get_rulestring()}.")
@@ -0,0 +1,46 @@
+from enum import Enum
+
+import numpy as np
+
+from cell import CellState
+
+
+class Topology(Enum):
+    TORUS = 0
+    BOUNDED = 1
+    KLEIN_BOTTLE = 2
+    INFINITE = 3
+
+
+class Halo:
+    @staticmethod
+    def pad(cell_states: np.ndarray, topology: Topology, out: np.ndarray | None = None, width: int = 1) -> np.ndarray:
+        n_cells_x, n_cells_y = cell_states.shape
+        if width > min(n_cells_x, n_cells_y):
+            raise ValueError(f"Halo of {width} cells is wider than the {n_cells_x}x{n_cells_y} board.")
+        padded: np.ndarray = out if out is not None else np.empty(
+            (n_cells_x + 2 * width, n_cells_y + 2 * width), dtype=np.uint8)
+        padded[width:-width, width:-width] = cell_states
+        Halo.fill(padded, topology, width)
+        return padded
+
+    @staticmethod
+    def fill(padded: np.ndarray, topology: Topology, width: int = 1):
+        match topology:
+            case Topology.TORUS:
+                padded[:width, width:-width] = padded[-2 * width:-width, width:-width]
+                padded[-width:, width:-width] = padded[width:2 * width, width:-width]
+            case Topology.KLEIN_BOTTLE:
+                padded[:width, width:-width] = padded[-2 * width:-width, -width - 1:width - 1:-1]
+                padded[-width:, width:-width] = padded[width:2 * width, -width - 1:width - 1:-1]
+            case Topology.BOUNDED | Topology.INFINITE:
+                padded[:width] = CellState.DEAD
+                padded[-width:] = CellState.DEAD
+                padded[:, :width] = CellState.DEAD
+                padded[:, -width:] = CellState.DEAD
+                return
+            case _:
+                raise ValueError("Invalid topology.")
+
+        padded[:, :width] = padded[:, -2 * width:-width]
+        padded[:, -width:] = padded[:, width:2 * width]
@@ -4,6 +4,8 @@ from enum import Enum
 import numpy as np
 import pygame
 
+from camera import Camera
+
 
 class Color(Enum):
     BASE = (35, 33, 54)
@@ -45,6 +47,11 @@ class ButtonFactory:
         return Button(x, self.height - 60, width, 50, color, label, text_color)
 
 
+class RenderMode(Enum):
+    RECTS = 0
+    SURFARRAY = 1
+
+
 @dataclass
 class RendererSettings:
     screen_height: int
@@ -53,19 +60,27 @@ class RendererSettings:
     n_cells_y: int
     cell_height: int
     cell_width: int
+    render_mode: RenderMode = RenderMode.SURFARRAY
 
 
 class PygameRenderer:
+    min_grid_zoom: float = 4.0
 
     def __init__(self, screen: pygame.Surface, screen_settings: RendererSettings, buttons: list[Button]):
         self.screen: pygame.Surface = screen
         self.screen_settings: RendererSettings = screen_settings
         self.buttons = buttons
+        self.__font: pygame.font.Font = pygame.font.Font(None, 36)
+        self.__hud_font: pygame.font.Font = pygame.font.Font(None, 24)
+        self.__labels: dict[tuple[str, Color], pygame.Surface] = {}
+        self.__grid: pygame.Surface | None = None
 
     def __draw_button(self, button: Button):
         pygame.draw.rect(self.screen, button.color.value, (button.x, button.y, button.width, button.height))
-        font = pygame.font.Font(None, 36)
-        text = font.render(button.label, True, button.text_color.value)
+        key: tuple[str, Color] = (button.label, button.text_color)
+        if key not in self.__labels:
+            self.__labels[key] = self.__font.render(button.label, True, button.text_color.value)
+        text = self.__labels[key]
         text_rect = text.get_rect(
             center=(button.x + button.width // 2, button.y + button.height // 2)
         )
@@ -85,12 +100,63 @@ class PygameRenderer:
                 if current_generation[x, y] == 1:
                     pygame.draw.rect(self.screen, Color.IRIS.value, cell)
 
+    def __blit_grid(self):
+        if self.__grid is None:
+            self.__grid = pygame.Surface((self.screen_settings.screen_width, self.screen_settings.screen_height))
+            self.__grid.fill(Color.BASE.value)
+            self.__grid.set_colorkey(Color.BASE.value)
+            for y in range(0, self.screen_settings.screen_height, self.screen_settings.cell_height):
+                for x in range(0, self.screen_settings.screen_width, self.screen_settings.cell_width):
+                    cell = pygame.Rect(x, y, self.screen_settings.cell_width, self.screen_settings.cell_height)
+                    pygame.draw.rect(self.__grid, Color.SURFACE.value, cell, 1)
+        self.screen.blit(self.__grid, (0, 0))
+
+    def __blit_cells(self, current_generation: np.ndarray):
+        cells: pygame.Surface = pygame.surfarray.make_surface((current_generation == 1).astype(np.uint8))
+        cells.set_palette([Color.BASE.value, Color.IRIS.value])
+        cells.set_colorkey(Color.BASE.value)
+        self.screen.blit(pygame.transform.scale(cells, (self.screen_settings.n_cells_x * self.screen_settings.cell_width,
+                                                        self.screen_settings.n_cells_y * self.screen_settings.cell_height)),
+                         (0, 0))
+
+    def __blit_view(self, region: np.ndarray, camera: Camera):
+        cells: pygame.Surface = pygame.surfarray.make_surface((region == 1).astype(np.uint8))
+        cells.set_palette([Color.BASE.value, Color.IRIS.value])
+        cells.set_colorkey(Color.BASE.value)
+        sample_size: float = camera.get_step() * camera.zoom
+        offset_x, offset_y = camera.get_region_offset()
+        self.screen.blit(pygame.transform.scale(cells, (round(region.shape[0] * sample_size),
+                                                        round(region.shape[1] * sample_size))),
+                         (round(offset_x), round(offset_y)))
+
+        if camera.zoom >= PygameRenderer.min_grid_zoom:
+            for x in np.arange(offset_x, min(self.screen_settings.screen_width, region.shape[0] * sample_size + offset_x),
+                               camera.zoom):
+                pygame.draw.line(self.screen, Color.SURFACE.value, (round(x), 0),
+                                 (round(x), self.screen_settings.screen_height))
+            for y in np.arange(offset_y, min(self.screen_settings.screen_height, region.shape[1] * sample_size + offset_y),
+                               camera.zoom):
+                pygame.draw.line(self.screen, Color.SURFACE.value, (0, round(y)),
+                                 (self.screen_settings.screen_width, round(y)))
+
     def __draw_background(self):
         self.screen.fill(Color.BASE.value)
 
-    def draw(self, current_generation: np.ndarray):
+    def __draw_hud(self, hud_text: str):
+        text = self.__hud_font.render(hud_text, True, Color.TEXT.value, Color.OVERLAY.value)
+        self.screen.blit(text, (10, 10))
+
+    def draw(self, current_generation: np.ndarray, hud_text: str | None = None, camera: Camera | None = None):
         self.__draw_background()
-        self.__draw_grid()
-        self.__draw_cells(current_generation)
+        if camera is not None:
+            self.__blit_view(current_generation, camera)
+        elif self.screen_settings.render_mode is RenderMode.SURFARRAY:
+            self.__blit_grid()
+            self.__blit_cells(current_generation)
+        else:
+            self.__draw_grid()
+            self.__draw_cells(current_generation)
         [self.__draw_button(button) for button in self.buttons]
+        if hud_text is not None:
+            self.__draw_hud(hud_text)
         pygame.display.flip()
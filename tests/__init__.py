@@ -1,6 +1,33 @@
+import importlib
+import importlib.abc
+import importlib.util
 import os
 import sys
+from types import ModuleType
 
 PROJECT_PATH = os.getcwd()
 SOURCE_PATH = os.path.join(PROJECT_PATH, "src")
 sys.path.append(SOURCE_PATH)
+
+
+class SourceModuleAliases(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Resolves `src.<name>` to the `<name>` module the sources import, so each file is loaded only once."""
+
+    def find_spec(self, fullname: str, path, target=None):
+        if not fullname.startswith('src.') or fullname.count('.') != 1:
+            return None
+        name: str = fullname.removeprefix('src.')
+        if importlib.util.find_spec(name) is None:
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec) -> ModuleType:
+        module: ModuleType = importlib.import_module(spec.name.removeprefix('src.'))
+        spec.loader_state = module.__spec__
+        return module
+
+    def exec_module(self, module: ModuleType):
+        module.__spec__ = module.__spec__.loader_state
+
+
+sys.meta_path.insert(0, SourceModuleAliases())
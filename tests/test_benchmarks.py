@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import unittest
+
+from ddt import ddt, data
+
+from benchmarks.suite import BaselineComparison, BenchmarkResult
+
+
+@ddt
+class BaselineComparisonTest(unittest.TestCase):
+    def setUp(self):
+        self.baseline: list[BenchmarkResult] = [
+            BenchmarkResult('engine/numpy/100/random', 'generations_per_second', 100.0, True),
+            BenchmarkResult('engine/numpy/100/random', 'peak_memory_bytes', 1000.0, False),
+        ]
+
+    @data((70.0, 1000.0, 1), (95.0, 1000.0, 0), (100.0, 1300.0, 1), (150.0, 900.0, 0))
+    def test_compare_flagsResultsWorseThanThreshold(self, values_and_expected):
+        generations_per_second, peak_memory, expected = values_and_expected
+        results: list[BenchmarkResult] = [
+            BenchmarkResult('engine/numpy/100/random', 'generations_per_second', generations_per_second, True),
+            BenchmarkResult('engine/numpy/100/random', 'peak_memory_bytes', peak_memory, False),
+            BenchmarkResult('engine/packed/100/random', 'generations_per_second', 1.0, True),
+        ]
+
+        regressions: list[str] = BaselineComparison.compare(results, self.baseline, 0.2)
+
+        self.assertEqual(len(regressions), expected)
+
+
+class ParallelScalingTest(unittest.TestCase):
+    def test_script_measuresEveryWorkerCount(self):
+        result = subprocess.run([sys.executable, 'benchmarks/parallel_scaling.py', '-s', '64', '-g', '1', '-w', '2'],
+                                capture_output=True, text=True, timeout=120, check=True)
+
+        self.assertIn('parallel x1', result.stdout)
+        self.assertIn('parallel x2', result.stdout)
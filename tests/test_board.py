@@ -1,3 +1,4 @@
+import tracemalloc
 import unittest
 
 import numpy as np
@@ -5,6 +6,7 @@ from ddt import ddt, data
 
 from src.board import Board
 from src.cell import CellState
+from src.engine import Engine, EngineFactory
 from src.rule import Rule, Ruleset, RulesetFactory
 
 
@@ -40,3 +42,74 @@ class BoardTest(unittest.TestCase):
         actual = self.board.get_current_generation()
 
         np.testing.assert_array_equal(expected, actual)
+
+    def test_nextGeneration_swapsBetweenTwoPreallocatedBuffers(self):
+        self.board.randomize()
+        first: np.ndarray = self.board.get_current_generation()
+        self.board.next_generation()
+        second: np.ndarray = self.board.get_current_generation()
+        self.board.next_generation()
+
+        self.assertIsNot(first, second)
+        self.assertIs(self.board.get_current_generation(), first)
+        self.assertEqual(first.dtype, np.uint8)
+
+    @data(Engine.LOOP, Engine.NUMPY, Engine.TILED)
+    def test_nextGeneration_matchesFreshEngineOutput_whenSteppingIntoBuffers(self, engine):
+        generation: np.ndarray = np.random.default_rng(engine.value).choice([0, 1], size=(9, 14)).astype(np.uint8)
+        board: Board = Board(9, 14, self.ruleset, EngineFactory.get_engine(engine))
+        board.set_current_generation(generation)
+
+        for _ in range(6):
+            generation = EngineFactory.get_engine(Engine.LOOP).next_generation(generation, self.ruleset)
+            board.next_generation()
+
+            np.testing.assert_array_equal(generation, board.get_current_generation())
+
+    def test_nextGeneration_allocatesNoBoardSizedArrays(self):
+        board: Board = Board(1000, 800, self.ruleset)
+        board.randomize()
+        board.next_generation()
+
+        tracemalloc.start()
+        for _ in range(10):
+            board.next_generation()
+        peak_memory: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertLess(peak_memory, 1000 * 800)
+
+    def test_nextGeneration_stepsWithRulesetKernel_forGenerationsRule(self):
+        board: Board = Board(6, 6, RulesetFactory.get_custom_ruleset("B2/S/C3"))
+        board.set_cell_state(2, 2, CellState.ALIVE)
+        board.set_cell_state(2, 3, CellState.ALIVE)
+
+        board.next_generation()
+
+        self.assertEqual(board.get_current_generation()[2, 2], 2)
+        self.assertEqual(board.get_population(), 6)
+
+    def test_updateRuleset_clearsDyingStates_theNewRuleDoesNotHave(self):
+        board: Board = Board(3, 1, RulesetFactory.get_custom_ruleset("B2/S/C4"))
+        board.set_current_generation(np.array([[1], [2], [3]]))
+
+        board.update_ruleset(RulesetFactory.get_custom_ruleset("B2/S/C3"))
+        np.testing.assert_array_equal(board.get_current_generation()[:, 0], [1, 2, 0])
+        board.update_ruleset(RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+
+        np.testing.assert_array_equal(board.get_current_generation()[:, 0], [1, 0, 0])
+
+    def test_randomizeAndClear_updateBufferInPlace(self):
+        buffer: np.ndarray = self.board.get_current_generation()
+
+        self.board.randomize()
+        self.assertIs(self.board.get_current_generation(), buffer)
+        self.board.clear()
+
+        self.assertIs(self.board.get_current_generation(), buffer)
+        self.assertFalse(buffer.any())
+
+    def test_setCellStates_setsEveryListedCell(self):
+        self.board.set_cell_states(np.array([[0, 1], [4, 4], [2, 3]]), CellState.ALIVE)
+
+        np.testing.assert_array_equal(np.argwhere(self.board.get_current_generation()), [[0, 1], [2, 3], [4, 4]])
@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.camera import Camera
+from src.gol import BoardFactory, BoardType
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+@ddt
+class CameraTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    def test_init_fitsWholeBoardInView(self):
+        camera: Camera = Camera(400, 200, 100, 100)
+
+        self.assertEqual(camera.zoom, 0.25)
+        self.assertEqual(camera.get_step(), 4)
+        self.assertEqual(camera.get_region_bounds(), (0, 0, 100, 50, 4))
+
+    def test_zoomAt_keepsCellUnderCursorInPlace(self):
+        camera: Camera = Camera(1000, 1000, 100, 100)
+        before: tuple[int, int] | None = camera.screen_to_cell(30, 70)
+
+        camera.zoom_at(20.0, 30, 70)
+
+        self.assertEqual(camera.zoom, 2.0)
+        self.assertEqual(camera.screen_to_cell(30, 70), before)
+
+    def test_pan_isClampedToBoard(self):
+        camera: Camera = Camera(1000, 1000, 100, 100)
+        camera.zoom_at(10.0, 0, 0)
+
+        camera.pan(-10 ** 6, 50)
+
+        self.assertEqual((camera.x, camera.y), (900.0, 0.0))
+        self.assertEqual(camera.screen_to_cell(99, 0), (999, 0))
+
+    def test_getRegion_isBoundedByViewSize_notBoardSize(self):
+        board: Board = BoardFactory.create_board(BoardType.SPARSE, 50_000, 50_000, self.ruleset)
+        camera: Camera = Camera(board.n_cells_x, board.n_cells_y, 100, 80)
+
+        self.assertLessEqual(camera.get_region(board).shape, (2 * 100 + 1, 2 * 80 + 1))
+        camera.zoom_at(100.0, 50, 40)
+        self.assertLessEqual(camera.get_region(board).shape, (2 * 100 + 1, 2 * 80 + 1))
+
+    @data(BoardType.DENSE, BoardType.PACKED, BoardType.SPARSE)
+    def test_getRegion_poolsAnyAliveCell_whenZoomedOut(self, board_type):
+        board: Board = BoardFactory.create_board(board_type, 80, 80, self.ruleset)
+        board.set_cell_state(5, 6, 1)
+        board.set_cell_state(79, 79, 1)
+        camera: Camera = Camera(board.n_cells_x, board.n_cells_y, 20, 20)
+
+        region: np.ndarray = camera.get_region(board)
+
+        expected: np.ndarray = np.zeros((20, 20), dtype=np.uint8)
+        expected[1, 1] = 1
+        expected[19, 19] = 1
+        np.testing.assert_array_equal(region, expected)
+
+    @data(BoardType.DENSE, BoardType.PACKED, BoardType.SPARSE, BoardType.DISK)
+    def test_getRegion_poolsWholeBlock_whenZoomedFarOut(self, board_type):
+        generation: np.ndarray = np.random.default_rng(8).random((400, 300)) < 0.002
+        board: Board = BoardFactory.create_board(board_type, 400, 300, self.ruleset)
+        board.set_current_generation(generation)
+        camera: Camera = Camera(board.n_cells_x, board.n_cells_y, 20, 20)
+
+        region: np.ndarray = camera.get_region(board)
+
+        self.assertEqual(camera.get_step(), 20)
+        expected: np.ndarray = generation.reshape(20, 20, 15, 20).any(axis=(1, 3))
+        np.testing.assert_array_equal(region, expected)
+
+    @data(BoardType.DENSE, BoardType.PACKED, BoardType.SPARSE)
+    def test_getRegion_matchesBoardSlice_whenZoomedIn(self, board_type):
+        generation: np.ndarray = np.random.default_rng(7).choice([0, 1], size=(70, 90))
+        board: Board = BoardFactory.create_board(board_type, 70, 90, self.ruleset)
+        board.set_current_generation(generation)
+        camera: Camera = Camera(board.n_cells_x, board.n_cells_y, 40, 40)
+        camera.zoom_at(4.0, 0, 0)
+        camera.pan(-100, -80)
+
+        x, y, width, height, _ = camera.get_region_bounds()
+
+        np.testing.assert_array_equal(camera.get_region(board), generation[x:x + width, y:y + height])
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.census import Census, ComponentLabeller, PatternLibrary
+from src.gol import main
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.topology import Topology
+
+
+@ddt
+class CensusTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.census: Census = Census(self.ruleset)
+
+    @staticmethod
+    def __place(generation: np.ndarray, pattern: str, x: int, y: int, rotation: int = 0, flip: bool = False):
+        cells: np.ndarray = np.rot90(PatternLibrary.parse(pattern), rotation)
+        if flip:
+            cells = cells.T
+        generation[x:x + cells.shape[0], y:y + cells.shape[1]] |= cells
+
+    def test_label_separatesComponents_andJoinsDiagonalNeighbours(self):
+        alive: np.ndarray = np.zeros((8, 8), dtype=bool)
+        alive[1, 1] = alive[2, 2] = alive[3, 1] = True
+        alive[6, 5] = True
+
+        labels: np.ndarray = ComponentLabeller.label(alive, Topology.BOUNDED, reach=1)
+
+        self.assertEqual(len(set(labels[alive])), 2)
+        self.assertEqual(labels[1, 1], labels[3, 1])
+        self.assertNotEqual(labels[1, 1], labels[6, 5])
+        np.testing.assert_array_equal(labels[~alive], 0)
+
+    def test_label_joinsLongChains(self):
+        alive: np.ndarray = np.zeros((64, 64), dtype=bool)
+        alive[::4] = True
+        alive[1::8, -1] = alive[2::8, -1] = alive[3::8, -1] = True
+        alive[5::8, 0] = alive[6::8, 0] = alive[7::8, 0] = True
+
+        self.assertEqual(len(np.unique(ComponentLabeller.label(alive, Topology.BOUNDED, reach=1)[alive])), 1)
+
+    @data((1, 2), (2, 1))
+    def test_label_joinsCellsWithinReach(self, reach_and_expected):
+        reach, expected = reach_and_expected
+        alive: np.ndarray = np.zeros((8, 8), dtype=bool)
+        alive[1, 1] = alive[3, 3] = True
+
+        self.assertEqual(len(np.unique(ComponentLabeller.label(alive, Topology.BOUNDED, reach)[alive])), expected)
+
+    @data((Topology.TORUS, 1), (Topology.BOUNDED, 2))
+    def test_label_wrapsAroundTorus(self, topology_and_expected):
+        topology, expected = topology_and_expected
+        alive: np.ndarray = np.zeros((10, 10), dtype=bool)
+        alive[0, 4] = alive[9, 5] = True
+
+        self.assertEqual(len(np.unique(ComponentLabeller.label(alive, topology)[alive])), expected)
+
+    def test_canonicalize_isInvariantUnderRotationAndReflection(self):
+        glider: np.ndarray = PatternLibrary.parse('.*.\n..*\n***')
+        canonical: bytes = PatternLibrary.canonicalize(glider)
+
+        for rotation in range(4):
+            self.assertEqual(PatternLibrary.canonicalize(np.rot90(glider, rotation)), canonical)
+            self.assertEqual(PatternLibrary.canonicalize(np.rot90(glider, rotation).T), canonical)
+        self.assertNotEqual(PatternLibrary.canonicalize(PatternLibrary.parse('**\n**')), canonical)
+
+    def test_library_containsEveryPhaseOfOscillatorsAndSpaceships(self):
+        library: PatternLibrary = PatternLibrary.get(self.ruleset)
+        board: Board = Board(40, 40, self.ruleset, topology=Topology.BOUNDED)
+        generation: np.ndarray = np.zeros((40, 40), dtype=np.uint8)
+        CensusTest.__place(generation, '.*..*\n*....\n*...*\n****.', 10, 10)
+        CensusTest.__place(generation, '**..\n**..\n..**\n..**', 30, 30)
+        board.set_current_generation(generation)
+
+        self.assertEqual(library.identify(PatternLibrary.parse('**..\n*...\n...*\n..**')), 'beacon')
+        for _ in range(4):
+            self.assertEqual(self.census.take_board(board),
+                             Counter({'lightweight spaceship': 1, 'beacon': 1}))
+            board.next_generation()
+
+    def test_library_includesSavedPatternsForTheirRule(self):
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(os.path.join(directory.name, 'pentomino.pylife'), 'w') as writer:
+            writer.write('#Name:R-pentomino\n#Rulestring:B3/S23\n.**\n**.\n.*.\n')
+        with open(os.path.join(directory.name, 'other.pylife'), 'w') as writer:
+            writer.write('#Name:Other rule\n#Rulestring:B36/S23\n***\n*..\n')
+
+        library: PatternLibrary = PatternLibrary.get(self.ruleset, directory.name)
+
+        self.assertIn('R-pentomino', library.get_names())
+        self.assertNotIn('Other rule', library.get_names())
+        self.assertIn('glider', library.get_names())
+        self.assertIs(PatternLibrary.get(self.ruleset, directory.name), library)
+
+    def test_take_countsKnownObjects_inAnyOrientation(self):
+        generation: np.ndarray = np.zeros((32, 32), dtype=np.uint8)
+        CensusTest.__place(generation, '**\n**', 1, 1)
+        CensusTest.__place(generation, '**\n**', 1, 20)
+        CensusTest.__place(generation, '.**.\n*..*\n.**.', 10, 1, rotation=1)
+        CensusTest.__place(generation, '**.\n*.*\n.*.', 10, 10, rotation=2, flip=True)
+        CensusTest.__place(generation, '***', 20, 20, rotation=1)
+        CensusTest.__place(generation, '.*.\n..*\n***', 20, 5, rotation=3)
+
+        counts: Counter[str] = self.census.take(generation, Topology.BOUNDED)
+
+        self.assertEqual(counts, Counter({'block': 2, 'beehive': 1, 'boat': 1, 'blinker': 1, 'glider': 1}))
+
+    def test_take_countsTrafficLightAsOneObject(self):
+        generation: np.ndarray = np.zeros((16, 16), dtype=np.uint8)
+        CensusTest.__place(generation, '..***..\n.......\n*.....*\n*.....*\n*.....*\n.......\n..***..', 4, 4)
+        board: Board = Board(16, 16, self.ruleset)
+        board.set_current_generation(generation)
+
+        self.assertEqual(self.census.take_board(board), Counter({'traffic light': 1}))
+        board.next_generation()
+        self.assertEqual(self.census.take_board(board), Counter({'traffic light': 1}))
+
+    def test_take_findsObjectsAcrossTheTorusEdge(self):
+        generation: np.ndarray = np.zeros((20, 20), dtype=np.uint8)
+        generation[np.ix_([19, 0], [19, 0])] = 1
+        generation[[18, 19, 0], 10] = 1
+
+        self.assertEqual(self.census.take(generation), Counter({'block': 1, 'blinker': 1}))
+
+    def test_take_namesUnknownObjectsByCanonicalHash(self):
+        generation: np.ndarray = np.zeros((16, 16), dtype=np.uint8)
+        other: np.ndarray = np.zeros((16, 16), dtype=np.uint8)
+        CensusTest.__place(generation, '**..\n**..\n....\n.***', 2, 2)
+        CensusTest.__place(other, '**..\n**..\n....\n.***', 8, 5, rotation=1, flip=True)
+
+        name: str = next(iter(self.census.take(generation)))
+
+        self.assertTrue(name.startswith('x7_'))
+        self.assertEqual(self.census.take(other), Counter({name: 1}))
+
+    def test_takeAll_countsEveryBoardOfAStack(self):
+        generations: np.ndarray = np.zeros((3, 12, 12), dtype=np.uint8)
+        CensusTest.__place(generations[0], '**\n**', 2, 2)
+        CensusTest.__place(generations[2], '***', 5, 5)
+        CensusTest.__place(generations[2], '.*.\n*.*\n.*.', 1, 1)
+
+        counts: list[Counter[str]] = self.census.take_all(generations)
+
+        self.assertEqual(counts, [Counter({'block': 1}), Counter(), Counter({'blinker': 1, 'tub': 1})])
+
+    def test_main_census_writesObjectCounts(self):
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        main(['census', '-n', '50', '-g', '300', '-o', os.path.join(directory.name, 'census.json')])
+
+        with open(os.path.join(directory.name, 'census.json')) as reader:
+            counts: dict[str, int] = json.load(reader)
+        self.assertGreater(counts.get('block', 0) + counts.get('blinker', 0), 0)
@@ -0,0 +1,134 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.cycle import Cycle, CycleDetector
+from src.gol import HeadlessRunner, RunStatistics
+from src.packed import PackedBoard
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.simulation import Simulation
+from src.sparse import SparseBoard
+
+
+@ddt
+class CycleDetectorTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    def __create_board(self, board_type: type, cells: list[tuple[int, int]]) -> Board:
+        board: Board = board_type(16, 16, self.ruleset)
+        for x, y in cells:
+            board.set_cell_state(x, y, 1)
+        return board
+
+    def __run_until_cycle(self, board: Board, detector: CycleDetector, generations: int) -> Cycle | None:
+        cycle: Cycle | None = detector.observe(board, 0)
+        for generation in range(1, generations + 1):
+            if cycle is not None:
+                break
+            board.next_generation()
+            cycle = detector.observe(board, generation)
+        return cycle
+
+    @data(Board, PackedBoard, SparseBoard)
+    def test_observe_detectsExtinction_forBoardTypes(self, board_type):
+        cycle: Cycle | None = self.__run_until_cycle(self.__create_board(board_type, [(3, 3), (3, 4)]),
+                                                     CycleDetector(), 5)
+
+        self.assertEqual((cycle.kind.value, cycle.start, cycle.period), ('extinction', 1, 1))
+
+    @data(Board, PackedBoard, SparseBoard)
+    def test_observe_detectsStillLife_forBoardTypes(self, board_type):
+        cycle: Cycle | None = self.__run_until_cycle(self.__create_board(board_type, [(3, 3), (3, 4), (4, 3), (4, 4)]),
+                                                     CycleDetector(), 5)
+
+        self.assertEqual((cycle.kind.value, cycle.start, cycle.generation, cycle.period), ('still life', 0, 2, 1))
+
+    @data(Board, PackedBoard, SparseBoard)
+    def test_observe_detectsBlinkerPeriod_forBoardTypes(self, board_type):
+        cycle: Cycle | None = self.__run_until_cycle(self.__create_board(board_type, [(8, 4), (8, 5), (8, 6)]),
+                                                     CycleDetector(), 5)
+
+        self.assertEqual((cycle.kind.value, cycle.start, cycle.generation, cycle.period), ('oscillator', 0, 4, 2))
+        self.assertEqual(cycle.describe(), 'period 2 oscillator since generation 0')
+
+    def test_observe_missesPeriodLongerThanHistory(self):
+        glider: Board = self.__create_board(Board, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+
+        self.assertIsNone(self.__run_until_cycle(glider, CycleDetector(max_period=63), 200))
+        self.assertEqual(self.__run_until_cycle(glider, CycleDetector(max_period=64), 200).period, 64)
+
+    def test_observe_tellsDyingStatesApart_forGenerationsBoard(self):
+        board: Board = Board(4, 4, RulesetFactory.get_custom_ruleset('B2/S/C3'))
+        detector: CycleDetector = CycleDetector()
+        cycle: Cycle | None = None
+
+        for generation, cell_state in enumerate((1, 2, 1, 2, 1)):
+            board.set_cell_state(1, 1, cell_state)
+            cycle = detector.observe(board, generation)
+
+        self.assertEqual((cycle.kind.value, cycle.period), ('oscillator', 2))
+
+    def test_observe_ignoresDigestCollision_whenStatesDiffer(self):
+        glider: Board = self.__create_board(Board, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+        digest: mock.Mock = mock.Mock(digest=mock.Mock(return_value=b'collision'))
+
+        with mock.patch('hashlib.blake2b', return_value=digest):
+            self.assertIsNone(self.__run_until_cycle(glider, CycleDetector(), 20))
+
+    def test_init_raisesValueError_whenMaxPeriodNotPositive(self):
+        self.assertRaises(ValueError, CycleDetector, 0)
+
+
+class CycleRunTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.generation: np.ndarray = np.random.default_rng(4).choice([0, 1], size=(24, 24), p=[0.7, 0.3])
+
+    def test_run_fastForwardsToRequestedGeneration_whenCycleDetected(self):
+        expected: Board = Board(24, 24, self.ruleset)
+        expected.set_current_generation(np.copy(self.generation))
+        for _ in range(1001):
+            expected.next_generation()
+        board: Board = Board(24, 24, self.ruleset)
+        board.set_current_generation(np.copy(self.generation))
+
+        statistics: RunStatistics = HeadlessRunner(board, CycleDetector(), fast_forward=True).run(1001)
+
+        np.testing.assert_array_equal(expected.get_current_generation(), board.get_current_generation())
+        self.assertEqual(statistics.generations, 1001)
+        self.assertLess(statistics.stepped_generations, 1001)
+        self.assertIsNotNone(statistics.cycle)
+
+    def test_run_stopsAtDetection_whenNotFastForwarding(self):
+        board: Board = Board(24, 24, self.ruleset)
+        board.set_current_generation(np.copy(self.generation))
+
+        statistics: RunStatistics = HeadlessRunner(board, CycleDetector()).run(1001)
+
+        self.assertEqual(statistics.generations, statistics.stepped_generations)
+        self.assertLess(statistics.generations, 1001)
+
+    def test_simulation_pausesOnCycle_andResetsOnResume(self):
+        board: Board = Board(16, 16, self.ruleset)
+        for y in (4, 5, 6):
+            board.set_cell_state(8, y, 1)
+        simulation: Simulation = Simulation(board, cycle_detector=CycleDetector())
+        simulation.resume()
+
+        for _ in range(5):
+            simulation.update()
+
+        self.assertTrue(simulation.is_paused())
+        self.assertEqual(simulation.generation, 4)
+        self.assertEqual(simulation.cycle.period, 2)
+
+        simulation.resume()
+        self.assertIsNone(simulation.cycle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.disk import DiskBoard
+from src.gol import main
+from src.instrumentation import Profiler
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.topology import Topology
+
+
+@ddt
+class DiskBoardTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.generation: np.ndarray = np.random.default_rng(3).random((37, 23)) < 0.35
+
+    def __create_board(self, max_memory_bytes: int = 1000, topology: Topology = Topology.TORUS) -> DiskBoard:
+        board: DiskBoard = DiskBoard(37, 23, self.ruleset, max_memory_bytes=max_memory_bytes, topology=topology)
+        self.addCleanup(board.close)
+        board.set_current_generation(self.generation)
+        return board
+
+    @data(Topology.TORUS, Topology.BOUNDED, Topology.KLEIN_BOTTLE)
+    def test_nextGeneration_matchesInMemoryBoard_acrossStripes(self, topology):
+        disk_board: DiskBoard = self.__create_board(topology=topology)
+        board: Board = Board(37, 23, self.ruleset, topology=topology)
+        board.set_current_generation(self.generation)
+
+        self.assertLess(disk_board.get_stripe_rows(), 37)
+        for _ in range(40):
+            disk_board.next_generation()
+            board.next_generation()
+            np.testing.assert_array_equal(disk_board.get_current_generation(), board.get_current_generation())
+        self.assertEqual(disk_board.get_population(), board.get_population())
+
+    @data(1, 1 << 20)
+    def test_nextGeneration_doesNotDependOnStripeRows(self, max_memory_bytes):
+        board: Board = Board(37, 23, self.ruleset)
+        board.set_current_generation(self.generation)
+        disk_board: DiskBoard = self.__create_board(max_memory_bytes)
+
+        for _ in range(10):
+            disk_board.next_generation()
+            board.next_generation()
+
+        np.testing.assert_array_equal(disk_board.get_current_generation(), board.get_current_generation())
+
+    def test_nextGeneration_reportsBirthsAndDeathsToProfiler(self):
+        board: Board = Board(37, 23, self.ruleset)
+        board.set_current_generation(self.generation)
+        board.set_profiler(Profiler())
+        disk_board: DiskBoard = self.__create_board()
+        disk_board.set_profiler(Profiler())
+        statistics: list = []
+        disk_board.profiler.add_hook(statistics.append)
+        board.profiler.add_hook(statistics.append)
+
+        disk_board.next_generation()
+        board.next_generation()
+
+        self.assertEqual(statistics[0], statistics[1])
+
+    def test_nextGeneration_staysWithinMemoryCeiling(self):
+        max_memory_bytes: int = 1 << 20
+        board: DiskBoard = DiskBoard(1000, 1000, self.ruleset, max_memory_bytes=max_memory_bytes)
+        self.addCleanup(board.close)
+        board.randomize()
+
+        tracemalloc.start()
+        board.next_generation()
+        population: int = board.get_population()
+        peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertGreater(population, 0)
+        self.assertLess(peak, max_memory_bytes)
+
+    def test_editing_writesThroughToTheFile(self):
+        board: DiskBoard = self.__create_board()
+        board.clear()
+
+        board.change_cell_state(3, 4)
+        board.set_cell_states(np.array([[5, 6], [36, 22]]), 1)
+
+        self.assertEqual(board.get_population(), 3)
+        self.assertEqual(board.get_current_generation()[36, 22], 1)
+
+    def test_close_removesTemporaryFiles(self):
+        board: DiskBoard = DiskBoard(8, 8, self.ruleset)
+        directory: str = board.directory
+
+        board.close()
+
+        self.assertFalse(os.path.exists(directory))
+
+    def test_init_raisesError_forUnsupportedRulesAndTopologies(self):
+        with self.assertRaises(ValueError):
+            DiskBoard(8, 8, RulesetFactory.get_custom_ruleset('B2/S/C3'))
+        with self.assertRaises(ValueError):
+            DiskBoard(8, 8, self.ruleset, topology=Topology.INFINITE)
+
+    def test_main_run_stepsDiskBoard(self):
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output: str = os.path.join(directory.name, 'final.pylife')
+
+        main(['run', '-b', 'disk', '-x', '64', '-y', '64', '-g', '20', '--memory-mb', '1', '-o', output])
+
+        self.assertTrue(os.path.exists(output))
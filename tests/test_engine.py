@@ -0,0 +1,200 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.engine import Engine, EngineFactory, JitEngine, ParallelEngine, StepEngine, TiledEngine, _JitKernel
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+@ddt
+class NumpyEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.loop_engine: StepEngine = EngineFactory.get_engine(Engine.LOOP)
+        self.numpy_engine: StepEngine = EngineFactory.get_engine(Engine.NUMPY)
+
+    @data(*[rule for rule in Rule if rule is not Rule.CUSTOM])
+    def test_nextGeneration_matchesLoopEngine_forBuiltInRules(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+        generation: np.ndarray = np.random.default_rng(rule.value).choice([0.0, 1.0], size=(13, 9))
+
+        for _ in range(5):
+            expected: np.ndarray = self.loop_engine.next_generation(generation, ruleset)
+            actual: np.ndarray = self.numpy_engine.next_generation(generation, ruleset)
+
+            np.testing.assert_array_equal(expected, actual)
+            generation = expected
+
+    @data("B0/S8", "B/S", "B12345678/S012345678")
+    def test_nextGeneration_matchesLoopEngine_forCustomRules(self, rulestring):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset(rulestring)
+        generation: np.ndarray = np.random.default_rng(0).choice([0.0, 1.0], size=(7, 11))
+
+        expected: np.ndarray = self.loop_engine.next_generation(generation, ruleset)
+        actual: np.ndarray = self.numpy_engine.next_generation(generation, ruleset)
+
+        np.testing.assert_array_equal(expected, actual)
+
+    def test_nextGeneration_wrapsAroundTorusEdges(self):
+        board: Board = Board(6, 6, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE), self.numpy_engine)
+        for x in (5, 0, 1):
+            board.set_cell_state(x, 0, 1)
+        expected: np.ndarray = np.zeros((6, 6))
+        expected[0, 5] = 1
+        expected[0, 0] = 1
+        expected[0, 1] = 1
+
+        board.next_generation()
+
+        np.testing.assert_array_equal(expected, board.get_current_generation())
+
+
+@ddt
+class ParallelEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.numpy_engine: StepEngine = EngineFactory.get_engine(Engine.NUMPY)
+        self.parallel_engine: ParallelEngine = ParallelEngine(workers=3)
+
+    def tearDown(self):
+        self.parallel_engine.close()
+
+    @data((16, 10), (2, 7), (31, 5))
+    def test_nextGeneration_matchesNumpyEngine_forBoardSizes(self, size):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        generation: np.ndarray = np.random.default_rng(sum(size)).choice([0.0, 1.0], size=size)
+
+        for _ in range(5):
+            expected: np.ndarray = self.numpy_engine.next_generation(generation, ruleset)
+            actual: np.ndarray = self.parallel_engine.next_generation(generation, ruleset)
+
+            np.testing.assert_array_equal(expected, actual)
+            self.assertEqual(expected.dtype, actual.dtype)
+            generation = expected
+
+    def test_nextGeneration_followsRulesetChanges(self):
+        generation: np.ndarray = np.random.default_rng(3).choice([0, 1], size=(12, 12)).astype(np.uint8)
+
+        for rule in (Rule.CONWAYS_LIFE, Rule.SEEDS, Rule.DAY_AND_NIGHT):
+            ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+            expected: np.ndarray = self.numpy_engine.next_generation(generation, ruleset)
+            actual: np.ndarray = self.parallel_engine.next_generation(generation, ruleset)
+
+            np.testing.assert_array_equal(expected, actual)
+
+    def test_getEngine_passesWorkerCount(self):
+        engine: ParallelEngine = EngineFactory.get_engine(Engine.PARALLEL, workers=2)
+
+        self.assertEqual(engine.workers, 2)
+
+
+@ddt
+class TiledEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.numpy_engine: StepEngine = EngineFactory.get_engine(Engine.NUMPY)
+        self.tiled_engine: TiledEngine = TiledEngine(tile_size=8)
+
+    @data((64, 64), (50, 37), (9, 70))
+    def test_nextGeneration_matchesNumpyEngine_whileSoupSettles(self, size):
+        generation: np.ndarray = np.random.default_rng(sum(size)).choice([0.0, 1.0], size=size, p=[0.8, 0.2])
+        expected: np.ndarray = generation
+
+        for _ in range(150):
+            expected = self.numpy_engine.next_generation(expected, self.ruleset)
+            generation = self.tiled_engine.next_generation(generation, self.ruleset)
+
+            np.testing.assert_array_equal(expected, generation)
+
+    def test_nextGeneration_matchesNumpyEngine_whenSteppingIntoTheLastSource(self):
+        generation: np.ndarray = np.random.default_rng(5).choice([0, 1], size=(64, 64), p=[0.9, 0.1]).astype(np.uint8)
+        expected: np.ndarray = generation
+        buffer: np.ndarray = np.empty_like(generation)
+
+        for _ in range(150):
+            expected = self.numpy_engine.next_generation(expected, self.ruleset)
+            generation, buffer = self.tiled_engine.next_generation(generation, self.ruleset, buffer), generation
+
+            np.testing.assert_array_equal(expected, generation)
+
+    def test_nextGeneration_copiesSkippedTiles_intoAnyOtherBuffer(self):
+        generation: np.ndarray = np.zeros((64, 64), dtype=np.uint8)
+        generation[30, 30:33] = 1
+        generation = self.tiled_engine.next_generation(generation, self.ruleset)
+
+        actual: np.ndarray = self.tiled_engine.next_generation(generation, self.ruleset, np.ones_like(generation))
+
+        np.testing.assert_array_equal(actual, self.numpy_engine.next_generation(generation, self.ruleset))
+
+    def test_nextGeneration_skipsTilesAwayFromGlider(self):
+        board: Board = Board(64, 64, self.ruleset, self.tiled_engine)
+        for x, y in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]:
+            board.set_cell_state(x + 30, y + 30, 1)
+
+        board.next_generation()
+        board.next_generation()
+
+        self.assertEqual(self.tiled_engine.get_total_tiles(), 64)
+        self.assertGreaterEqual(self.tiled_engine.get_skipped_tiles(), 64 - 16)
+
+    def test_nextGeneration_recomputesAfterBoardChanges(self):
+        board: Board = Board(64, 64, self.ruleset, self.tiled_engine)
+        reference: Board = Board(64, 64, self.ruleset, self.numpy_engine)
+        for current in (board, reference):
+            for y in (10, 11, 12):
+                current.set_cell_state(10, y, 1)
+
+        for generation in range(12):
+            if generation == 6:
+                for current in (board, reference):
+                    for x in (50, 51, 52):
+                        current.set_cell_state(x, 50, 1)
+            board.next_generation()
+            reference.next_generation()
+
+            np.testing.assert_array_equal(reference.get_current_generation(), board.get_current_generation())
+
+
+@ddt
+class JitEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.numpy_engine: StepEngine = EngineFactory.get_engine(Engine.NUMPY)
+
+    @data(*[rule for rule in Rule if rule is not Rule.CUSTOM])
+    def test_nextGeneration_matchesNumpyEngine_forBuiltInRules(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+        jit_engine: StepEngine = EngineFactory.get_engine(Engine.JIT)
+        generation: np.ndarray = np.random.default_rng(rule.value).choice([0, 1], size=(17, 12)).astype(np.uint8)
+
+        for _ in range(5):
+            expected: np.ndarray = self.numpy_engine.next_generation(generation, ruleset)
+            actual: np.ndarray = jit_engine.next_generation(generation, ruleset)
+
+            np.testing.assert_array_equal(expected, actual)
+            generation = expected
+
+    def test_nextGeneration_fallsBackToNumpyEngine_whenJitIsNotInstalled(self):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        generation: np.ndarray = np.random.default_rng(0).choice([0.0, 1.0], size=(9, 14))
+        with mock.patch.dict('sys.modules', {'numba': None, 'jit': None}):
+            jit_engine: JitEngine = JitEngine()
+
+        actual: np.ndarray = jit_engine.next_generation(generation, ruleset)
+
+        self.assertFalse(jit_engine.is_compiled())
+        np.testing.assert_array_equal(self.numpy_engine.next_generation(generation, ruleset), actual)
+
+    @unittest.skipUnless(_JitKernel.get() is not None, 'Numba is not installed.')
+    def test_nextGeneration_fallsBackToNumpyEngine_whenJitFailsToCompile(self):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        generation: np.ndarray = np.random.default_rng(0).choice([0, 1], size=(9, 14)).astype(np.uint8)
+        with (mock.patch.object(_JitKernel, 'kernel', None), mock.patch.object(_JitKernel, 'failed', False),
+              mock.patch('jit.step', side_effect=RuntimeError('no cache'))):
+            with self.assertLogs(level='WARNING'):
+                jit_engine: JitEngine = JitEngine()
+
+        actual: np.ndarray = jit_engine.next_generation(generation, ruleset)
+
+        self.assertFalse(jit_engine.is_compiled())
+        np.testing.assert_array_equal(self.numpy_engine.next_generation(generation, ruleset), actual)
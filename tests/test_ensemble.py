@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.board import Board
+from src.ensemble import BoardEnsemble, SweepResult, SweepRunner
+from src.gol import main
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+class BoardEnsembleTest(unittest.TestCase):
+    def setUp(self):
+        self.rulesets: list[Ruleset] = [RulesetFactory.get_ruleset(rule)
+                                        for rule in (Rule.CONWAYS_LIFE, Rule.DAY_AND_NIGHT, Rule.SEEDS, Rule.MAZE)]
+
+    def test_nextGeneration_matchesSeparateBoards_withPerBoardRulesets(self):
+        ensemble: BoardEnsemble = BoardEnsemble(12, 17, self.rulesets)
+        ensemble.randomize([3, 5, 7, 11])
+        boards: list[Board] = []
+        for index, ruleset in enumerate(self.rulesets):
+            boards.append(Board(12, 17, ruleset))
+            boards[-1].set_current_generation(np.copy(ensemble.get_generation(index)))
+
+        for _ in range(12):
+            ensemble.next_generation()
+            for index, board in enumerate(boards):
+                board.next_generation()
+                np.testing.assert_array_equal(board.get_current_generation(), ensemble.get_generation(index))
+
+    def test_randomize_raisesValueError_whenSeedCountDiffers(self):
+        ensemble: BoardEnsemble = BoardEnsemble(4, 4, self.rulesets)
+
+        self.assertRaises(ValueError, ensemble.randomize, [1, 2])
+
+    def test_init_raisesValueError_whenNoRulesets(self):
+        self.assertRaises(ValueError, BoardEnsemble, 4, 4, [])
+
+
+class SweepRunnerTest(unittest.TestCase):
+    def test_run_recordsPopulationCurvesAndFinalGenerations_acrossBatches(self):
+        rulesets: list[Ruleset] = [RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE), RulesetFactory.get_ruleset(Rule.SEEDS)]
+
+        result: SweepResult = SweepRunner(10, 10, batch_size=3).run(rulesets, [0, 1, 2, 3], 6)
+
+        self.assertEqual(result.populations.shape, (2, 4, 7))
+        self.assertEqual(result.final_generations.shape, (2, 4, 10, 10))
+        self.assertEqual(result.rulestrings, ['B3/S23', 'B2/S'])
+        for rule_index, ruleset in enumerate(rulesets):
+            for seed_index, seed in enumerate([0, 1, 2, 3]):
+                ensemble: BoardEnsemble = BoardEnsemble(10, 10, [ruleset])
+                ensemble.randomize([seed])
+                populations: list[int] = [int(ensemble.get_populations()[0])]
+                for _ in range(6):
+                    ensemble.next_generation()
+                    populations.append(int(ensemble.get_populations()[0]))
+
+                self.assertEqual(result.populations[rule_index, seed_index].tolist(), populations)
+                np.testing.assert_array_equal(result.final_generations[rule_index, seed_index],
+                                              ensemble.get_generation(0))
+
+    def test_main_writesSweepResults(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output: str = os.path.join(directory, 'sweep.npz')
+            main(['sweep', '-R', 'conways_life', 'maze', '-r', 'B36/S23', '-n', '5', '-g', '3', '-x', '8', '-y', '8',
+                  '-o', output])
+            with np.load(output) as result:
+                self.assertEqual(result['populations'].shape, (3, 5, 4))
+                self.assertEqual(result['rulestrings'].tolist(), ['B3/S23', 'B3/S12345', 'B36/S23'])
+
+
+if __name__ == '__main__':
+    unittest.main()
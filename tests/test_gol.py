@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board, BoardPersistence
+from src.engine import Engine
+from src.gol import BoardFactory, BoardType, HeadlessRunner, RunStatistics, main
+from src.rule import Rule, RulesetFactory
+
+
+@ddt
+class HeadlessRunnerTest(unittest.TestCase):
+    def test_run_stepsBoardAndReportsStatistics(self):
+        board: Board = Board(20, 30, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        board.randomize()
+        expected: Board = Board(20, 30, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        expected.set_current_generation(np.copy(board.get_current_generation()))
+        for _ in range(10):
+            expected.next_generation()
+
+        statistics: RunStatistics = HeadlessRunner(board).run(10)
+
+        np.testing.assert_array_equal(expected.get_current_generation(), board.get_current_generation())
+        self.assertEqual(statistics.generations, 10)
+        self.assertEqual(statistics.population, np.count_nonzero(expected.get_current_generation()))
+        self.assertAlmostEqual(statistics.cells_per_second / statistics.generations_per_second, 600)
+
+    @data(*BoardType)
+    def test_main_runsPatternAndWritesFinalGenerationAndStatistics(self, board_type):
+        expected: Board = Board(1, 1, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        BoardPersistence.load(expected, 'saved/glider.pylife')
+        for _ in range(8):
+            expected.next_generation()
+
+        with tempfile.TemporaryDirectory() as directory:
+            output: str = os.path.join(directory, 'final.pylife')
+            stats: str = os.path.join(directory, 'stats.json')
+            main(['run', '-p', 'saved/glider.pylife', '-g', '8', '-b', board_type.name.lower(), '-o', output, '-s', stats])
+            actual: Board = Board(1, 1, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+            BoardPersistence.load(actual, output)
+            with open(stats) as reader:
+                statistics: dict = json.load(reader)
+
+        np.testing.assert_array_equal(expected.get_current_generation(), actual.get_current_generation())
+        self.assertEqual(statistics['generations'], 8)
+        self.assertEqual(statistics['population'], 5)
+
+    def test_createBoard_createsBoardOfRequestedType(self):
+        board: Board = BoardFactory.create_board(BoardType.PACKED, 3, 4, RulesetFactory.get_ruleset(Rule.MAZE))
+
+        self.assertEqual(type(board).__name__, 'PackedBoard')
+
+    def test_createBoard_passesWorkerCountToEngine(self):
+        board: Board = BoardFactory.create_board(BoardType.DENSE, 3, 4, RulesetFactory.get_ruleset(Rule.MAZE),
+                                                 Engine.PARALLEL, workers=2)
+
+        self.assertEqual(board.engine.workers, 2)
+
+    def test_import_doesNotLoadDisplayModules(self):
+        code: str = 'import sys; import gol; print("pygame" in sys.modules or "tkinter" in sys.modules)'
+
+        result = subprocess.run([sys.executable, '-c', code], cwd='src', capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_import_doesNotLoadSubcommandModules(self):
+        modules: str = '{"asyncio", "census", "disk", "ensemble", "packed", "recording", "server", "simulation", "sparse"}'
+        code: str = f'import sys; import gol; print(sorted({modules} & set(sys.modules)))'
+
+        result = subprocess.run([sys.executable, '-c', code], cwd='src', capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), '[]')
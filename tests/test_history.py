@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.history import History
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+@ddt
+class HistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.board: Board = Board(24, 19, self.ruleset)
+        self.board.set_current_generation(np.random.default_rng(0).choice([0, 1], size=(24, 19)))
+
+    def __run(self, history: History, generations: int) -> list[np.ndarray]:
+        generations_seen: list[np.ndarray] = []
+        for generation in range(generations):
+            if generation > 0:
+                self.board.next_generation()
+            history.record(self.board, generation)
+            generations_seen.append(np.copy(self.board.get_current_generation()))
+        return generations_seen
+
+    @data(1, 4, 64)
+    def test_seek_replaysAnyRecordedGeneration(self, keyframe_interval):
+        history: History = History(keyframe_interval)
+        expected: list[np.ndarray] = self.__run(history, 30)
+
+        for generation in (29, 0, 13, 4, 5, 28):
+            np.testing.assert_array_equal(history.seek(generation), expected[generation])
+        self.assertEqual(history.get_keyframe_count(), -(-30 // keyframe_interval))
+
+    def test_record_evictsOldestKeyframes_whenOverMemoryBudget(self):
+        history: History = History(keyframe_interval=5, max_bytes=200)
+        expected: list[np.ndarray] = self.__run(history, 60)
+
+        self.assertLessEqual(history.get_size(), 200)
+        self.assertGreater(history.get_first_generation(), 0)
+        self.assertEqual(history.get_first_generation() % 5, 0)
+        self.assertEqual(history.get_last_generation(), 59)
+        np.testing.assert_array_equal(history.seek(history.get_first_generation()),
+                                      expected[history.get_first_generation()])
+        with self.assertRaises(ValueError):
+            history.seek(0)
+
+    def test_record_branchesHistory_whenRecordingPastGeneration(self):
+        history: History = History(keyframe_interval=8)
+        expected: list[np.ndarray] = self.__run(history, 20)
+        history.restore(self.board, 10)
+        self.board.change_cell_state(0, 0)
+        branch: np.ndarray = np.copy(self.board.get_current_generation())
+
+        history.record(self.board, 10)
+        self.board.next_generation()
+        history.record(self.board, 11)
+
+        self.assertEqual(history.get_last_generation(), 11)
+        np.testing.assert_array_equal(history.seek(9), expected[9])
+        np.testing.assert_array_equal(history.seek(10), branch)
+        np.testing.assert_array_equal(history.seek(11), self.board.get_current_generation())
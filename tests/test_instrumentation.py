@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.instrumentation import GenerationStatistics, Phase, Profiler, measure
+from src.packed import PackedBoard
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.sparse import SparseBoard
+
+
+@ddt
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    def test_countChanges_returnsPopulationBirthsAndDeaths(self):
+        previous: np.ndarray = np.array([[1, 1, 0], [0, 1, 0]])
+        current: np.ndarray = np.array([[1, 0, 1], [1, 1, 0]])
+
+        self.assertEqual(Profiler.count_changes(previous, current), (4, 2, 1))
+
+    @data(Board, PackedBoard, SparseBoard)
+    def test_nextGeneration_reportsBlinkerChangesToHooks_forBoardTypes(self, board_type):
+        board: Board = board_type(16, 16, self.ruleset)
+        for y in (4, 5, 6):
+            board.set_cell_state(8, y, 1)
+        profiler: Profiler = Profiler()
+        statistics: list[GenerationStatistics] = []
+        profiler.add_hook(statistics.append)
+        board.set_profiler(profiler)
+
+        board.next_generation()
+        board.next_generation()
+
+        self.assertEqual(statistics, [GenerationStatistics(1, 3, 2, 2), GenerationStatistics(2, 3, 2, 2)])
+        self.assertLessEqual({'step', 'swap'}, {phase.value for phase in profiler.get_average_seconds()})
+
+    def test_nextGeneration_matchesUnprofiledBoard_whenProfilerAttached(self):
+        generation: np.ndarray = np.random.default_rng(0).choice([0, 1], size=(20, 20))
+        board: Board = Board(20, 20, self.ruleset)
+        profiled_board: Board = Board(20, 20, self.ruleset)
+        board.set_current_generation(np.copy(generation))
+        profiled_board.set_current_generation(np.copy(generation))
+        profiled_board.set_profiler(Profiler())
+
+        for _ in range(10):
+            board.next_generation()
+            profiled_board.next_generation()
+
+        np.testing.assert_array_equal(board.get_current_generation(), profiled_board.get_current_generation())
+        self.assertEqual({phase.value for phase in profiled_board.profiler.get_average_seconds()},
+                         {'step', 'neighbours', 'rules', 'swap'})
+
+    def test_endGeneration_publishesSummaryAndResets_everySummaryInterval(self):
+        profiler: Profiler = Profiler(summary_interval=2)
+        profiler.record(Phase.RENDER, 0.002)
+        profiler.end_generation(5, 1, 0)
+        self.assertEqual(profiler.get_last_summary(), '')
+
+        profiler.record(Phase.RENDER, 0.004)
+        profiler.end_generation(6, 1, 0)
+
+        self.assertEqual(profiler.get_last_summary(),
+                         'generation 2: render 3.00 ms; population 6, births 1, deaths 0')
+        self.assertEqual(profiler.get_average_seconds(), {})
+
+    def test_measure_recordsNothing_whenProfilerMissing(self):
+        with measure(None, Phase.EVENTS):
+            pass
+
+        profiler: Profiler = Profiler()
+        with measure(profiler, Phase.EVENTS):
+            pass
+
+        self.assertEqual(list(profiler.get_average_seconds()), [Phase.EVENTS])
+
+
+if __name__ == '__main__':
+    unittest.main()
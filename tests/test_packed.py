@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.cell import CellState
+from src.engine import NumpyEngine
+from src.packed import PackedBoard
+from src.regions import RegionStatistics
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+@ddt
+class PackedBoardTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    @data((5, 5), (3, 64), (9, 65), (1, 130), (17, 1), (4, 2))
+    def test_nextGeneration_matchesDenseBoard_forBoardSizes(self, size):
+        generation: np.ndarray = np.random.default_rng(sum(size)).choice([0, 1], size=size)
+        board: Board = Board(size[0], size[1], self.ruleset)
+        packed_board: PackedBoard = PackedBoard(size[0], size[1], self.ruleset)
+        board.set_current_generation(generation)
+        packed_board.set_current_generation(generation)
+
+        for _ in range(8):
+            board.next_generation()
+            packed_board.next_generation()
+
+            np.testing.assert_array_equal(board.get_current_generation(), packed_board.get_current_generation())
+
+    def test_nextGeneration_matchesDenseBoard_whenSteppedInChunks(self):
+        generation: np.ndarray = np.random.default_rng(7).choice([0, 1], size=(10, 150))
+        board: Board = Board(10, 150, self.ruleset)
+        packed_board: PackedBoard = PackedBoard(10, 150, self.ruleset, chunk_words=9)
+        board.set_current_generation(generation)
+        packed_board.set_current_generation(generation)
+
+        for _ in range(6):
+            board.next_generation()
+            packed_board.next_generation()
+
+        np.testing.assert_array_equal(board.get_current_generation(), packed_board.get_current_generation())
+
+    @data(*[rule for rule in Rule if rule is not Rule.CUSTOM])
+    def test_nextGeneration_matchesDenseBoard_forBuiltInRules(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+        generation: np.ndarray = np.random.default_rng(rule.value).choice([0, 1], size=(11, 70))
+        board: Board = Board(11, 70, ruleset)
+        packed_board: PackedBoard = PackedBoard(11, 70, ruleset)
+        board.set_current_generation(generation)
+        packed_board.set_current_generation(generation)
+
+        for _ in range(4):
+            board.next_generation()
+            packed_board.next_generation()
+
+        np.testing.assert_array_equal(board.get_current_generation(), packed_board.get_current_generation())
+
+    def test_nextGeneration_keepsPaddingBitsDead_forBirthOnZeroNeighbours(self):
+        packed_board: PackedBoard = PackedBoard(3, 10, RulesetFactory.get_custom_ruleset("B0/S"))
+        expected: np.ndarray = np.ones((3, 10))
+
+        packed_board.next_generation()
+
+        np.testing.assert_array_equal(expected, packed_board.get_current_generation())
+        self.assertEqual(int(packed_board.words[0, 0]), (1 << 10) - 1)
+
+    @data((CellState.DEAD, CellState.ALIVE), (CellState.ALIVE, CellState.DEAD))
+    def test_changeCellState_changesCellStateToAOppositeState(self, cell_states):
+        packed_board: PackedBoard = PackedBoard(4, 100, self.ruleset)
+        packed_board.set_cell_state(2, 70, cell_states[0])
+
+        packed_board.change_cell_state(2, 70)
+
+        self.assertEqual(packed_board.get_current_generation()[2, 70], cell_states[1])
+        self.assertEqual(packed_board.get_current_generation().sum(), cell_states[1])
+
+    def test_getMemoryUsage_usesOneBitPerCell(self):
+        packed_board: PackedBoard = PackedBoard(128, 640, self.ruleset)
+        board: Board = Board(128, 640, self.ruleset)
+
+        self.assertEqual(packed_board.get_memory_usage() * 8, board.get_current_generation().nbytes)
+
+    @data(CellState.ALIVE, CellState.DEAD)
+    def test_setCellStates_setsEveryCell(self, cell_state):
+        packed_board: PackedBoard = PackedBoard(4, 100, self.ruleset)
+        board: Board = Board(4, 100, self.ruleset)
+        generation: np.ndarray = np.random.default_rng(1).choice([0, 1], size=(4, 100))
+        cells: np.ndarray = np.array([[0, 0], [0, 1], [2, 63], [2, 64], [3, 99], [3, 99]])
+        for current in (packed_board, board):
+            current.set_current_generation(generation)
+            current.set_cell_states(cells, cell_state)
+
+        np.testing.assert_array_equal(board.get_current_generation(), packed_board.get_current_generation())
+
+    def test_inheritedMethods_workWithoutDenseGeneration(self):
+        packed_board: PackedBoard = PackedBoard(5, 10, self.ruleset)
+        packed_board.set_cell_states(np.array([[2, 3], [2, 4], [2, 5]]), CellState.ALIVE)
+        packed_board.set_statistics(None)
+        packed_board.update_engine(NumpyEngine())
+
+        frames: list[np.ndarray] = [frame for _, frame in packed_board.iter_generations(2)]
+
+        self.assertEqual([int(frame.sum()) for frame in frames], [3, 3, 3])
+        self.assertEqual(packed_board.get_region(0, 0, 5, 10)[:, 4].tolist(), [0, 0, 1, 0, 0])
+        with self.assertRaises(ValueError):
+            packed_board.set_statistics(RegionStatistics(5, 10))
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board, BoardPersistence
+from src.persistence import BinaryCodec, PatternCodec, PatternCodecFactory, PatternFormat, RleCodec
+from src.rule import Rule, RulesetFactory
+
+GLIDER_RLE: str = """#N Glider
+#C A comment line.
+x = 3, y = 3, rule = B3/S23
+3o$2bo$bo!
+"""
+
+
+@ddt
+class PatternCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @data(*[(pattern_format, size) for pattern_format in PatternFormat for size in ((1, 1), (13, 7), (64, 65), (3, 200))])
+    def test_save_thenLoad_returnsSamePattern(self, format_and_size):
+        pattern_format, size = format_and_size
+        generation: np.ndarray = np.random.default_rng(sum(size)).choice([0, 1], size=size).astype(np.uint8)
+        file_name: str = os.path.join(self.directory.name, f'pattern{pattern_format.value}')
+        codec: PatternCodec = PatternCodecFactory.get_codec(pattern_format)
+
+        codec.save(file_name, generation, "B36/S23", "pattern")
+        actual, rulestring, name = codec.load(file_name)
+
+        np.testing.assert_array_equal(generation, actual)
+        self.assertEqual(rulestring, "B36/S23")
+        self.assertEqual(name, "pattern")
+
+    def test_save_thenLoad_inChunks_returnsSamePattern(self):
+        generation: np.ndarray = np.random.default_rng(0).choice([0, 1], size=(40, 30)).astype(np.uint8)
+        chunk_cells: int = PatternCodec.chunk_cells
+        PatternCodec.chunk_cells = 64
+
+        try:
+            for pattern_format in PatternFormat:
+                file_name: str = os.path.join(self.directory.name, f'chunked{pattern_format.value}')
+                codec: PatternCodec = PatternCodecFactory.get_codec(pattern_format)
+                codec.save(file_name, generation, "B3/S23", "chunked")
+
+                np.testing.assert_array_equal(generation, codec.load(file_name)[0])
+        finally:
+            PatternCodec.chunk_cells = chunk_cells
+
+    def test_load_readsRleGlider_asPylifeGlider(self):
+        file_name: str = os.path.join(self.directory.name, 'glider.rle')
+        with open(file_name, 'w') as writer:
+            writer.write(GLIDER_RLE)
+        expected, _, _ = PatternCodecFactory.get_codec(PatternFormat.PYLIFE).load('saved/glider.pylife')
+
+        actual, rulestring, name = RleCodec().load(file_name)
+
+        np.testing.assert_array_equal(expected[31:34, 20:23], actual)
+        self.assertEqual(rulestring, "B3/S23")
+        self.assertEqual(name, "Glider")
+
+    def test_save_writesStandardRle(self):
+        file_name: str = os.path.join(self.directory.name, 'glider.rle')
+        generation: np.ndarray = np.zeros((3, 5), dtype=np.uint8)
+        generation[[1, 2, 0, 1, 2], [0, 1, 2, 2, 2]] = 1
+
+        RleCodec().save(file_name, generation, "B3/S23", "Glider")
+        with open(file_name) as reader:
+            content: str = reader.read()
+
+        self.assertEqual(content, "#N Glider\nx = 3, y = 5, rule = B3/S23\nbo$2bo$3o!\n")
+
+    @data(('b3/s23', 'B3/S23'), ('23/3', 'B3/S23'), ('S23/B36', 'B36/S23'), ('B2-a/S12', 'B2-a/S12'),
+          ('s2-i34q/b3', 'B3/S2-i34q'), ('B2/S/C3', 'B2/S/C3'))
+    def test_load_normalizesRuleOrder_andKeepsTransitionLetters(self, rule_and_expected):
+        rule, expected = rule_and_expected
+        file_name: str = os.path.join(self.directory.name, 'rule.rle')
+        with open(file_name, 'w') as writer:
+            writer.write(f'x = 1, y = 1, rule = {rule}\no!\n')
+
+        _, rulestring, _ = RleCodec().load(file_name)
+
+        self.assertEqual(rulestring, expected)
+        RulesetFactory.get_custom_ruleset(rulestring)
+
+    def test_load_decodesMultiStateCells(self):
+        file_name: str = os.path.join(self.directory.name, 'states.rle')
+        with open(file_name, 'w') as writer:
+            writer.write('x = 5, y = 2, rule = B2/S/C3\n.A2B$bX.o!\n')
+
+        generation, _, _ = RleCodec().load(file_name)
+
+        np.testing.assert_array_equal(generation.T, [[0, 1, 2, 2, 0], [0, 24, 0, 1, 0]])
+
+    @data(PatternFormat.PYLIFE, PatternFormat.RLE)
+    def test_save_thenLoad_keepsDyingStates(self, pattern_format):
+        generation: np.ndarray = np.random.default_rng(2).integers(0, 5, size=(9, 6)).astype(np.uint8)
+        file_name: str = os.path.join(self.directory.name, f'states{pattern_format.value}')
+        codec: PatternCodec = PatternCodecFactory.get_codec(pattern_format)
+
+        codec.save(file_name, generation, "B2/S/C5", "states")
+
+        np.testing.assert_array_equal(codec.load(file_name)[0], generation)
+
+    def test_save_rejectsDyingStates_inBinaryFormat(self):
+        generation: np.ndarray = np.array([[0, 1, 2]], dtype=np.uint8)
+
+        with self.assertRaises(ValueError):
+            BinaryCodec().save(os.path.join(self.directory.name, 'states.lifeb'), generation, "B2/S/C3", "states")
+
+    def test_getCodecForFile_rejectsUnknownExtension(self):
+        with self.assertRaises(ValueError):
+            PatternCodecFactory.get_codec_for_file('pattern.txt')
+
+
+@ddt
+class BoardPersistenceTest(unittest.TestCase):
+    @data(*PatternFormat)
+    def test_save_thenLoad_picksFormatFromExtension(self, pattern_format):
+        board: Board = Board(1, 1, RulesetFactory.get_ruleset(Rule.MAZE))
+        BoardPersistence.load(board, 'saved/decaying_angel.pylife')
+        board.update_ruleset(RulesetFactory.get_ruleset(Rule.MAZE))
+        loaded: Board = Board(1, 1, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = os.path.join(directory, f'angel{pattern_format.value}')
+            BoardPersistence.save(board, file_name)
+            rulestring: str = BoardPersistence.load(loaded, file_name)
+
+        np.testing.assert_array_equal(board.get_current_generation(), loaded.get_current_generation())
+        self.assertEqual(rulestring, "B3/S12345")
+        self.assertEqual(loaded.ruleset.get_rulestring(), "B3/S12345")
+        self.assertEqual((loaded.n_cells_x, loaded.n_cells_y), (100, 100))
+
+    def test_load_keepsDyingStates_ofGenerationsPattern(self):
+        board: Board = Board(1, 1, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = os.path.join(directory, 'states.rle')
+            with open(file_name, 'w') as writer:
+                writer.write('x = 3, y = 1, rule = B2/S/C3\nABC!\n')
+            BoardPersistence.load(board, file_name)
+
+        np.testing.assert_array_equal(board.get_current_generation()[:, 0], [1, 2, 0])
+        self.assertEqual(board.ruleset.get_rulestring(), "B2/S/C3")
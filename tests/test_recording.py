@@ -0,0 +1,162 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+import pygame
+from ddt import ddt, data
+
+from src.board import Board
+from src.gol import BoardFactory, BoardType, main
+from src.recording import (GifWriter, NpyFrameWriter, PbmSequenceWriter, PopulationCsvWriter, Recorder,
+                           read_population_csv)
+from src.rule import Rule, Ruleset, RulesetFactory
+
+
+@ddt
+class RecordingTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.seed: np.ndarray = np.random.default_rng(3).choice([0, 1], size=(24, 17)).astype(np.uint8)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __create_board(self, board_type: BoardType = BoardType.DENSE) -> Board:
+        board: Board = BoardFactory.create_board(board_type, 24, 17, self.ruleset)
+        board.set_current_generation(self.seed)
+        return board
+
+    def __expected_generations(self, n_generations: int) -> list[np.ndarray]:
+        board: Board = self.__create_board()
+        generations: list[np.ndarray] = [np.copy(board.get_current_generation())]
+        for _ in range(n_generations):
+            board.next_generation()
+            generations.append(np.copy(board.get_current_generation()))
+        return generations
+
+    def __path(self, file_name: str) -> str:
+        return os.path.join(self.directory.name, file_name)
+
+    @data(BoardType.DENSE, BoardType.PACKED, BoardType.SPARSE)
+    def test_iterGenerations_yieldsEveryKthGeneration(self, board_type):
+        expected: list[np.ndarray] = self.__expected_generations(10)
+
+        generations: list[int] = []
+        for generation, frame in self.__create_board(board_type).iter_generations(10, every=3):
+            np.testing.assert_array_equal(frame, expected[generation])
+            generations.append(generation)
+
+        self.assertEqual(generations, [0, 3, 6, 9])
+
+    def test_iterGenerations_isLazy_andFramesAreReadOnly(self):
+        board: Board = self.__create_board()
+        frames = board.iter_generations(10 ** 9)
+
+        generation, frame = next(frames)
+
+        self.assertEqual(generation, 0)
+        self.assertFalse(frame.flags.writeable)
+        with self.assertRaises(ValueError):
+            frame[0, 0] = 1
+
+    def test_iterGenerations_packed_yieldsRowsPackedToBits(self):
+        frame: np.ndarray = next(self.__create_board().iter_generations(0, packed=True))[1]
+
+        self.assertEqual(frame.shape, (24, 3))
+        np.testing.assert_array_equal(np.unpackbits(frame, axis=1, count=17), self.seed)
+
+    def test_iterGenerations_raisesError_forNonPositiveInterval(self):
+        with self.assertRaises(ValueError):
+            next(self.__create_board().iter_generations(10, every=0))
+
+    def test_npyFrameWriter_writesMemoryMappableStack(self):
+        expected: list[np.ndarray] = self.__expected_generations(100)
+
+        with NpyFrameWriter(self.__path('frames.npy'), flush_every=16) as writer:
+            for generation, frame in self.__create_board().iter_generations(100):
+                writer.write(generation, frame)
+
+        frames: np.ndarray = NpyFrameWriter.open(self.__path('frames.npy'))
+        self.assertIsInstance(frames, np.memmap)
+        np.testing.assert_array_equal(frames, np.stack(expected))
+
+    def test_npyFrameWriter_isReadableWhileRecording(self):
+        writer: NpyFrameWriter = NpyFrameWriter(self.__path('frames.npy'), flush_every=4)
+        for generation, frame in self.__create_board().iter_generations(9):
+            writer.write(generation, frame)
+
+        self.assertEqual(np.load(self.__path('frames.npy'), mmap_mode='r').shape, (8, 24, 17))
+        writer.close()
+        self.assertEqual(np.load(self.__path('frames.npy'), mmap_mode='r').shape, (10, 24, 17))
+
+    def test_npyFrameWriter_raisesError_whenFrameShapeChanges(self):
+        with NpyFrameWriter(self.__path('frames.npy')) as writer:
+            writer.write(0, np.zeros((4, 4), dtype=np.uint8))
+            with self.assertRaises(ValueError):
+                writer.write(1, np.zeros((8, 4), dtype=np.uint8))
+
+    def test_populationCsvWriter_writesPopulationBirthsAndDeaths(self):
+        expected: list[np.ndarray] = self.__expected_generations(5)
+
+        Recorder([PopulationCsvWriter(self.__path('population.csv'))]).record(
+            self.__create_board().iter_generations(5))
+
+        rows: list[dict[str, int]] = list(read_population_csv(self.__path('population.csv')))
+        self.assertEqual([row['generation'] for row in rows], list(range(6)))
+        self.assertEqual([row['population'] for row in rows], [int(generation.sum()) for generation in expected])
+        self.assertEqual((rows[0]['births'], rows[0]['deaths']), (0, 0))
+        for row, previous, current in zip(rows[1:], expected, expected[1:]):
+            self.assertEqual(row['births'], int(np.count_nonzero(current > previous)))
+            self.assertEqual(row['deaths'], int(np.count_nonzero(current < previous)))
+
+    def test_pbmSequenceWriter_writesOneImagePerFrame(self):
+        Recorder([PbmSequenceWriter(self.__path('frames'))]).record(self.__create_board().iter_generations(4, every=2))
+
+        self.assertEqual(sorted(os.listdir(self.__path('frames'))),
+                         ['generation_00000000.pbm', 'generation_00000002.pbm', 'generation_00000004.pbm'])
+        with open(self.__path('frames/generation_00000000.pbm'), 'rb') as reader:
+            self.assertEqual(reader.readline(), b'P4\n')
+            self.assertEqual(reader.readline(), b'24 17\n')
+            bits: np.ndarray = np.unpackbits(np.frombuffer(reader.read(), dtype=np.uint8).reshape(17, 3), axis=1,
+                                             count=24)
+        np.testing.assert_array_equal(bits.T, self.seed)
+
+    @data(1, 3)
+    def test_gifWriter_writesDecodableFrames(self, scale):
+        Recorder([GifWriter(self.__path('life.gif'), scale=scale)]).record(self.__create_board().iter_generations(3))
+
+        with open(self.__path('life.gif'), 'rb') as reader:
+            content: bytes = reader.read()
+        self.assertTrue(content.startswith(b'GIF89a'))
+        self.assertTrue(content.endswith(b'\x3b'))
+        self.assertEqual(content.count(b'\x21\xf9\x04'), 4)
+
+        image: pygame.Surface = pygame.image.load(self.__path('life.gif'))
+        self.assertEqual(image.get_size(), (24 * scale, 17 * scale))
+        pixels: np.ndarray = pygame.surfarray.array3d(image)[::scale, ::scale, 0]
+        np.testing.assert_array_equal(pixels != 35, self.seed.astype(bool))
+
+    def test_recorder_usesConstantMemory_forLongRuns(self):
+        board: Board = BoardFactory.create_board(BoardType.DENSE, 64, 64, self.ruleset)
+        board.randomize()
+        sinks = [NpyFrameWriter(self.__path('frames.npy')), PopulationCsvWriter(self.__path('population.csv'))]
+
+        tracemalloc.start()
+        Recorder(sinks).record(board.iter_generations(2000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(NpyFrameWriter.open(self.__path('frames.npy')).shape, (2001, 64, 64))
+        self.assertLess(peak, 2001 * 64 * 64 // 10)
+
+    def test_main_record_streamsFramesToEverySink(self):
+        main(['record', '-x', '16', '-y', '16', '-g', '20', '-k', '5', '--npy', self.__path('frames.npy'),
+              '--csv', self.__path('population.csv'), '--gif', self.__path('life.gif')])
+
+        self.assertEqual(np.load(self.__path('frames.npy')).shape, (5, 16, 16))
+        self.assertEqual([row['generation'] for row in read_population_csv(self.__path('population.csv'))],
+                         [0, 5, 10, 15, 20])
+        self.assertGreater(os.path.getsize(self.__path('life.gif')), 0)
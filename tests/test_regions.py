@@ -0,0 +1,133 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.engine import TiledEngine
+from src.instrumentation import GenerationStatistics, Profiler
+from src.regions import RegionStatistics
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.topology import Topology
+
+
+@ddt
+class RegionStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        self.board: Board = Board(70, 45, self.ruleset)
+        self.board.set_current_generation(np.random.default_rng(4).random((70, 45)) < 0.3)
+        self.statistics: RegionStatistics = RegionStatistics(70, 45, block_size=8)
+        self.board.set_statistics(self.statistics)
+
+    def __assert_matches_board(self):
+        generation: np.ndarray = self.board.get_current_generation()
+        self.assertEqual(self.statistics.get_population(), np.count_nonzero(generation))
+        for x, y, width, height in np.random.default_rng(self.board.get_population()).integers(0, 70, (20, 4)):
+            self.assertEqual(self.statistics.get_rectangle_population(x, y, width, height),
+                             np.count_nonzero(generation[x:x + width, y:y + height]))
+
+    @data('B3/S23', 'B2/S/C3', 'B34/S34/C5')
+    def test_update_keepsCountsInSyncWithBoard(self, rulestring):
+        self.board.update_ruleset(RulesetFactory.get_custom_ruleset(rulestring))
+        self.board.set_profiler(Profiler())
+        for _ in range(30):
+            previous_generation: np.ndarray = np.copy(self.board.get_current_generation())
+            self.board.next_generation()
+            self.__assert_matches_board()
+            statistics: GenerationStatistics = self.board.profiler.last_statistics
+            self.assertEqual((statistics.population, statistics.births, statistics.deaths),
+                             Profiler.count_changes(previous_generation, self.board.get_current_generation()))
+
+    def test_update_countsFewChangedCells(self):
+        self.board.clear()
+        self.board.set_cell_states(np.array([[1, 2], [2, 3], [3, 1], [3, 2], [3, 3]]), 1)
+
+        for _ in range(100):
+            self.board.next_generation()
+            self.__assert_matches_board()
+        self.assertEqual((self.statistics.births, self.statistics.deaths), (2, 2))
+
+    def test_update_countsChangedTilesOfTiledEngine(self):
+        board: Board = Board(256, 256, self.ruleset, TiledEngine(tile_size=8))
+        board.set_cell_states(np.array([[1, 2], [2, 3], [3, 1], [3, 2], [3, 3], [140, 30], [140, 31], [140, 32]]), 1)
+        statistics: RegionStatistics = RegionStatistics(256, 256, block_size=8)
+        board.set_statistics(statistics)
+
+        for _ in range(100):
+            board.next_generation()
+            self.assertEqual(statistics.get_population(), np.count_nonzero(board.get_current_generation()))
+            self.assertEqual(statistics.get_rectangle_population(0, 0, 100, 100),
+                             np.count_nonzero(board.get_current_generation()[:100, :100]))
+        self.assertEqual((statistics.births, statistics.deaths), (4, 4))
+
+    def test_update_onlyReadsChangedTiles(self):
+        statistics: RegionStatistics = RegionStatistics(64, 64)
+        previous: np.ndarray = np.zeros((64, 64), dtype=np.uint8)
+        statistics.reset(previous)
+        current: np.ndarray = np.copy(previous)
+        current[1, 1] = current[40, 40] = 1
+        changed_tiles: np.ndarray = np.zeros((8, 8), dtype=bool)
+        changed_tiles[0, 0] = True
+
+        statistics.update(previous, current, (changed_tiles, 8))
+
+        self.assertEqual((statistics.get_population(), statistics.births), (1, 1))
+
+    @data((0, 0, 70, 45), (8, 16, 32, 16), (3, 5, 60, 30), (7, 7, 2, 30), (60, 40, 50, 50), (-5, -5, 10, 10),
+          (70, 0, 5, 5))
+    def test_getRectanglePopulation_matchesCountOfRegion(self, rectangle):
+        x, y, width, height = rectangle
+        self.board.next_generation()
+
+        expected: int = np.count_nonzero(
+            self.board.get_current_generation()[max(x, 0):max(x + width, 0), max(y, 0):max(y + height, 0)])
+        self.assertEqual(self.statistics.get_rectangle_population(x, y, width, height), expected)
+
+    def test_editing_updatesCounts(self):
+        self.board.clear()
+        self.board.change_cell_state(9, 9)
+        self.board.set_cell_state(69, 44, 1)
+        self.board.set_cell_state(69, 44, 1)
+        self.board.set_cell_states(np.array([[0, 0], [1, 1]]), 1)
+        self.board.change_cell_state(1, 1)
+
+        self.assertEqual(self.statistics.get_population(), 3)
+        self.assertEqual(self.statistics.get_rectangle_population(8, 8, 8, 8), 1)
+        self.__assert_matches_board()
+
+    def test_getDensityMap_averagesBlocks(self):
+        self.board.clear()
+        self.board.set_cell_states(np.array([[x, y] for x in range(8) for y in range(4)]), 1)
+        self.board.set_cell_state(69, 44, 1)
+
+        density: np.ndarray = self.statistics.get_density_map()
+        pooled: np.ndarray = self.statistics.get_density_map(blocks_per_pixel=4)
+
+        self.assertEqual(density.shape, (9, 6))
+        self.assertEqual(density[0, 0], 0.5)
+        self.assertEqual(density[-1, -1], 1 / (6 * 5))
+        self.assertEqual(pooled.shape, (3, 2))
+        self.assertEqual(pooled[0, 0], 32 / 32 ** 2)
+        self.assertEqual(self.statistics.get_block_counts().sum(), 33)
+
+    def test_nextGeneration_followsGrowingBoard(self):
+        self.board.set_topology(Topology.INFINITE)
+
+        for _ in range(5):
+            self.board.next_generation()
+
+        self.assertGreater(self.board.n_cells_x, 70)
+        self.__assert_matches_board()
+
+    def test_nextGeneration_reportsChangesToProfiler(self):
+        board: Board = Board(70, 45, self.ruleset)
+        board.set_current_generation(self.board.get_current_generation())
+        statistics: list = []
+        for profiled_board in (self.board, board):
+            profiled_board.set_profiler(Profiler())
+            profiled_board.profiler.add_hook(statistics.append)
+            profiled_board.next_generation()
+
+        self.assertEqual(statistics[0], statistics[1])
+        self.assertEqual(self.statistics.births, statistics[0].births)
@@ -1,9 +1,11 @@
 import unittest
 
+import numpy as np
 from ddt import ddt, data
 
 from src.cell import CellState
 from src.rule import Rule, Ruleset, RulesetFactory
+from src.topology import Topology
 
 
 @ddt
@@ -48,3 +50,113 @@ class ConwaysRulesetTest(unittest.TestCase):
         actual: CellState = self.ruleset.apply(cell_state, neighbours)
 
         self.assertEqual(actual, expected)
+
+
+@ddt
+class CompiledRulesetTest(unittest.TestCase):
+    @data(*[rule for rule in Rule if rule is not Rule.CUSTOM])
+    def test_getTransitionTable_matchesBirthAndSurvival(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+
+        transition_table: np.ndarray = ruleset.get_transition_table()
+
+        for neighbours in range(9):
+            self.assertEqual(transition_table[CellState.DEAD, neighbours], neighbours in ruleset.birth)
+            self.assertEqual(transition_table[CellState.ALIVE, neighbours], neighbours in ruleset.survival)
+
+    def test_getNeighbourhoodTable_matchesApply(self):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.DAY_AND_NIGHT)
+
+        neighbourhood_table: np.ndarray = ruleset.get_neighbourhood_table()
+
+        for neighbourhood in range(512):
+            cell_state: CellState = CellState(neighbourhood >> 4 & 1)
+            neighbours: int = bin(neighbourhood).count('1') - cell_state
+            self.assertEqual(neighbourhood_table[neighbourhood], ruleset.apply(cell_state, neighbours))
+
+    def test_getBlockTable_matchesApplyOnCentreCells(self):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        rng: np.random.Generator = np.random.default_rng(0)
+
+        block_table: np.ndarray = ruleset.get_block_table()
+
+        for block in rng.integers(0, 1 << 16, size=200):
+            cells: np.ndarray = (block >> np.arange(16) & 1).reshape(4, 4)
+            for x, y in ((1, 1), (1, 2), (2, 1), (2, 2)):
+                neighbours: int = int(cells[x - 1:x + 2, y - 1:y + 2].sum() - cells[x, y])
+                expected: CellState = ruleset.apply(CellState(cells[x, y]), neighbours)
+                self.assertEqual(block_table[block] >> (2 * (x - 1) + (y - 1)) & 1, expected)
+
+    def test_getRuleset_returnsCachedRuleset(self):
+        self.assertIs(RulesetFactory.get_ruleset(Rule.MAZE), RulesetFactory.get_ruleset(Rule.MAZE))
+        self.assertIs(RulesetFactory.get_custom_ruleset("B36/S23"), RulesetFactory.get_custom_ruleset("B36/S23"))
+
+
+@ddt
+class RuleFamilyTest(unittest.TestCase):
+    def setUp(self):
+        self.generation: np.ndarray = np.random.default_rng(1).choice([0, 1], size=(23, 17)).astype(np.uint8)
+        self.conways_life: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    @data("B3/S23/C2", "R1,C0,M0,S2..3,B3..3,NM", "R1,C2,M1,S3..4,B3..3,NM", "B3cekainyqjr/S23")
+    def test_nextGeneration_matchesConwaysLife_forEquivalentRulestrings(self, rulestring):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset(rulestring)
+        expected: np.ndarray = self.generation
+        actual: np.ndarray = self.generation
+
+        for _ in range(10):
+            expected = self.conways_life.next_generation(expected, Topology.TORUS)
+            actual = ruleset.next_generation(actual, Topology.TORUS)
+
+            np.testing.assert_array_equal(expected, actual)
+
+    def test_nextGeneration_decaysDyingCells_forGenerationsRule(self):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset("B2/S/C3")
+        generation: np.ndarray = np.zeros((6, 6), dtype=np.uint8)
+        generation[2, 2] = generation[2, 3] = CellState.ALIVE
+
+        generation = ruleset.next_generation(generation, Topology.TORUS)
+
+        self.assertFalse(ruleset.is_outer_totalistic())
+        self.assertEqual((generation[2, 2], generation[2, 3]), (2, 2))
+        self.assertEqual(np.count_nonzero(generation == CellState.ALIVE), 4)
+        generation = ruleset.next_generation(generation, Topology.TORUS)
+        self.assertEqual((generation[2, 2], generation[2, 3]), (0, 0))
+
+    def test_nextGeneration_countsRangeNeighbourhood_forLargerThanLifeRule(self):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset("R2,C3,M0,S3..7,B4..6,NM")
+        generation: np.ndarray = np.random.default_rng(2).choice([0, 1, 2], size=(13, 11)).astype(np.uint8)
+        n_cells_x, n_cells_y = generation.shape
+        expected: np.ndarray = np.zeros_like(generation)
+        for x in range(n_cells_x):
+            for y in range(n_cells_y):
+                neighbours: int = sum(generation[(x + dx) % n_cells_x, (y + dy) % n_cells_y] == CellState.ALIVE
+                                      for dx in range(-2, 3) for dy in range(-2, 3)) - (generation[x, y] == 1)
+                match generation[x, y]:
+                    case 0:
+                        expected[x, y] = 4 <= neighbours <= 6
+                    case 1:
+                        expected[x, y] = 1 if 3 <= neighbours <= 7 else 2
+                    case _:
+                        expected[x, y] = 0
+
+        np.testing.assert_array_equal(ruleset.next_generation(generation, Topology.TORUS), expected)
+        self.assertEqual(ruleset.get_range(), 2)
+
+    def test_getNeighbourhoodTable_splitsTotalsByIsotropicClass_forHenselRule(self):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset("B2-a/S12i")
+        neighbourhood_table: np.ndarray = ruleset.get_neighbourhood_table()
+
+        self.assertEqual(neighbourhood_table[0b000000011], 0)
+        self.assertEqual(neighbourhood_table[0b000000101], 1)
+        self.assertEqual(neighbourhood_table[0b000010010], 1)
+        self.assertEqual(neighbourhood_table[0b010010010], 1)
+        self.assertEqual(neighbourhood_table[0b000010011], 0)
+        dead: np.ndarray = (np.arange(512) >> 4 & 1) == CellState.DEAD
+        self.assertEqual(int(neighbourhood_table[dead].sum()), 28 - 8)
+        self.assertEqual(int(neighbourhood_table[~dead].sum()), 8 + 2)
+
+    @data("B3/S23/C1", "R0,C0,M0,S2..3,B3..3,NM", "R1,C0,M0,S2..10,B3..3,NM", "B2x/S23", "B3-/S23", "B0c/S")
+    def test_getCustomRuleset_raisesValueError_forInvalidRulestrings(self, rulestring):
+        with self.assertRaises(ValueError):
+            RulesetFactory.get_custom_ruleset(rulestring)
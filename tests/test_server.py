@@ -0,0 +1,193 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.packed import PackedBoard
+from src.rule import Rule, RulesetFactory
+from src.server import FrameCodec, MessageKind, SimulationClient, SimulationServer
+from src.simulation import Simulation
+from src.sparse import SparseBoard
+
+
+@ddt
+class FrameCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.previous: np.ndarray = np.random.default_rng(1).random((40, 30)) < 0.3
+
+    @staticmethod
+    def __decode(message: bytes, previous: np.ndarray | None) -> tuple[MessageKind, int, np.ndarray]:
+        kind: MessageKind = MessageKind(message[4])
+        generation, cells = FrameCodec.decode_frame(kind, message[5:], previous)
+        return kind, generation, cells
+
+    def test_encodeFrame_sendsKeyframe_withoutMatchingPreviousFrame(self):
+        kind, generation, cells = FrameCodecTest.__decode(FrameCodec.encode_frame(None, self.previous, 7), None)
+
+        self.assertIs(kind, MessageKind.KEYFRAME)
+        self.assertEqual(generation, 7)
+        np.testing.assert_array_equal(cells, self.previous)
+
+    @data((3, MessageKind.CHANGES), (60, MessageKind.XOR))
+    def test_encodeFrame_sendsSmallestDelta(self, n_changes_and_kind):
+        n_changes, expected_kind = n_changes_and_kind
+        current: np.ndarray = np.copy(self.previous)
+        current.flat[np.random.default_rng(2).choice(current.size, n_changes, replace=False)] ^= True
+
+        message: bytes = FrameCodec.encode_frame(self.previous, current, 8)
+        kind, generation, cells = FrameCodecTest.__decode(message, self.previous)
+
+        self.assertIs(kind, expected_kind)
+        self.assertLess(len(message), self.previous.size // 8)
+        np.testing.assert_array_equal(cells, current)
+
+    def test_decodeFrame_raisesError_forDeltaWithoutPreviousFrame(self):
+        message: bytes = FrameCodec.encode_frame(self.previous, self.previous, 1)
+
+        with self.assertRaises(ValueError):
+            FrameCodecTest.__decode(message, None)
+
+
+@ddt
+class SimulationServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.board: Board = Board(32, 24, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        for x in (4, 5, 6):
+            self.board.set_cell_state(x, 10, 1)
+        self.simulation: Simulation = Simulation(self.board, threaded=True)
+        self.simulation.start()
+        self.server: SimulationServer = SimulationServer(self.simulation, frames_per_second=100)
+        await self.server.start()
+        self.clients: list[SimulationClient] = []
+
+    async def asyncTearDown(self):
+        for client in self.clients:
+            await client.close()
+        await self.server.close()
+        self.simulation.stop()
+
+    async def __connect(self) -> SimulationClient:
+        client: SimulationClient = await SimulationClient.connect(port=self.server.get_port())
+        self.clients.append(client)
+        return client
+
+    async def test_subscribe_sendsCurrentBoardToEveryClient(self):
+        first: SimulationClient = await self.__connect()
+        second: SimulationClient = await self.__connect()
+
+        await first.send('subscribe')
+        await second.send('subscribe')
+        await first.send('step')
+        await first.send('step')
+
+        for client in (first, second):
+            cells: np.ndarray = await asyncio.wait_for(client.wait_for_generation(2), 5)
+            np.testing.assert_array_equal(cells, self.board.get_current_generation().astype(bool))
+
+    async def test_commands_changeTheServedBoard(self):
+        client: SimulationClient = await self.__connect()
+        await client.send('subscribe')
+
+        reply: dict = await client.send('toggle', x=20, y=3)
+        self.assertTrue(reply['ok'])
+        self.assertEqual(self.board.get_current_generation()[20, 3], 1)
+
+        reply = await client.send('rule', rule='day_and_night')
+        self.assertEqual(reply['rulestring'], 'B3678/S34678')
+        reply = await client.send('rule', rulestring='B36/S23')
+        self.assertEqual(reply['rulestring'], 'B36/S23')
+
+        await client.send('randomize')
+        await client.send('step')
+        await asyncio.wait_for(client.wait_for_generation(1), 5)
+        await client.send('clear')
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.board.get_population(), 0)
+        self.assertFalse(client.cells.any())
+
+    async def test_startAndStop_runTheSimulationInTheBackground(self):
+        client: SimulationClient = await self.__connect()
+        await client.send('subscribe')
+
+        reply: dict = await client.send('start')
+        self.assertFalse(reply['paused'])
+        await asyncio.wait_for(client.wait_for_generation(20), 5)
+        reply = await client.send('stop')
+
+        self.assertTrue(reply['paused'])
+        await asyncio.sleep(0.1)
+        generation: int = self.simulation.generation
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.simulation.generation, generation)
+
+    @data(PackedBoard, SparseBoard)
+    async def test_commands_clearAndRandomizeEveryBoardType(self, board_type):
+        board: Board = board_type(32, 24, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        server: SimulationServer = SimulationServer(Simulation(board))
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        client: SimulationClient = await SimulationClient.connect(port=server.get_port())
+        self.clients.append(client)
+
+        reply: dict = await client.send('randomize')
+        self.assertTrue(reply['ok'])
+        self.assertGreater(board.get_population(), 0)
+        reply = await client.send('clear')
+        self.assertTrue(reply['ok'])
+        self.assertEqual(board.get_population(), 0)
+
+    @data({'command': 'dance'}, {'command': 'toggle', 'x': 99, 'y': 0}, {'command': 'rule', 'rule': 'unknown'},
+          {'command': 'toggle'})
+    async def test_execute_repliesWithError_forInvalidCommands(self, command):
+        client: SimulationClient = await self.__connect()
+
+        reply: dict = await client.send(**command)
+
+        self.assertFalse(reply['ok'])
+        self.assertIn('error', reply)
+
+    async def test_slowClient_dropsFramesWithoutStallingOthers(self):
+        self.board.set_current_generation(np.random.default_rng(5).random((512, 512)) < 0.3)
+        slow_reader, slow_writer = await asyncio.open_connection('127.0.0.1', self.server.get_port())
+        slow_writer.transport.get_extra_info('socket').setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow_writer.write(FrameCodec.encode_message(MessageKind.COMMAND, json.dumps({'command': 'subscribe'}).encode()))
+        await slow_writer.drain()
+        fast: SimulationClient = await self.__connect()
+        await fast.send('subscribe')
+
+        await fast.send('start')
+        await asyncio.wait_for(fast.wait_for_generation(60), 20)
+        await fast.send('stop')
+
+        self.assertGreaterEqual(self.simulation.generation, 60)
+        np.testing.assert_array_equal(await asyncio.wait_for(fast.wait_for_generation(self.simulation.generation), 5),
+                                      self.board.get_current_generation().astype(bool))
+        self.assertLess(self.server.frames_sent, 2 * fast.frames_received + 4)
+        slow_writer.close()
+
+
+@unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), 'Unix sockets are not available.')
+class UnixSocketTest(unittest.IsolatedAsyncioTestCase):
+    async def test_startUnix_servesClientsOnASocketPath(self):
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        simulation: Simulation = Simulation(Board(8, 8, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)))
+        server: SimulationServer = SimulationServer(simulation)
+        await server.start_unix(os.path.join(directory.name, 'gol.sock'))
+
+        client: SimulationClient = await SimulationClient.connect_unix(os.path.join(directory.name, 'gol.sock'))
+        await client.send('subscribe')
+        await client.send('toggle', x=1, y=2)
+        await asyncio.wait_for(client.wait_for_update(), 5)
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(client.cells[1, 2])
+        self.assertEqual(np.count_nonzero(client.cells), 1)
+        await client.close()
+        await server.close()
@@ -0,0 +1,89 @@
+import time
+import unittest
+
+import numpy as np
+
+from src.board import Board
+from src.history import History
+from src.rule import Rule, RulesetFactory
+from src.simulation import RateMeter, Simulation
+
+
+class SimulationTest(unittest.TestCase):
+    def setUp(self):
+        self.board: Board = Board(16, 16, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        for y in (4, 5, 6):
+            self.board.set_cell_state(8, y, 1)
+
+    def test_update_stepsOncePerCall_whenNotThreadedAndResumed(self):
+        simulation: Simulation = Simulation(self.board)
+        simulation.update()
+        simulation.resume()
+
+        simulation.update()
+        simulation.update()
+        simulation.update()
+
+        self.assertEqual(simulation.generation, 3)
+        np.testing.assert_array_equal(self.board.get_current_generation(), simulation.get_latest_generation())
+
+    def test_getLatestGeneration_keepsFetchedBufferUntilFetchedAgain(self):
+        simulation: Simulation = Simulation(self.board)
+        fetched: np.ndarray = simulation.get_latest_generation()
+        expected: np.ndarray = np.copy(fetched)
+
+        simulation.step()
+        simulation.step()
+        simulation.step()
+
+        np.testing.assert_array_equal(expected, fetched)
+        np.testing.assert_array_equal(self.board.get_current_generation(), simulation.get_latest_generation())
+
+    def test_execute_publishesBoardChanges(self):
+        simulation: Simulation = Simulation(self.board)
+
+        simulation.execute(Board.clear)
+
+        self.assertEqual(np.count_nonzero(simulation.get_latest_generation()), 0)
+
+    def test_start_stepsInBackgroundAtTargetRate_untilPaused(self):
+        simulation: Simulation = Simulation(self.board, threaded=True, generations_per_second=200)
+        simulation.start()
+        simulation.resume()
+
+        time.sleep(0.3)
+        simulation.pause()
+        time.sleep(0.05)
+        generation: int = simulation.generation
+        time.sleep(0.1)
+        simulation.stop()
+
+        self.assertGreater(generation, 10)
+        self.assertLess(generation, 100)
+        self.assertEqual(simulation.generation, generation)
+        self.assertGreater(simulation.get_generations_per_second(), 0)
+
+    def test_stepBack_restoresRecordedGenerations(self):
+        expected: list[np.ndarray] = [np.copy(self.board.get_current_generation())]
+        simulation: Simulation = Simulation(self.board, history=History(keyframe_interval=3))
+        for _ in range(7):
+            simulation.step()
+            expected.append(np.copy(self.board.get_current_generation()))
+
+        self.assertTrue(simulation.step_back(3))
+        self.assertEqual(simulation.generation, 4)
+        np.testing.assert_array_equal(simulation.get_latest_generation(), expected[4])
+        simulation.step()
+        np.testing.assert_array_equal(self.board.get_current_generation(), expected[5])
+        self.assertFalse(simulation.step_back(6))
+        self.assertEqual(simulation.generation, 5)
+
+
+class RateMeterTest(unittest.TestCase):
+    def test_getRate_countsTicksWithinWindow(self):
+        rate_meter: RateMeter = RateMeter(window=10.0)
+
+        for _ in range(25):
+            rate_meter.tick()
+
+        self.assertEqual(rate_meter.get_rate(), 2.5)
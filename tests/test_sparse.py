@@ -0,0 +1,129 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.cell import CellState
+from src.engine import NumpyEngine
+from src.regions import RegionStatistics
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.sparse import HashLife, SparseBoard
+
+GLIDER: list[tuple[int, int]] = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+R_PENTOMINO: list[tuple[int, int]] = [(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)]
+
+
+def _live_cells(generation: np.ndarray) -> set[tuple[int, int]]:
+    return set(map(tuple, np.argwhere(generation).tolist()))
+
+
+@ddt
+class SparseBoardTest(unittest.TestCase):
+    @data(*[rule for rule in Rule if rule is not Rule.CUSTOM])
+    def test_nextGeneration_matchesDenseBoard_forBuiltInRules(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+        generation: np.ndarray = np.random.default_rng(rule.value).choice([0, 1], size=(12, 17), p=[0.7, 0.3])
+        board: Board = Board(12, 17, ruleset)
+        sparse_board: SparseBoard = SparseBoard(12, 17, ruleset)
+        board.set_current_generation(generation)
+        sparse_board.set_current_generation(generation)
+
+        for _ in range(6):
+            board.next_generation()
+            sparse_board.next_generation()
+
+            np.testing.assert_array_equal(board.get_current_generation(), sparse_board.get_current_generation())
+
+    @data((CellState.DEAD, CellState.ALIVE), (CellState.ALIVE, CellState.DEAD))
+    def test_changeCellState_changesCellStateToAOppositeState(self, cell_states):
+        sparse_board: SparseBoard = SparseBoard(5, 5, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        sparse_board.set_cell_state(4, 2, CellState.ALIVE)
+        sparse_board.set_cell_state(1, 3, cell_states[0])
+
+        sparse_board.change_cell_state(1, 3)
+
+        self.assertEqual(sparse_board.get_current_generation()[1, 3], cell_states[1])
+        self.assertEqual(sparse_board.get_population(), 1 + cell_states[1])
+
+    @data(CellState.ALIVE, CellState.DEAD)
+    def test_setCellStates_setsEveryCell(self, cell_state):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        sparse_board: SparseBoard = SparseBoard(6, 7, ruleset)
+        board: Board = Board(6, 7, ruleset)
+        generation: np.ndarray = np.random.default_rng(2).choice([0, 1], size=(6, 7))
+        cells: np.ndarray = np.array([[0, 0], [0, 1], [2, 6], [3, 0], [5, 6], [5, 6]])
+        for current in (sparse_board, board):
+            current.set_current_generation(generation)
+            current.set_cell_states(cells, cell_state)
+
+        np.testing.assert_array_equal(board.get_current_generation(), sparse_board.get_current_generation())
+        self.assertEqual(sparse_board.get_population(), board.get_population())
+
+    def test_inheritedMethods_workWithoutDenseGeneration(self):
+        sparse_board: SparseBoard = SparseBoard(5, 10, RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        sparse_board.set_cell_states(np.array([[2, 3], [2, 4], [2, 5]]), CellState.ALIVE)
+        sparse_board.set_statistics(None)
+        sparse_board.update_engine(NumpyEngine())
+
+        frames: list[np.ndarray] = [frame for _, frame in sparse_board.iter_generations(2)]
+
+        self.assertEqual([int(frame.sum()) for frame in frames], [3, 3, 3])
+        self.assertEqual(sparse_board.get_region(0, 0, 5, 10)[:, 4].tolist(), [0, 0, 1, 0, 0])
+        with self.assertRaises(ValueError):
+            sparse_board.set_statistics(RegionStatistics(5, 10))
+
+    def test_init_refusesRulesWithBirthOnZeroNeighbours(self):
+        ruleset: Ruleset = RulesetFactory.get_custom_ruleset("B03/S23")
+
+        with self.assertRaises(ValueError):
+            SparseBoard(5, 5, ruleset)
+
+
+@ddt
+class HashLifeTest(unittest.TestCase):
+    @data((GLIDER, 1), (GLIDER, 37), (GLIDER, 64), (R_PENTOMINO, 100))
+    def test_advance_matchesDenseBoard(self, pattern_and_generations):
+        pattern, generations = pattern_and_generations
+        ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+        board: Board = Board(300, 300, ruleset)
+        for x, y in pattern:
+            board.set_cell_state(x + 150, y + 150, CellState.ALIVE)
+        hash_life: HashLife = HashLife(ruleset)
+        hash_life.set_live_cells(np.argwhere(board.get_current_generation()))
+
+        hash_life.advance(generations)
+        for _ in range(generations):
+            board.next_generation()
+
+        self.assertEqual(_live_cells(board.get_current_generation()), set(map(tuple, hash_life.get_live_cells().tolist())))
+        self.assertEqual(hash_life.generation, generations)
+
+    @data(Rule.DAY_AND_NIGHT, Rule.MAZE, Rule.SEEDS, Rule.LIFE_WITHOUT_DEATH)
+    def test_advance_matchesDenseBoard_forBuiltInRules(self, rule):
+        ruleset: Ruleset = RulesetFactory.get_ruleset(rule)
+        board: Board = Board(64, 64, ruleset)
+        seed: np.ndarray = np.random.default_rng(rule.value).choice([0, 1], size=(8, 8))
+        board.get_current_generation()[28:36, 28:36] = seed
+        hash_life: HashLife = HashLife(ruleset)
+        hash_life.set_live_cells(np.argwhere(board.get_current_generation()))
+
+        hash_life.advance(12)
+        for _ in range(12):
+            board.next_generation()
+
+        self.assertEqual(_live_cells(board.get_current_generation()), set(map(tuple, hash_life.get_live_cells().tolist())))
+
+    def test_step_advancesGliderByLargePowerOfTwo(self):
+        hash_life: HashLife = HashLife(RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE))
+        hash_life.set_live_cells(np.array(GLIDER))
+        expected: set[tuple[int, int]] = {(x + 2 ** 18, y + 2 ** 18) for x, y in GLIDER}
+
+        hash_life.step(20)
+
+        self.assertEqual(set(map(tuple, hash_life.get_live_cells().tolist())), expected)
+        self.assertEqual(hash_life.generation, 2 ** 20)
+
+    def test_init_refusesRulesWithBirthOnZeroNeighbours(self):
+        with self.assertRaises(ValueError):
+            HashLife(RulesetFactory.get_custom_ruleset("B0/S"))
@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from src.board import Board
+from src.engine import Engine, EngineFactory, ParallelEngine, StepEngine
+from src.packed import PackedBoard
+from src.rule import Rule, Ruleset, RulesetFactory
+from src.topology import Halo, Topology
+
+GLIDER: list[tuple[int, int]] = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+@ddt
+class HaloTest(unittest.TestCase):
+    def setUp(self):
+        self.cell_states: np.ndarray = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+    def test_pad_wrapsBothAxes_onTorus(self):
+        padded: np.ndarray = Halo.pad(self.cell_states, Topology.TORUS)
+
+        np.testing.assert_array_equal(padded, np.pad(self.cell_states, 1, mode='wrap'))
+
+    def test_pad_flipsWrappedRows_onKleinBottle(self):
+        padded: np.ndarray = Halo.pad(self.cell_states, Topology.KLEIN_BOTTLE)
+
+        np.testing.assert_array_equal(padded[0, 1:-1], self.cell_states[-1, ::-1])
+        np.testing.assert_array_equal(padded[-1, 1:-1], self.cell_states[0, ::-1])
+        np.testing.assert_array_equal(padded[1:-1, 0], self.cell_states[:, -1])
+        self.assertEqual(padded[0, 0], self.cell_states[-1, 0])
+
+    @data(Topology.BOUNDED, Topology.INFINITE)
+    def test_pad_surroundsWithDeadCells_onBoundedBoards(self, topology):
+        padded: np.ndarray = Halo.pad(self.cell_states, topology)
+
+        np.testing.assert_array_equal(padded, np.pad(self.cell_states, 1))
+
+
+@ddt
+class TopologyTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleset: Ruleset = RulesetFactory.get_ruleset(Rule.CONWAYS_LIFE)
+
+    @data(*[(engine, topology) for engine in Engine if engine is not Engine.LOOP
+            for topology in (Topology.TORUS, Topology.BOUNDED, Topology.KLEIN_BOTTLE)])
+    def test_nextGeneration_matchesLoopEngine_forTopologies(self, engine_and_topology):
+        engine, topology = engine_and_topology
+        loop_engine: StepEngine = EngineFactory.get_engine(Engine.LOOP)
+        step_engine: StepEngine = ParallelEngine(workers=2) if engine is Engine.PARALLEL else EngineFactory.get_engine(
+            engine)
+        loop_engine.topology = topology
+        step_engine.topology = topology
+        expected: np.ndarray = np.random.default_rng(engine.value).choice([0, 1], size=(19, 13)).astype(np.uint8)
+        actual: np.ndarray = np.copy(expected)
+
+        for _ in range(12):
+            expected = loop_engine.next_generation(expected, self.ruleset)
+            actual = step_engine.next_generation(actual, self.ruleset)
+
+            np.testing.assert_array_equal(expected, actual)
+        if isinstance(step_engine, ParallelEngine):
+            step_engine.close()
+
+    def test_nextGeneration_glidesIntoBorder_onBoundedBoard(self):
+        board: Board = Board(8, 8, self.ruleset, topology=Topology.BOUNDED)
+        for x, y in GLIDER:
+            board.set_cell_state(x + 4, y + 4, 1)
+
+        for _ in range(40):
+            board.next_generation()
+
+        self.assertEqual(board.get_population(), 4)
+
+    def test_nextGeneration_mirrorsGliderAcrossSeam_onKleinBottle(self):
+        torus: Board = Board(10, 10, self.ruleset)
+        klein_bottle: Board = Board(10, 10, self.ruleset, topology=Topology.KLEIN_BOTTLE)
+        for x, y in GLIDER:
+            torus.set_cell_state(x + 5, y + 2, 1)
+            klein_bottle.set_cell_state(x + 5, y + 2, 1)
+
+        for _ in range(20):
+            torus.next_generation()
+            klein_bottle.next_generation()
+
+        self.assertEqual(klein_bottle.get_population(), 5)
+        np.testing.assert_array_equal(klein_bottle.get_current_generation()[5:],
+                                      torus.get_current_generation()[5:, ::-1])
+
+    def test_nextGeneration_doublesBoard_whenGliderReachesEdgeOfInfiniteBoard(self):
+        board: Board = Board(8, 8, self.ruleset, topology=Topology.INFINITE)
+        for x, y in GLIDER:
+            board.set_cell_state(x + 2, y + 2, 1)
+
+        for _ in range(200):
+            board.next_generation()
+
+        self.assertEqual(board.get_population(), 5)
+        self.assertEqual((board.n_cells_x, board.n_cells_y), (128, 128))
+        live_x, live_y = np.nonzero(board.get_current_generation())
+        self.assertEqual(int(live_x.min()) + board.origin_x, 52)
+        self.assertEqual(int(live_y.min()) + board.origin_y, 52)
+
+    def test_setTopology_rejectsNonTorus_onPackedBoard(self):
+        board: PackedBoard = PackedBoard(8, 8, self.ruleset)
+
+        with self.assertRaises(ValueError):
+            board.set_topology(Topology.BOUNDED)
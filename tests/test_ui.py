@@ -0,0 +1,37 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from ddt import ddt, data  # noqa: E402
+
+from src.ui import Button, ButtonFactory, Color, PygameRenderer, RendererSettings, RenderMode  # noqa: E402
+
+
+@ddt
+class PygameRendererTest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen: pygame.Surface = pygame.display.set_mode((200, 240))
+        self.buttons: list[Button] = [ButtonFactory(240).create_button(10, 120, Color.MUTED, "Start", Color.TEXT)]
+
+    def tearDown(self):
+        pygame.quit()
+
+    def __render(self, render_mode: RenderMode, current_generation: np.ndarray) -> np.ndarray:
+        settings: RendererSettings = RendererSettings(240, 200, 20, 24, 10, 10, render_mode)
+        renderer: PygameRenderer = PygameRenderer(self.screen, settings, self.buttons)
+        renderer.draw(current_generation)
+        renderer.draw(current_generation)
+        return pygame.surfarray.array3d(self.screen)
+
+    @data(0, 1, 2)
+    def test_draw_surfarrayMode_matchesRectsMode(self, seed):
+        current_generation: np.ndarray = np.random.default_rng(seed).choice([0.0, 1.0], size=(20, 24))
+
+        expected: np.ndarray = self.__render(RenderMode.RECTS, current_generation)
+        actual: np.ndarray = self.__render(RenderMode.SURFARRAY, current_generation)
+
+        np.testing.assert_array_equal(expected, actual)